@@ -15,8 +15,11 @@ from src.config.settings import (
     WINDOW_HEIGHT,
     WINDOW_MIN_WIDTH,
     WINDOW_MIN_HEIGHT,
-    COLOR_LIGHT
+    COLOR_LIGHT,
+    DATABASE_PATH
 )
+from src.data.autosave import AutosaveManager, AutosaveResult
+from src.data.database.character_db import CharacterDatabase
 from src.models.character.base import Character, AbilityScores
 from src.ui.components.character_header import CharacterHeaderWidget
 from src.ui.components.ability_scores import AbilityScoresWidget
@@ -31,6 +34,9 @@ class DnDCharacterSheetApp:
     def __init__(self):
         self.root = tk.Tk()
         self.character = self.create_default_character()
+        self.database = CharacterDatabase(DATABASE_PATH)
+        self.autosave = AutosaveManager(self.database.save_character)
+        self.autosave.attach(self.root, self.on_autosave_complete)
         self.setup_window()
         self.setup_ui()
     
@@ -66,6 +72,7 @@ class DnDCharacterSheetApp:
         self.root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}")
         self.root.minsize(WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT)
         self.root.configure(bg=COLOR_LIGHT)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
         # Center the window
         self.root.update_idletasks()
@@ -140,13 +147,27 @@ class DnDCharacterSheetApp:
     def on_character_change(self, field: str, value):
         """Handle character field changes"""
         print(f"Character {field} changed to: {value}")
-        # Here you could save to database, validate, etc.
+        self.autosave.schedule(self.character)
     
     def on_ability_score_change(self, ability, score):
         """Handle ability score changes"""
         print(f"Ability {ability.value} changed to: {score}")
+        self.autosave.schedule(self.character)
         # Here you could update dependent values like saves, skills, etc.
     
+    def on_autosave_complete(self, result: AutosaveResult):
+        """Handle a finished background save (runs on the Tk main loop)"""
+        if result.succeeded:
+            print(f"Saved {result.character.name}")
+        else:
+            print(f"Autosave failed for {result.character.name}: {result.error}")
+    
+    def on_close(self):
+        """Save pending changes and close the application"""
+        self.autosave.stop()
+        self.database.close()
+        self.root.destroy()
+    
     def run(self):
         """Start the application"""
         self.root.mainloop()
@@ -17,6 +17,31 @@ CONFIG_DIR = PROJECT_ROOT / "config"
 
 # Database settings
 DATABASE_PATH = DATA_DIR / "characters.db"
+DATABASE_READER_POOL_SIZE = 4
+
+# Autosave settings
+AUTOSAVE_DELAY = 1.0  # Seconds without changes before saving
+AUTOSAVE_POLL_INTERVAL_MS = 100
+
+# Event journal settings
+JOURNAL_FSYNC_BATCH = 32  # Events appended between fsyncs
+JOURNAL_COMPACT_THRESHOLD = 1000  # Unsnapshotted events before compacting
+JOURNAL_COMPACT_INTERVAL = 30.0  # Seconds between background compaction checks
+
+# Roster import/export settings
+ROSTER_IMPORT_CHUNK_SIZE = 500  # Lines parsed per worker batch
+
+# Backup settings
+BACKUP_DIR = DATA_DIR / "backups"
+BACKUP_COMPRESSION_LEVEL = 6  # zlib level used for stored chunks
+
+# Catalog loader settings
+CATALOG_CACHE_DIR = DATA_DIR / "cache"  # Compiled catalogs, keyed by source content hash
+
+# Homebrew settings
+HOMEBREW_DIR = DATA_DIR / "homebrew"  # items/ and spells/ subdirectories
+HOMEBREW_POLL_INTERVAL = 2.0  # Seconds between checks for edited files
+HOMEBREW_APPLY_INTERVAL_MS = 250  # How often the main loop applies parsed homebrew edits
 
 # UI settings
 WINDOW_WIDTH = 1200
@@ -48,6 +73,7 @@ MAX_LEVEL = 20
 ABILITY_SCORE_MIN = 1
 ABILITY_SCORE_MAX = 30
 ABILITY_SCORE_DEFAULT = 10
+MAX_ATTUNED_ITEMS = 3
 
 # Create directories if they don't exist
 DATA_DIR.mkdir(exist_ok=True)
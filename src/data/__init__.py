@@ -0,0 +1 @@
+# Data management package
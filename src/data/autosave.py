@@ -0,0 +1,172 @@
+"""
+Debounced background autosave
+
+Widgets report every keystroke, so saving on each change would stall the Tk
+main loop. Scheduling a save only marks the character as changed. Once it
+has been quiet for the autosave delay, the main loop's polling (attach)
+snapshots it to a dictionary, so the worker never reads a character the main
+loop is still editing. A worker thread rebuilds a detached copy from the
+snapshot and saves it. Completed saves are queued and handed back to the main
+loop by the same polling with root.after, since Tk must not be called from
+other threads.
+"""
+import queue
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..config.settings import AUTOSAVE_DELAY, AUTOSAVE_POLL_INTERVAL_MS
+from ..models.character.base import Character
+from .serializers import CharacterSerializer
+
+@dataclass
+class AutosaveResult:
+    """Outcome of one background save"""
+    character: Character
+    result: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+class AutosaveManager:
+    """Coalesce character changes and save them on a worker thread"""
+
+    def __init__(self, save: Callable[[Character], Any], delay: float = AUTOSAVE_DELAY):
+        """
+        Args:
+            save: Saves one character atomically, e.g. CharacterDatabase.save_character
+            delay: Seconds without changes before a character is saved
+        """
+        self._save = save
+        self.delay = delay
+        # id(character) -> (deadline, character), not yet snapshotted
+        self._dirty: Dict[int, Tuple[float, Character]] = {}
+        # id(character) -> (character, snapshot) waiting for the worker
+        self._ready: Dict[int, Tuple[Character, Dict[str, Any]]] = {}
+        self._saving = 0
+        self._stopping = False
+        self._condition = threading.Condition()
+        self._completed: "queue.Queue[AutosaveResult]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+        self._thread.start()
+
+    def schedule(self, character: Character) -> None:
+        """
+        Mark a character as changed, restarting its delay
+
+        Call this from the thread that edits the character. The id is
+        assigned here, if missing, so the saved copy and the live character
+        share one database row.
+        """
+        if character.id is None:
+            character.id = uuid.uuid4().hex
+        with self._condition:
+            self._dirty[id(character)] = (time.monotonic() + self.delay, character)
+
+    def snapshot_due(self, everything: bool = False) -> int:
+        """
+        Snapshot the characters whose delay has expired and hand them to the worker
+
+        Call this from the thread that edits the characters; attach does so
+        on every poll.
+
+        Args:
+            everything: Snapshot every changed character, expired or not
+
+        Returns:
+            Number of characters snapshotted
+        """
+        now = time.monotonic()
+        with self._condition:
+            due = [(key, character) for key, (deadline, character) in self._dirty.items()
+                   if everything or deadline <= now]
+            for key, _ in due:
+                del self._dirty[key]
+        if not due:
+            return 0
+
+        snapshots = [(key, character, CharacterSerializer.to_dict(character)) for key, character in due]
+        with self._condition:
+            for key, character, snapshot in snapshots:
+                self._ready[key] = (character, snapshot)
+            self._condition.notify_all()
+        return len(snapshots)
+
+    def pending_count(self) -> int:
+        """Number of characters waiting to be saved"""
+        with self._condition:
+            return len(self._dirty) + len(self._ready) + self._saving
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Save all changed characters now and wait for them to finish
+
+        Call this from the thread that edits the characters.
+
+        Returns:
+            False if the timeout expired first
+        """
+        self.snapshot_due(everything=True)
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._ready and not self._saving, timeout)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Save changed characters and stop the worker thread"""
+        self.snapshot_due(everything=True)
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+
+    def drain_completed(self) -> List[AutosaveResult]:
+        """Collect finished saves without blocking"""
+        results = []
+        while True:
+            try:
+                results.append(self._completed.get_nowait())
+            except queue.Empty:
+                return results
+
+    def attach(self, root, on_complete: Callable[[AutosaveResult], None],
+               interval_ms: int = AUTOSAVE_POLL_INTERVAL_MS) -> None:
+        """Snapshot quiet characters and deliver finished saves to on_complete from the Tk main loop"""
+        def poll():
+            self.snapshot_due()
+            for result in self.drain_completed():
+                on_complete(result)
+            if not self._stopping:
+                root.after(interval_ms, poll)
+
+        root.after(interval_ms, poll)
+
+    def _next_ready(self) -> Optional[Tuple[Character, Dict[str, Any]]]:
+        """Wait for the next snapshot to save; None means stop"""
+        with self._condition:
+            self._condition.wait_for(lambda: self._ready or self._stopping)
+            if not self._ready:
+                return None
+            key = next(iter(self._ready))
+            self._saving += 1
+            return self._ready.pop(key)
+
+    def _run(self) -> None:
+        while True:
+            ready = self._next_ready()
+            if ready is None:
+                return
+
+            character, snapshot = ready
+            try:
+                copy = CharacterSerializer.from_dict(snapshot)
+                outcome = AutosaveResult(character, result=self._save(copy))
+            except Exception as exc:
+                outcome = AutosaveResult(character, error=exc)
+            self._completed.put(outcome)
+
+            with self._condition:
+                self._saving -= 1
+                self._condition.notify_all()
@@ -0,0 +1,210 @@
+"""
+Content-addressed, deduplicated character backups
+
+Each character is split into chunks: one for the character sheet itself and
+one per distinct piece of equipment it carries. Chunks are named by their
+BLAKE2 digest and stored once, zlib-compressed, so characters that did not
+change and catalog items shared by many characters cost nothing in later
+backups. A backup is a manifest listing each character's chunks, plus an
+offset index that lets a single character be restored without reading the
+rest of the manifest.
+
+Layout of a backup directory:
+    chunks/<ab>/<digest>          compressed chunk, sharded by digest prefix
+    manifests/<backup>.jsonl      one line per character
+    manifests/<backup>.index      character id -> byte offset in the manifest
+"""
+import hashlib
+import json
+import os
+import uuid
+import zlib
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+from ..config.settings import BACKUP_COMPRESSION_LEVEL, BACKUP_DIR
+from ..models.character.base import Character
+from .journal import write_json_atomic
+from .serializers import CharacterSerializer
+
+DIGEST_SIZE = 20
+
+def chunk_digest(data: bytes) -> str:
+    """Content address of a chunk"""
+    return hashlib.blake2b(data, digest_size=DIGEST_SIZE).hexdigest()
+
+def _canonical(data: Any) -> bytes:
+    """Serialize so equal data always produces equal bytes"""
+    return json.dumps(data, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+@dataclass
+class BackupInfo:
+    """Summary of a completed backup"""
+    backup_id: str
+    characters: int = 0
+    chunks_written: int = 0
+    chunks_reused: int = 0
+    bytes_written: int = 0
+
+class BackupStore:
+    """Deduplicating store of character backups"""
+
+    def __init__(self, directory: Path = BACKUP_DIR,
+                 compression_level: int = BACKUP_COMPRESSION_LEVEL):
+        """
+        Args:
+            directory: Directory holding chunks and manifests
+            compression_level: zlib level for newly written chunks
+        """
+        self.directory = Path(directory)
+        self.chunk_dir = self.directory / "chunks"
+        self.manifest_dir = self.directory / "manifests"
+        self.chunk_dir.mkdir(parents=True, exist_ok=True)
+        self.manifest_dir.mkdir(parents=True, exist_ok=True)
+        self.compression_level = compression_level
+        # Digests known to be on disk, so repeated chunks skip the stat call
+        self._stored: Set[str] = set()
+
+    def _chunk_path(self, digest: str) -> Path:
+        return self.chunk_dir / digest[:2] / digest
+
+    def _manifest_path(self, backup_id: str) -> Path:
+        return self.manifest_dir / f"{backup_id}.jsonl"
+
+    def _index_path(self, backup_id: str) -> Path:
+        return self.manifest_dir / f"{backup_id}.index"
+
+    def _put_chunk(self, data: bytes, info: BackupInfo) -> str:
+        """Store a chunk unless it already exists, return its digest"""
+        digest = chunk_digest(data)
+        if digest in self._stored:
+            info.chunks_reused += 1
+            return digest
+
+        path = self._chunk_path(digest)
+        if path.exists():
+            info.chunks_reused += 1
+        else:
+            compressed = zlib.compress(data, self.compression_level)
+            path.parent.mkdir(exist_ok=True)
+            temp_path = path.with_name(f"{digest}.{uuid.uuid4().hex}.tmp")
+            temp_path.write_bytes(compressed)
+            os.replace(temp_path, path)
+            info.chunks_written += 1
+            info.bytes_written += len(compressed)
+        self._stored.add(digest)
+        return digest
+
+    def _get_chunk(self, digest: str) -> Any:
+        """Read, verify and decode a chunk"""
+        try:
+            data = zlib.decompress(self._chunk_path(digest).read_bytes())
+        except FileNotFoundError:
+            raise ValueError(f"Backup chunk {digest} is missing") from None
+        if chunk_digest(data) != digest:
+            raise ValueError(f"Backup chunk {digest} is corrupt")
+        return json.loads(data)
+
+    def _store_character(self, character: Character, info: BackupInfo) -> List[Any]:
+        """Chunk a character and return its manifest entry"""
+        data = CharacterSerializer.to_dict(character)
+        equipment = []
+        for item in data["inventory"]["items"]:
+            digest = self._put_chunk(_canonical(item["equipment"]), info)
+            item["equipment"] = digest
+            equipment.append(digest)
+        core = self._put_chunk(_canonical(data), info)
+        return [character.id, character.name, core, equipment]
+
+    def backup(self, characters: Iterable[Character], backup_id: Optional[str] = None) -> BackupInfo:
+        """
+        Back up characters, writing only chunks not already stored
+
+        Characters without an id are assigned one, as when saving them.
+
+        Args:
+            characters: Characters to back up, consumed one at a time
+            backup_id: Name of the backup; defaults to the current time
+        """
+        backup_id = backup_id or datetime.now().strftime("%Y%m%dT%H%M%S%f")
+        manifest_path = self._manifest_path(backup_id)
+        if manifest_path.exists():
+            raise ValueError(f"Backup {backup_id} already exists")
+
+        info = BackupInfo(backup_id)
+        offsets: Dict[str, int] = {}
+        temp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+        with open(temp_path, "wb") as manifest:
+            for character in characters:
+                if character.id is None:
+                    character.id = uuid.uuid4().hex
+                offsets[character.id] = manifest.tell()
+                manifest.write(_canonical(self._store_character(character, info)) + b"\n")
+                info.characters += 1
+            manifest.flush()
+            os.fsync(manifest.fileno())
+
+        # The index goes first: a manifest is only listed once both exist
+        write_json_atomic(self._index_path(backup_id), offsets)
+        os.replace(temp_path, manifest_path)
+        return info
+
+    def list_backups(self) -> List[str]:
+        """Backup ids, oldest first"""
+        return sorted(path.stem for path in self.manifest_dir.glob("*.jsonl"))
+
+    def _restore_entry(self, entry: List[Any], equipment_cache: Dict[str, Any]) -> Character:
+        _, _, core, _ = entry
+        data = self._get_chunk(core)
+        for item in data["inventory"]["items"]:
+            digest = item["equipment"]
+            if digest not in equipment_cache:
+                equipment_cache[digest] = self._get_chunk(digest)
+            item["equipment"] = equipment_cache[digest]
+        return CharacterSerializer.from_dict(data)
+
+    def iter_restore(self, backup_id: str) -> Iterator[Character]:
+        """Restore every character in a backup, one at a time"""
+        equipment_cache: Dict[str, Any] = {}
+        with open(self._manifest_path(backup_id), "rb") as manifest:
+            for line in manifest:
+                yield self._restore_entry(json.loads(line), equipment_cache)
+
+    def restore_character(self, backup_id: str, character_id: str) -> Character:
+        """Restore a single character, reading only its manifest line"""
+        offsets = json.loads(self._index_path(backup_id).read_text(encoding="utf-8"))
+        if character_id not in offsets:
+            raise KeyError(f"Character {character_id} is not in backup {backup_id}")
+        with open(self._manifest_path(backup_id), "rb") as manifest:
+            manifest.seek(offsets[character_id])
+            return self._restore_entry(json.loads(manifest.readline()), {})
+
+    def delete_backup(self, backup_id: str) -> None:
+        """Remove a backup's manifest; run collect_garbage to free its chunks"""
+        self._manifest_path(backup_id).unlink()
+        self._index_path(backup_id).unlink(missing_ok=True)
+
+    def collect_garbage(self) -> int:
+        """
+        Delete chunks no longer referenced by any backup
+
+        Returns:
+            Number of chunks deleted
+        """
+        referenced: Set[str] = set()
+        for backup_id in self.list_backups():
+            with open(self._manifest_path(backup_id), "rb") as manifest:
+                for line in manifest:
+                    _, _, core, equipment = json.loads(line)
+                    referenced.add(core)
+                    referenced.update(equipment)
+
+        removed = 0
+        for path in self.chunk_dir.glob("*/*"):
+            if path.name not in referenced:
+                path.unlink()
+                self._stored.discard(path.name)
+                removed += 1
+        return removed
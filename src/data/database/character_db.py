@@ -0,0 +1,381 @@
+"""
+SQLite character storage
+
+The database runs in WAL mode so readers never wait for the writer. Reads go
+through a small pool of read-only connections; all writes are funnelled
+through a single writer thread that owns the only writable connection.
+"""
+import json
+import queue
+import sqlite3
+import threading
+import uuid
+from concurrent.futures import Future
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from ...config.settings import DATABASE_PATH, DATABASE_READER_POOL_SIZE
+from ...models.character.base import Character
+from ..serializers import CharacterSerializer, inventory_from_dict
+from .lazy import CharacterSummary, LazyCharacter
+from .migrations import apply_migrations
+from .queries import CharacterQuery
+
+# Number of prepared statements kept per connection
+STATEMENT_CACHE_SIZE = 128
+
+UPSERT_CHARACTER = """
+    INSERT INTO characters (id, name, character_class, race, background, level,
+                            experience_points, data, spells, notes)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        name = excluded.name,
+        character_class = excluded.character_class,
+        race = excluded.race,
+        background = excluded.background,
+        level = excluded.level,
+        experience_points = excluded.experience_points,
+        data = excluded.data,
+        spells = excluded.spells,
+        notes = excluded.notes,
+        updated_at = CURRENT_TIMESTAMP
+"""
+DELETE_INVENTORY = "DELETE FROM inventory_items WHERE character_id = ?"
+INSERT_INVENTORY = """
+    INSERT INTO inventory_items (character_id, position, name, equipment_type,
+                                 quantity, equipped_slot, attuned, data)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+DELETE_SEARCH = "DELETE FROM characters_fts WHERE rowid = (SELECT rowid FROM characters WHERE id = ?)"
+INSERT_SEARCH = """
+    INSERT INTO characters_fts (rowid, notes, class_features, racial_traits)
+    SELECT rowid, ?, ?, ? FROM characters WHERE id = ?
+"""
+DELETE_CHARACTER = "DELETE FROM characters WHERE id = ?"
+SELECT_CHARACTER = "SELECT data, spells, notes FROM characters WHERE id = ?"
+SELECT_INVENTORY = "SELECT data FROM inventory_items WHERE character_id = ? ORDER BY position"
+SELECT_SUMMARIES = "SELECT id, name, character_class, race, level FROM characters ORDER BY name"
+SELECT_SECTION = {
+    "core": "SELECT data FROM characters WHERE id = ?",
+    "inventory": "SELECT json_extract(data, '$.inventory') FROM characters WHERE id = ?",
+    "spells": "SELECT spells FROM characters WHERE id = ?",
+    "notes": "SELECT notes FROM characters WHERE id = ?",
+}
+
+def _connect(db_path: Path, read_only: bool = False) -> sqlite3.Connection:
+    """Open a connection configured for WAL access"""
+    conn = sqlite3.connect(
+        str(db_path),
+        check_same_thread=False,
+        cached_statements=STATEMENT_CACHE_SIZE,
+    )
+    conn.execute("PRAGMA busy_timeout = 5000")
+    if read_only:
+        conn.execute("PRAGMA query_only = ON")
+    else:
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+    return conn
+
+class CharacterRows(NamedTuple):
+    """Rows written for one character"""
+    character: tuple
+    items: List[tuple]
+    search: tuple
+
+def character_rows(character: Character) -> CharacterRows:
+    """
+    Split a character into its characters, inventory_items and search rows
+
+    The character must already have an id.
+    """
+    data = CharacterSerializer.to_dict(character)
+    inventory = data.pop("inventory")
+    items = inventory.pop("items")
+    spells = {
+        "spell_slots": data.pop("spell_slots"),
+        "spell_slot_maximums": data.pop("spell_slot_maximums"),
+        "spells_known": data.pop("spells_known"),
+    }
+    notes = data.pop("notes")
+    data["inventory"] = inventory  # Currency and carrying capacity stay with the core sheet
+
+    row = (
+        character.id,
+        character.name,
+        character.character_class,
+        character.race,
+        character.background,
+        character.progression.level,
+        character.progression.experience_points,
+        json.dumps(data),
+        json.dumps(spells),
+        notes,
+    )
+    item_rows = [
+        (
+            character.id,
+            position,
+            item["equipment"]["name"],
+            item["equipment"]["type"],
+            item["quantity"],
+            item["equipped_slot"],
+            int(item["attuned"]),
+            json.dumps(item),
+        )
+        for position, item in enumerate(items)
+    ]
+    search_row = (
+        notes,
+        "\n".join(character.class_features),
+        "\n".join(character.racial_traits),
+        character.id,
+    )
+    return CharacterRows(row, item_rows, search_row)
+
+def assemble_character(data_json: str, spells_json: str, notes: str, item_rows: Sequence[str]) -> Character:
+    """Rebuild a character from its stored sections"""
+    data = json.loads(data_json)
+    data.update(json.loads(spells_json))
+    data["notes"] = notes
+    data.setdefault("inventory", {})["items"] = [json.loads(item) for item in item_rows]
+    return CharacterSerializer.from_dict(data)
+
+class ConnectionPool:
+    """Fixed-size pool of read-only connections"""
+
+    def __init__(self, db_path: Path, size: int = DATABASE_READER_POOL_SIZE):
+        self.db_path = db_path
+        self.size = size
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection, waiting if all are in use"""
+        conn = self._acquire()
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+    def _acquire(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if self._created < self.size:
+                self._created += 1
+                return _connect(self.db_path, read_only=True)
+        return self._idle.get()
+
+    def close(self) -> None:
+        """Close all idle connections"""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+class WriterThread(threading.Thread):
+    """Single thread that owns the writable connection"""
+
+    def __init__(self, conn: sqlite3.Connection):
+        super().__init__(name="character-db-writer", daemon=True)
+        self._conn = conn
+        self._tasks: "queue.Queue[Optional[Tuple[Future, Callable, tuple]]]" = queue.Queue()
+
+    def submit(self, fn: Callable[..., Any], *args) -> Future:
+        """
+        Queue fn(conn, *args) to run in its own transaction
+
+        Returns:
+            Future resolved with fn's result once the transaction commits
+        """
+        future: Future = Future()
+        self._tasks.put((future, fn, args))
+        return future
+
+    def run(self) -> None:
+        while True:
+            task = self._tasks.get()
+            if task is None:
+                break
+
+            future, fn, args = task
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                with self._conn:
+                    result = fn(self._conn, *args)
+            except BaseException as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+        self._conn.close()
+
+    def stop(self) -> None:
+        """Finish queued writes and stop the thread"""
+        self._tasks.put(None)
+        self.join()
+
+class CharacterDatabase:
+    """SQLite database for character storage"""
+
+    def __init__(self, db_path: Path = DATABASE_PATH, pool_size: int = DATABASE_READER_POOL_SIZE):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        conn = _connect(self.db_path)
+        self.schema_version = apply_migrations(conn)
+
+        self._writer = WriterThread(conn)
+        self._writer.start()
+        self._readers = ConnectionPool(self.db_path, pool_size)
+        self._closed = False
+
+    def __enter__(self) -> "CharacterDatabase":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Flush pending writes and close all connections"""
+        if self._closed:
+            return
+        self._closed = True
+        self._writer.stop()
+        self._readers.close()
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection"""
+        with self._readers.connection() as conn:
+            yield conn
+
+    def submit_write(self, fn: Callable[..., Any], *args) -> Future:
+        """Run fn(conn, *args) in a transaction on the writer thread"""
+        return self._writer.submit(fn, *args)
+
+    def save_character(self, character: Character) -> str:
+        """Save character to database, return character ID"""
+        return self.save_characters([character])[0]
+
+    def save_characters(self, characters: Sequence[Character]) -> List[str]:
+        """Save many characters in a single transaction, return their IDs"""
+        for character in characters:
+            if character.id is None:
+                character.id = uuid.uuid4().hex
+
+        rows = [character_rows(character) for character in characters]
+        self.submit_write(_write_characters, rows).result()
+        return [character.id for character in characters]
+
+    def load_character(self, character_id: str) -> Optional[Character]:
+        """Load character from database"""
+        with self.reader() as conn:
+            row = conn.execute(SELECT_CHARACTER, (character_id,)).fetchone()
+            if row is None:
+                return None
+            items = [item for (item,) in conn.execute(SELECT_INVENTORY, (character_id,))]
+        return assemble_character(row[0], row[1], row[2], items)
+
+    def list_characters(self) -> List[Dict[str, Any]]:
+        """List all characters with basic info"""
+        with self.reader() as conn:
+            conn.row_factory = sqlite3.Row
+            try:
+                cursor = conn.execute("""
+                    SELECT id, name, character_class, race, level, updated_at
+                    FROM characters
+                    ORDER BY name
+                """)
+                return [dict(row) for row in cursor.fetchall()]
+            finally:
+                conn.row_factory = None
+
+    def list_summaries(self) -> List[CharacterSummary]:
+        """List summary records for all characters, ordered by name"""
+        with self.reader() as conn:
+            return list(map(CharacterSummary._make, conn.execute(SELECT_SUMMARIES)))
+
+    def open_lazy(self, character_id: str) -> Optional[LazyCharacter]:
+        """Get a character whose sections load on first access"""
+        with self.reader() as conn:
+            row = conn.execute(
+                "SELECT id, name, character_class, race, level FROM characters WHERE id = ?",
+                (character_id,),
+            ).fetchone()
+        return LazyCharacter(self, CharacterSummary._make(row)) if row else None
+
+    def lazy_characters(self) -> List[LazyCharacter]:
+        """Get lazy characters for every saved character, ordered by name"""
+        return [LazyCharacter(self, summary) for summary in self.list_summaries()]
+
+    def load_section(self, character_id: str, section: str) -> Any:
+        """
+        Load one section of a saved character
+
+        Args:
+            section: "core", "inventory", "spells" or "notes"
+        """
+        with self.reader() as conn:
+            row = conn.execute(SELECT_SECTION[section], (character_id,)).fetchone()
+            if row is None:
+                raise KeyError(f"No character with id {character_id}")
+            if section == "inventory":
+                items = [json.loads(item) for (item,) in conn.execute(SELECT_INVENTORY, (character_id,))]
+
+        if section == "core":
+            data = json.loads(row[0])
+            data.pop("inventory", None)
+            return CharacterSerializer.from_dict(data)
+        if section == "inventory":
+            data = json.loads(row[0]) if row[0] else {}
+            data["items"] = items
+            return inventory_from_dict(data)
+        if section == "spells":
+            spells = json.loads(row[0])
+            maximums = spells.get("spell_slot_maximums")  # None in rows saved before it was stored
+            return {
+                "spell_slots": {int(level): count for level, count in spells.get("spell_slots", {}).items()},
+                "spell_slot_maximums": None if maximums is None else {int(level): count for level, count in maximums.items()},
+                "spells_known": spells.get("spells_known", []),
+            }
+        return row[0]
+
+    def delete_character(self, character_id: str) -> bool:
+        """Delete character from database"""
+        return self.submit_write(_delete_character, character_id).result()
+
+    def find_characters(self, query: CharacterQuery) -> List[Dict[str, Any]]:
+        """Find characters matching a query"""
+        sql, params = query.to_sql()
+        with self.reader() as conn:
+            cursor = conn.execute(sql, params)
+            columns = [column[0] for column in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def explain_query(self, query: CharacterQuery) -> List[str]:
+        """Get the EXPLAIN QUERY PLAN details for a query"""
+        sql, params = query.to_sql()
+        with self.reader() as conn:
+            return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+
+def _write_characters(conn: sqlite3.Connection, rows: List[CharacterRows]) -> None:
+    ids = [(entry.character[0],) for entry in rows]
+    conn.executemany(DELETE_SEARCH, ids)
+    conn.executemany(UPSERT_CHARACTER, [entry.character for entry in rows])
+    conn.executemany(DELETE_INVENTORY, ids)
+    conn.executemany(INSERT_INVENTORY, [item for entry in rows for item in entry.items])
+    conn.executemany(INSERT_SEARCH, [entry.search for entry in rows])
+
+def _delete_character(conn: sqlite3.Connection, character_id: str) -> bool:
+    conn.execute(DELETE_SEARCH, (character_id,))
+    conn.execute(DELETE_INVENTORY, (character_id,))
+    return conn.execute(DELETE_CHARACTER, (character_id,)).rowcount > 0
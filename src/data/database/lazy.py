@@ -0,0 +1,105 @@
+"""
+Summary records and lazily hydrated characters
+
+Listing screens only need a few columns, so they work with CharacterSummary
+rows read straight from a covering index. A LazyCharacter starts from a
+summary and loads each section of the sheet (core stats, inventory, spells,
+notes) from the database the first time it is accessed.
+"""
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from ...models.character.base import Character
+from ...models.equipment.inventory import Inventory
+
+class CharacterSummary(NamedTuple):
+    """Lightweight listing record for a saved character"""
+    id: str
+    name: str
+    character_class: str
+    race: str
+    level: int
+
+class LazyCharacter:
+    """Character whose sections are loaded on first access"""
+
+    def __init__(self, database, summary: CharacterSummary):
+        """
+        Args:
+            database: CharacterDatabase the character is stored in
+            summary: Summary record identifying the character
+        """
+        self.summary = summary
+        self._database = database
+        self._sections: Dict[str, Any] = {}
+
+    def __repr__(self) -> str:
+        return f"LazyCharacter({self.summary!r}, loaded={sorted(self._sections)})"
+
+    def _section(self, name: str) -> Any:
+        if name not in self._sections:
+            self._sections[name] = self._database.load_section(self.summary.id, name)
+        return self._sections[name]
+
+    def is_loaded(self, section: str) -> bool:
+        """Check whether a section has been read from the database"""
+        return section in self._sections
+
+    @property
+    def id(self) -> str:
+        return self.summary.id
+
+    @property
+    def name(self) -> str:
+        return self.summary.name
+
+    @property
+    def character_class(self) -> str:
+        return self.summary.character_class
+
+    @property
+    def race(self) -> str:
+        return self.summary.race
+
+    @property
+    def level(self) -> int:
+        return self.summary.level
+
+    @property
+    def core(self) -> Character:
+        """Character with stats and features, without inventory, spells or notes"""
+        return self._section("core")
+
+    @property
+    def inventory(self) -> Inventory:
+        return self._section("inventory")
+
+    @property
+    def spell_slots(self) -> Dict[int, int]:
+        return self._section("spells")["spell_slots"]
+
+    @property
+    def spell_slot_maximums(self) -> Optional[Dict[int, int]]:
+        return self._section("spells")["spell_slot_maximums"]
+
+    @property
+    def spells_known(self) -> List[str]:
+        return self._section("spells")["spells_known"]
+
+    @property
+    def notes(self) -> str:
+        return self._section("notes")
+
+    def __getattr__(self, name: str) -> Any:
+        # Anything not covered above (ability_scores, vitals, ...) lives in the core section
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.core, name)
+
+    def hydrate(self) -> Character:
+        """Load every section and return the complete character"""
+        character = self.core
+        character.inventory = self.inventory
+        character.load_spell_slots(self.spell_slots, self.spell_slot_maximums)
+        character.spells_known = self.spells_known
+        character.notes = self.notes
+        return character
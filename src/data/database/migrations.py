@@ -0,0 +1,94 @@
+"""
+Database schema migrations
+
+Each migration runs once, in order, and is recorded in PRAGMA user_version.
+"""
+import sqlite3
+from typing import List, Tuple
+
+def _lines(path: str) -> str:
+    """SQL for a JSON list of strings joined by newlines, the way saves index them"""
+    return (f"(SELECT coalesce(group_concat(value, char(10)), '') FROM "
+            f"(SELECT value FROM json_each(data, '{path}') ORDER BY key))")
+
+# Fill the search index from the saved characters, in the same format as INSERT_SEARCH
+_INDEX_EXISTING_CHARACTERS = f"""
+        INSERT INTO characters_fts (rowid, notes, class_features, racial_traits)
+        SELECT rowid, notes, {_lines('$.class_features')}, {_lines('$.racial_traits')}
+        FROM characters;
+"""
+
+MIGRATIONS: List[Tuple[int, str]] = [
+    (1, """
+        CREATE TABLE characters (
+            id TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            character_class TEXT NOT NULL DEFAULT '',
+            race TEXT NOT NULL DEFAULT '',
+            background TEXT NOT NULL DEFAULT '',
+            level INTEGER NOT NULL DEFAULT 1,
+            experience_points INTEGER NOT NULL DEFAULT 0,
+            data TEXT NOT NULL,                  -- Core sheet as JSON
+            spells TEXT NOT NULL DEFAULT '{}',   -- Spell slots and spells known as JSON
+            notes TEXT NOT NULL DEFAULT '',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+
+        CREATE TABLE inventory_items (
+            character_id TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            equipment_type TEXT NOT NULL,
+            quantity INTEGER NOT NULL DEFAULT 1,
+            equipped_slot TEXT,
+            attuned INTEGER NOT NULL DEFAULT 0,
+            data TEXT NOT NULL,                  -- Full inventory entry as JSON
+            PRIMARY KEY (character_id, position)
+        ) WITHOUT ROWID;
+
+        CREATE INDEX idx_characters_name ON characters(name);
+    """),
+    (2, """
+        CREATE INDEX idx_characters_class_level ON characters(character_class, level);
+        CREATE INDEX idx_characters_race_level ON characters(race, level);
+        CREATE INDEX idx_characters_level ON characters(level);
+        CREATE INDEX idx_inventory_items_name ON inventory_items(name, character_id);
+
+        -- Full-text search; rowid matches characters.rowid
+        CREATE VIRTUAL TABLE characters_fts USING fts5(notes, class_features, racial_traits);
+    """ + _INDEX_EXISTING_CHARACTERS),
+    (3, """
+        -- Covering index so character listings never touch the table
+        CREATE INDEX idx_characters_summary ON characters(name, id, character_class, race, level);
+        DROP INDEX idx_characters_name;
+    """),
+    (4, """
+        -- Rows backfilled by migration 2 held JSON arrays; rebuild them as saves do
+        DELETE FROM characters_fts;
+    """ + _INDEX_EXISTING_CHARACTERS),
+]
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    """Get the schema version of a database"""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+def apply_migrations(conn: sqlite3.Connection) -> int:
+    """
+    Apply pending migrations
+
+    Returns:
+        The schema version after migrating
+    """
+    version = schema_version(conn)
+    for target, script in MIGRATIONS:
+        if target <= version:
+            continue
+        # executescript commits any open transaction, so wrap each step explicitly
+        try:
+            conn.executescript(f"BEGIN;\n{script}\nPRAGMA user_version = {target};\nCOMMIT;")
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+        version = target
+    return version
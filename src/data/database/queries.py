@@ -0,0 +1,67 @@
+"""
+Query builder for saved characters
+"""
+import re
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple
+
+SUMMARY_COLUMNS = "c.id, c.name, c.character_class, c.race, c.level"
+
+def fts_match_expression(text: str) -> str:
+    """
+    Turn free text into an FTS5 match expression
+
+    Each word becomes a quoted term and all terms must match, so user input
+    can never be parsed as FTS5 query syntax. Text without any words gives
+    an empty expression, which must not be passed to MATCH.
+    """
+    terms = re.findall(r"\w+", text)
+    return " AND ".join(f'"{term}"' for term in terms)
+
+@dataclass
+class CharacterQuery:
+    """Filters for finding saved characters; unset filters are ignored"""
+    character_class: Optional[str] = None
+    race: Optional[str] = None
+    min_level: Optional[int] = None
+    max_level: Optional[int] = None
+    item_name: Optional[str] = None  # Characters owning an item with this name
+    text: Optional[str] = None  # Words searched in notes, class features and racial traits
+    limit: Optional[int] = None
+
+    def to_sql(self) -> Tuple[str, List[Any]]:
+        """Build the SQL statement and its parameters"""
+        clauses: List[str] = []
+        params: List[Any] = []
+
+        if self.character_class is not None:
+            clauses.append("c.character_class = ?")
+            params.append(self.character_class)
+        if self.race is not None:
+            clauses.append("c.race = ?")
+            params.append(self.race)
+        if self.min_level is not None:
+            clauses.append("c.level >= ?")
+            params.append(self.min_level)
+        if self.max_level is not None:
+            clauses.append("c.level <= ?")
+            params.append(self.max_level)
+        if self.item_name is not None:
+            clauses.append("c.id IN (SELECT character_id FROM inventory_items WHERE name = ?)")
+            params.append(self.item_name)
+        if self.text:
+            expression = fts_match_expression(self.text)
+            if expression:
+                clauses.append("c.rowid IN (SELECT rowid FROM characters_fts WHERE characters_fts MATCH ?)")
+                params.append(expression)
+            else:
+                clauses.append("0")  # Only punctuation: no word can match
+
+        sql = f"SELECT {SUMMARY_COLUMNS} FROM characters AS c"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY c.name"
+        if self.limit is not None:
+            sql += " LIMIT ?"
+            params.append(self.limit)
+        return sql, params
@@ -0,0 +1,338 @@
+"""
+Append-only event journal with snapshot compaction
+
+Every mutation of an attached character is appended to the campaign journal
+as one JSON line. Loading a character reads its latest snapshot and replays
+the journal events recorded after it. Compaction writes fresh snapshots and
+truncates the journal, which keeps replay time bounded.
+
+Layout of a campaign directory:
+    journal.jsonl            appended events
+    state.json               last sequence number at compaction
+    snapshots/<id>.json      latest snapshot of each character
+"""
+import json
+import os
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..config.settings import (
+    JOURNAL_COMPACT_INTERVAL,
+    JOURNAL_COMPACT_THRESHOLD,
+    JOURNAL_FSYNC_BATCH,
+)
+from ..models.character.base import Character
+from ..models.equipment.inventory import EquipmentSlot, Inventory, InventoryItem
+from .serializers import CharacterSerializer, equipment_from_dict, equipment_to_dict
+
+def write_json_atomic(path: Path, data: Any) -> None:
+    """Write JSON to a temporary file, fsync it, then rename over path"""
+    temp_path = path.with_name(path.name + ".tmp")
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+def _find_item(inventory: Inventory, item_id: str) -> InventoryItem:
+    item = inventory.get_item(item_id)
+    if item is None:
+        raise KeyError(f"No inventory item with id {item_id}")
+    return item
+
+def _find_container(inventory: Inventory, payload: Dict[str, Any]) -> Optional[InventoryItem]:
+    container_id = payload.get("container_id")
+    return _find_item(inventory, container_id) if container_id else None
+
+def _apply_item_added(character: Character, payload: Dict[str, Any]) -> None:
+    inventory = character.inventory
+    inventory.add_item(equipment_from_dict(payload["equipment"]), payload["quantity"],
+                       item_id=payload["item_id"], container=_find_container(inventory, payload))
+
+def _apply_item_moved(character: Character, payload: Dict[str, Any]) -> None:
+    inventory = character.inventory
+    inventory.move_item(_find_item(inventory, payload["item_id"]), _find_container(inventory, payload),
+                        payload["quantity"], item_id=payload["moved_id"])
+
+def _apply_item_removed(character: Character, payload: Dict[str, Any]) -> None:
+    item = _find_item(character.inventory, payload["item_id"])
+    character.inventory.remove_item(item, payload["quantity"])
+
+def _apply_item_quantity_changed(character: Character, payload: Dict[str, Any]) -> None:
+    item = _find_item(character.inventory, payload["item_id"])
+    character.inventory.set_quantity(item, payload["quantity"])
+
+def _apply_item_equipped(character: Character, payload: Dict[str, Any]) -> None:
+    item = _find_item(character.inventory, payload["item_id"])
+    character.inventory.equip_item(item, EquipmentSlot(payload["slot"]))
+
+def _apply_item_unequipped(character: Character, payload: Dict[str, Any]) -> None:
+    character.inventory.unequip_item(_find_item(character.inventory, payload["item_id"]))
+
+def _apply_item_attuned(character: Character, payload: Dict[str, Any]) -> None:
+    character.inventory.attune_item(_find_item(character.inventory, payload["item_id"]))
+
+def _apply_item_unattuned(character: Character, payload: Dict[str, Any]) -> None:
+    character.inventory.unattune_item(_find_item(character.inventory, payload["item_id"]))
+
+def _apply_item_charges_changed(character: Character, payload: Dict[str, Any]) -> None:
+    _find_item(character.inventory, payload["item_id"]).charges = payload["charges"]
+
+def _apply_currency_changed(character: Character, payload: Dict[str, Any]) -> None:
+    for name, count in payload["coins"].items():
+        setattr(character.inventory.currency, name, count)
+
+def _apply_transaction_committed(character: Character, payload: Dict[str, Any]) -> None:
+    for event, step in payload["events"]:
+        EVENT_APPLIERS[event](character, step)
+
+def _apply_hit_points_changed(character: Character, payload: Dict[str, Any]) -> None:
+    character.vitals.hit_points = payload["hit_points"]
+    character.vitals.temporary_hit_points = payload["temporary_hit_points"]
+
+def _apply_spell_slot_spent(character: Character, payload: Dict[str, Any]) -> None:
+    character.spend_spell_slot(payload["level"])
+
+def _apply_spell_slots_restored(character: Character, payload: Dict[str, Any]) -> None:
+    # JSON object keys are strings
+    character.load_spell_slots({int(level): count for level, count in payload["spell_slots"].items()})
+
+# Replays a recorded event onto a character
+EVENT_APPLIERS: Dict[str, Callable[[Character, Dict[str, Any]], None]] = {
+    "item_added": _apply_item_added,
+    "item_removed": _apply_item_removed,
+    "item_quantity_changed": _apply_item_quantity_changed,
+    "item_moved": _apply_item_moved,
+    "item_equipped": _apply_item_equipped,
+    "item_unequipped": _apply_item_unequipped,
+    "item_attuned": _apply_item_attuned,
+    "item_unattuned": _apply_item_unattuned,
+    "item_charges_changed": _apply_item_charges_changed,
+    "currency_changed": _apply_currency_changed,
+    "transaction_committed": _apply_transaction_committed,
+    "hit_points_changed": _apply_hit_points_changed,
+    "spell_slot_spent": _apply_spell_slot_spent,
+    "spell_slots_restored": _apply_spell_slots_restored,
+}
+
+def _record_payload(event: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a model change event into the JSON payload stored in the journal"""
+    if event == "transaction_committed":
+        return {"events": [[step, _record_payload(step, step_payload)]
+                           for step, step_payload in payload["events"] if step in EVENT_APPLIERS]}
+    if event.startswith("item_"):
+        record = {"item_id": payload["item"].item_id}
+        if event == "item_added":
+            record["equipment"] = equipment_to_dict(payload["equipment"])
+        if "quantity" in payload:
+            record["quantity"] = payload["quantity"]
+        if "charges" in payload:
+            record["charges"] = payload["charges"]
+        if payload.get("slot") is not None and event == "item_equipped":
+            record["slot"] = payload["slot"].value
+        if payload.get("container") is not None:
+            record["container_id"] = payload["container"].item_id
+        if event == "item_moved":
+            record["moved_id"] = payload["moved"].item_id
+        return record
+    return dict(payload)
+
+class EventJournal:
+    """Per-campaign journal of character mutations"""
+
+    def __init__(self, directory: Path,
+                 fsync_batch: int = JOURNAL_FSYNC_BATCH,
+                 compact_threshold: int = JOURNAL_COMPACT_THRESHOLD):
+        """
+        Args:
+            directory: Campaign directory holding the journal and snapshots
+            fsync_batch: Number of appended events between fsyncs
+            compact_threshold: Number of unsnapshotted events that triggers compaction
+        """
+        self.directory = Path(directory)
+        self.snapshot_dir = self.directory / "snapshots"
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        self.journal_path = self.directory / "journal.jsonl"
+        self.state_path = self.directory / "state.json"
+        self.fsync_batch = fsync_batch
+        self.compact_threshold = compact_threshold
+
+        self._lock = threading.RLock()
+        self._tails: Dict[str, List[Tuple[int, str, Dict[str, Any]]]] = {}
+        self._snapshot_seqs: Dict[str, int] = {}
+        self._listeners: Dict[int, List[Tuple[Any, Callable]]] = {}
+        self._unsynced = 0
+        self._seq = 0
+        if self.state_path.exists():
+            self._seq = json.loads(self.state_path.read_text(encoding="utf-8"))["seq"]
+        self._read_journal()
+        self._file = open(self.journal_path, "a", encoding="utf-8")
+
+        self._compactor: Optional[threading.Thread] = None
+        self._stop_compactor = threading.Event()
+
+    def _read_journal(self) -> None:
+        """Rebuild the per-character tails from the journal on disk"""
+        if not self.journal_path.exists():
+            return
+        valid_length = 0
+        with open(self.journal_path, "rb") as f:
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("incomplete line")
+                    seq, character_id, event, payload = json.loads(line)
+                except ValueError:
+                    break  # Torn write at the end of the journal
+                valid_length += len(line)
+                self._seq = max(self._seq, seq)
+                if seq > self._snapshot_seq(character_id):
+                    self._tails.setdefault(character_id, []).append((seq, event, payload))
+
+        # Drop a torn final write so new events start on a clean line
+        if valid_length < self.journal_path.stat().st_size:
+            os.truncate(self.journal_path, valid_length)
+
+    def _snapshot_path(self, character_id: str) -> Path:
+        return self.snapshot_dir / f"{character_id}.json"
+
+    def _snapshot_seq(self, character_id: str) -> int:
+        if character_id not in self._snapshot_seqs:
+            path = self._snapshot_path(character_id)
+            seq = -1
+            if path.exists():
+                seq = json.loads(path.read_text(encoding="utf-8"))["seq"]
+            self._snapshot_seqs[character_id] = seq
+        return self._snapshot_seqs[character_id]
+
+    @property
+    def tail_length(self) -> int:
+        """Number of events not yet folded into snapshots"""
+        with self._lock:
+            return sum(len(tail) for tail in self._tails.values())
+
+    def append(self, character_id: str, event: str, payload: Dict[str, Any]) -> int:
+        """
+        Append an event to the journal
+
+        Returns:
+            The event's sequence number
+        """
+        with self._lock:
+            self._seq += 1
+            self._file.write(json.dumps([self._seq, character_id, event, payload]) + "\n")
+            self._file.flush()
+            self._tails.setdefault(character_id, []).append((self._seq, event, payload))
+
+            self._unsynced += 1
+            if self._unsynced >= self.fsync_batch:
+                self._sync_locked()
+            return self._seq
+
+    def sync(self) -> None:
+        """Force appended events to disk"""
+        with self._lock:
+            self._sync_locked()
+
+    def _sync_locked(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+
+    def attach(self, character: Character) -> None:
+        """Record every subsequent mutation of a character"""
+        if character.id is None:
+            character.id = uuid.uuid4().hex
+
+        with self._lock:
+            if self._snapshot_seq(character.id) < 0:
+                self._write_snapshot(character)
+
+        def record(event: str, payload: Dict[str, Any]) -> None:
+            if event in EVENT_APPLIERS:
+                self.append(character.id, event, _record_payload(event, payload))
+
+        sources = [character, character.vitals, character.inventory]
+        for source in sources:
+            source.add_listener(record)
+        self._listeners[id(character)] = [(source, record) for source in sources]
+
+    def detach(self, character: Character) -> None:
+        """Stop recording a character's mutations"""
+        for source, listener in self._listeners.pop(id(character), []):
+            source.remove_listener(listener)
+
+    def load(self, character_id: str) -> Character:
+        """Load a character from its latest snapshot plus the journal tail"""
+        with self._lock:
+            path = self._snapshot_path(character_id)
+            if not path.exists():
+                raise KeyError(f"No snapshot for character {character_id}")
+            snapshot = json.loads(path.read_text(encoding="utf-8"))
+            tail = list(self._tails.get(character_id, []))
+
+        character = CharacterSerializer.from_dict(snapshot["character"])
+        for _, event, payload in tail:
+            EVENT_APPLIERS[event](character, payload)
+        return character
+
+    def _write_snapshot(self, character: Character) -> None:
+        seq = self._tails[character.id][-1][0] if self._tails.get(character.id) else self._seq
+        write_json_atomic(
+            self._snapshot_path(character.id),
+            {"seq": seq, "character": CharacterSerializer.to_dict(character)},
+        )
+        self._snapshot_seqs[character.id] = seq
+        self._tails.pop(character.id, None)
+
+    def needs_compaction(self) -> bool:
+        return self.tail_length >= self.compact_threshold
+
+    def compact(self) -> int:
+        """
+        Fold all journal tails into snapshots and truncate the journal
+
+        Returns:
+            Number of characters snapshotted
+        """
+        with self._lock:
+            character_ids = [character_id for character_id, tail in self._tails.items() if tail]
+            for character_id in character_ids:
+                self._write_snapshot(self.load(character_id))
+
+            self._sync_locked()
+            write_json_atomic(self.state_path, {"seq": self._seq})
+            self._file.close()
+            self._file = open(self.journal_path, "w", encoding="utf-8")
+            return len(character_ids)
+
+    def start_compactor(self, interval: float = JOURNAL_COMPACT_INTERVAL) -> None:
+        """Compact in a background thread whenever the threshold is reached"""
+        if self._compactor is not None:
+            return
+
+        def run():
+            while not self._stop_compactor.wait(interval):
+                if self.needs_compaction():
+                    self.compact()
+
+        self._compactor = threading.Thread(target=run, name="journal-compactor", daemon=True)
+        self._compactor.start()
+
+    def close(self) -> None:
+        """Detach all characters, stop compaction, sync and close the journal"""
+        for sources in self._listeners.values():
+            for source, listener in sources:
+                source.remove_listener(listener)
+        self._listeners.clear()
+
+        if self._compactor is not None:
+            self._stop_compactor.set()
+            self._compactor.join()
+            self._compactor = None
+        with self._lock:
+            if not self._file.closed:
+                self._sync_locked()
+                self._file.close()
@@ -0,0 +1 @@
+# Catalog loaders package
\ No newline at end of file
@@ -0,0 +1,205 @@
+"""
+Data-driven equipment catalog loading
+
+Catalog files list equipment in the format written by equipment_to_dict:
+- JSON: a list of items, or an object with an "items" list;
+- CSV: one item per row, with a "kind" column naming the equipment class.
+  List fields hold ";"-separated values, booleans are true/false, and any
+  cell starting with "[" or "{" is read as JSON.
+
+Every item is validated before anything is built, and all problems are
+reported together. Built items are pickled to a cache file named by hashes
+of the source's full path and of its contents, so later loads of an
+unchanged file skip parsing and validation; editing the file changes the
+hash and forces a rebuild.
+"""
+import csv
+import glob
+import hashlib
+import io
+import json
+import os
+import pickle
+import uuid
+from dataclasses import fields
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union, get_args, get_origin
+
+from ...config.settings import CATALOG_CACHE_DIR
+from ...models.equipment.base import Equipment
+from ...models.equipment.catalog import EquipmentCatalog
+from ..serializers import EQUIPMENT_CLASSES, equipment_from_dict, field_type_hints
+
+# Bump when the model classes change shape, so old caches are not unpickled
+CACHE_FORMAT = 2
+
+class CatalogValidationError(ValueError):
+    """Raised when a catalog file contains invalid items"""
+
+    def __init__(self, source: Path, problems: List[str]):
+        self.source = source
+        self.problems = problems
+        super().__init__(f"{source}: {len(problems)} invalid entries\n" + "\n".join(problems))
+
+def _parse_cell(hint: Any, text: str) -> Any:
+    """Convert a CSV cell to a JSON-compatible value for the field's type"""
+    text = text.strip()
+    if text[:1] in ("[", "{"):
+        return json.loads(text)
+    if get_origin(hint) is Union:
+        hint = next(arg for arg in get_args(hint) if arg is not type(None))
+    if get_origin(hint) in (list, List):
+        return [part.strip() for part in text.split(";") if part.strip()]
+    if hint is bool:
+        if text.lower() not in ("true", "false", "yes", "no", "1", "0"):
+            raise ValueError(f"expected true or false, got {text!r}")
+        return text.lower() in ("true", "yes", "1")
+    return text
+
+def _read_csv(text: str) -> List[Dict[str, Any]]:
+    entries = []
+    for row in csv.DictReader(io.StringIO(text)):
+        kind = (row.pop("kind", None) or Equipment.__name__).strip()
+        hints = field_type_hints(EQUIPMENT_CLASSES[kind]) if kind in EQUIPMENT_CLASSES else {}
+        entry: Dict[str, Any] = {"kind": kind}
+        for name, cell in row.items():
+            if cell is None or not cell.strip():
+                continue
+            try:
+                entry[name] = _parse_cell(hints.get(name, Any), cell)
+            except ValueError as exc:
+                entry.setdefault("_errors", []).append(f"{name}: {exc}")
+        entries.append(entry)
+    return entries
+
+def _read_json(text: str) -> List[Dict[str, Any]]:
+    data = json.loads(text)
+    if isinstance(data, dict):
+        data = data.get("items", [])
+    if not isinstance(data, list):
+        raise ValueError("expected a list of items")
+    return data
+
+def _validate_entry(entry: Any) -> Tuple[Optional[Equipment], List[str]]:
+    """Build one item, returning it with any problems found"""
+    if not isinstance(entry, dict):
+        return None, ["entry is not an object"]
+    problems = list(entry.get("_errors", []))
+    entry = {key: value for key, value in entry.items() if key != "_errors"}
+
+    kind = entry.get("kind", Equipment.__name__)
+    cls = EQUIPMENT_CLASSES.get(kind)
+    if cls is None:
+        return None, problems + [f"unknown kind {kind!r}"]
+    if not entry.get("name"):
+        problems.append("missing name")
+    known = {f.name for f in fields(cls)} | {"kind"}
+    unknown = sorted(set(entry) - known)
+    if unknown:
+        problems.append(f"unknown fields {', '.join(unknown)}")
+    for name in ("weight", "value"):
+        try:
+            if float(entry.get(name, 0)) < 0:
+                problems.append(f"{name} must not be negative")
+        except (TypeError, ValueError):
+            problems.append(f"{name} must be a number")
+    if problems:
+        return None, problems
+
+    try:
+        return equipment_from_dict(entry), []
+    except (TypeError, ValueError, KeyError) as exc:
+        return None, [str(exc)]
+
+def parse_catalog(path: Path, text: str) -> List[Equipment]:
+    """
+    Parse and validate catalog file contents
+
+    Raises:
+        CatalogValidationError: If any entry is invalid
+    """
+    try:
+        entries = _read_csv(text) if path.suffix.lower() == ".csv" else _read_json(text)
+    except (ValueError, csv.Error) as exc:
+        raise CatalogValidationError(path, [f"unreadable: {exc}"]) from exc
+
+    items: List[Equipment] = []
+    problems: List[str] = []
+    seen: Dict[str, int] = {}
+    for number, entry in enumerate(entries, 1):
+        equipment, entry_problems = _validate_entry(entry)
+        label = entry.get("name") if isinstance(entry, dict) and entry.get("name") else f"#{number}"
+        if equipment is not None and equipment.name in seen:
+            entry_problems = [f"duplicate of item {seen[equipment.name]}"]
+        problems.extend(f"item {number} ({label}): {problem}" for problem in entry_problems)
+        if equipment is not None and not entry_problems:
+            seen[equipment.name] = number
+            items.append(equipment)
+    if problems:
+        raise CatalogValidationError(path, problems)
+    return items
+
+class CatalogLoader:
+    """Load catalog files through a content-addressed build cache"""
+
+    def __init__(self, cache_dir: Optional[Path] = CATALOG_CACHE_DIR):
+        """
+        Args:
+            cache_dir: Directory for compiled catalogs; None disables caching
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_hits = 0
+        self.builds = 0
+
+    @staticmethod
+    def _cache_prefix(path: Path) -> str:
+        # Same-named files in different folders must not share cache entries
+        source = hashlib.blake2b(str(path.resolve()).encode(), digest_size=8)
+        return f"{path.name}.{source.hexdigest()}"
+
+    def _cache_path(self, path: Path, content: bytes) -> Path:
+        digest = hashlib.blake2b(content, digest_size=16)
+        digest.update(f"{CACHE_FORMAT}".encode())
+        return self.cache_dir / f"{self._cache_prefix(path)}.{digest.hexdigest()}.pickle"
+
+    def load(self, path: Path) -> List[Equipment]:
+        """Load the items in a catalog file, using the cache when it is current"""
+        path = Path(path)
+        content = path.read_bytes()
+        cache_path = self._cache_path(path, content) if self.cache_dir is not None else None
+
+        if cache_path is not None and cache_path.exists():
+            try:
+                with open(cache_path, "rb") as f:
+                    items = pickle.load(f)
+                self.cache_hits += 1
+                return items
+            except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError,
+                    TypeError, ValueError):
+                pass  # Unreadable cache; rebuild below
+
+        items = parse_catalog(path, content.decode("utf-8-sig"))
+        self.builds += 1
+        if cache_path is not None:
+            self._write_cache(path, cache_path, items)
+        return items
+
+    def _write_cache(self, path: Path, cache_path: Path, items: List[Equipment]) -> None:
+        temp_path = cache_path.with_name(f"{cache_path.name}.{uuid.uuid4().hex}.tmp")
+        with open(temp_path, "wb") as f:
+            pickle.dump(items, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+        # Drop caches built from earlier versions of the same file
+        for stale in self.cache_dir.glob(f"{glob.escape(self._cache_prefix(path))}.*.pickle"):
+            if stale != cache_path:
+                stale.unlink(missing_ok=True)
+
+    def load_catalog(self, *paths: Path) -> EquipmentCatalog:
+        """Build one catalog from several files; later files win on duplicate names"""
+        catalog = EquipmentCatalog()
+        for path in paths:
+            for equipment in self.load(path):
+                catalog.add(equipment)
+        return catalog
@@ -0,0 +1,349 @@
+"""
+Live-reloaded homebrew content
+
+DMs edit homebrew files while a session is running. The registry polls the
+homebrew directory, re-parses only files whose contents changed, and swaps
+the affected entries into the equipment catalog, search index and spell
+compendium. Inventories being watched are rebound to the new templates and
+emit "templates_changed", which lets anything derived from those items
+refresh.
+
+None of those structures are thread-safe, so changes are only applied on
+the thread that owns them. The background watcher just reads and parses
+files; its results are queued and applied from the Tk main loop by polling
+with root.after, the same way autosave results are delivered.
+
+When several files define the same name, the most recently changed file
+wins; removing it brings back the version from another file, or else the
+catalog entry it shadowed.
+
+Layout of the homebrew directory:
+    items/*.json, items/*.csv    equipment, in the catalog loader formats
+    spells/*.json                a list of spells per file
+"""
+import hashlib
+import json
+import queue
+import threading
+import weakref
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ...config.settings import HOMEBREW_APPLY_INTERVAL_MS, HOMEBREW_DIR, HOMEBREW_POLL_INTERVAL
+from ...models.equipment.base import Equipment
+from ...models.equipment.catalog import EquipmentCatalog
+from ...models.equipment.inventory import Inventory
+from ...models.equipment.search import NameSearchIndex
+from ...models.events import ChangeNotifier
+from ...models.spells.base import Spell
+from ...models.spells.compendium import SpellCompendium
+from ..serializers import decode_dataclass
+from .catalog_loader import CatalogLoader, CatalogValidationError
+
+ITEM_SUFFIXES = (".json", ".csv")
+
+# Parsed entries of the files that changed (empty for deleted files), by path
+ParsedFiles = Dict[Path, Dict[str, Any]]
+
+def parse_spells(path: Path, text: str) -> List[Spell]:
+    """
+    Parse and validate a spell file
+
+    Raises:
+        CatalogValidationError: If the file or any spell is invalid
+    """
+    try:
+        entries = json.loads(text)
+    except ValueError as exc:
+        raise CatalogValidationError(path, [f"unreadable: {exc}"]) from exc
+    if isinstance(entries, dict):
+        entries = entries.get("spells", [])
+
+    spells, problems = [], []
+    for number, entry in enumerate(entries, 1):
+        try:
+            spells.append(decode_dataclass(Spell, entry))
+        except (TypeError, ValueError, KeyError, AttributeError) as exc:
+            problems.append(f"spell {number}: {exc}")
+    if problems:
+        raise CatalogValidationError(path, problems)
+    return spells
+
+@dataclass
+class HomebrewChanges:
+    """What one poll changed, by entry name"""
+    added_items: List[str] = field(default_factory=list)
+    updated_items: List[str] = field(default_factory=list)
+    removed_items: List[str] = field(default_factory=list)
+    changed_spells: List[str] = field(default_factory=list)
+    removed_spells: List[str] = field(default_factory=list)
+    errors: Dict[str, str] = field(default_factory=dict)  # File -> problem
+
+    @property
+    def changed(self) -> bool:
+        return any((self.added_items, self.updated_items, self.removed_items,
+                    self.changed_spells, self.removed_spells))
+
+def _provider(files: Dict[Path, Dict[str, Any]], name: str, except_path: Optional[Path] = None) -> Any:
+    """The entry another loaded homebrew file defines under this name, if any"""
+    for path, entries in files.items():
+        if path != except_path and name in entries:
+            return entries[name]
+    return None
+
+class HomebrewRegistry(ChangeNotifier):
+    """Homebrew items and spells kept in sync with files on disk"""
+
+    def __init__(self, directory: Path = HOMEBREW_DIR,
+                 catalog: Optional[EquipmentCatalog] = None,
+                 search_index: Optional[NameSearchIndex] = None,
+                 loader: Optional[CatalogLoader] = None,
+                 compendium: Optional[SpellCompendium] = None):
+        """
+        Args:
+            directory: Homebrew directory holding items/ and spells/
+            catalog: Catalog that homebrew items are merged into
+            search_index: Name index kept in step with the catalog
+            loader: Loader (and build cache) used for item files
+            compendium: Spell compendium that homebrew spells are merged into
+        """
+        self.items_dir = Path(directory) / "items"
+        self.spells_dir = Path(directory) / "spells"
+        self.items_dir.mkdir(parents=True, exist_ok=True)
+        self.spells_dir.mkdir(parents=True, exist_ok=True)
+        self.catalog = catalog if catalog is not None else EquipmentCatalog()
+        self.search_index = search_index
+        self.loader = loader or CatalogLoader()
+        self.compendium = compendium
+        self.spells: Dict[str, Spell] = {}
+        # Held while changes are applied, for callers that poll from their own thread
+        self.lock = threading.RLock()
+        self._scan_lock = threading.Lock()  # Guards the file stats and digests
+
+        self._stats: Dict[Path, Tuple[int, int]] = {}
+        self._digests: Dict[Path, str] = {}
+        self._file_items: Dict[Path, Dict[str, Equipment]] = {}
+        self._file_spells: Dict[Path, Dict[str, Spell]] = {}
+        self._shadowed: Dict[str, Equipment] = {}  # Catalog entries hidden by homebrew
+        self._shadowed_spells: Dict[str, Spell] = {}  # Compendium entries hidden by homebrew
+        self._inventories: Dict[int, "weakref.ref[Inventory]"] = {}
+
+        self._watcher: Optional[threading.Thread] = None
+        self._stop_watcher = threading.Event()
+        self._parsed: "queue.Queue[Tuple[ParsedFiles, HomebrewChanges]]" = queue.Queue()
+
+    def watch(self, inventory: Inventory) -> None:
+        """Rebind this inventory's items whenever their homebrew templates change"""
+        key = id(inventory)
+        self._inventories[key] = weakref.ref(inventory, lambda _: self._inventories.pop(key, None))
+
+    def unwatch(self, inventory: Inventory) -> None:
+        self._inventories.pop(id(inventory), None)
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        files = [path for path in self.items_dir.iterdir() if path.suffix.lower() in ITEM_SUFFIXES]
+        files += self.spells_dir.glob("*.json")
+        stats = {}
+        for path in files:
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue  # Deleted while scanning
+            stats[path] = (stat.st_mtime_ns, stat.st_size)
+        return stats
+
+    def _parse(self, path: Path, content: bytes) -> Dict[str, Any]:
+        if path.parent == self.spells_dir:
+            return {spell.name: spell for spell in parse_spells(path, content.decode("utf-8-sig"))}
+        return {item.name: item for item in self.loader.load(path)}
+
+    def poll(self) -> HomebrewChanges:
+        """Reload files changed since the last poll and apply their entries on this thread"""
+        return self._apply(*self._collect())
+
+    def _collect(self) -> Tuple[ParsedFiles, HomebrewChanges]:
+        """Read and parse changed files; touches nothing shared with readers"""
+        changes = HomebrewChanges()
+        with self._scan_lock:
+            current = self._scan()
+            parsed: ParsedFiles = {}
+            for path in [path for path in self._stats if path not in current]:
+                del self._stats[path]
+                self._digests.pop(path, None)
+                parsed[path] = {}
+
+            for path, stat in current.items():
+                if self._stats.get(path) == stat:
+                    continue
+                try:
+                    content = path.read_bytes()
+                except FileNotFoundError:
+                    continue
+                self._stats[path] = stat
+                digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+                if self._digests.get(path) == digest:
+                    continue  # Touched but not edited
+                try:
+                    parsed[path] = self._parse(path, content)
+                except CatalogValidationError as exc:
+                    # Keep the last good entries until the file is fixed
+                    changes.errors[str(path)] = str(exc)
+                    continue
+                self._digests[path] = digest
+        return parsed, changes
+
+    def _apply(self, parsed: ParsedFiles, changes: HomebrewChanges) -> HomebrewChanges:
+        """Swap parsed entries into the catalog, index and compendium"""
+        if not parsed:
+            return changes
+
+        with self.lock:
+            rebinds: Dict[Equipment, Equipment] = {}
+            for path, entries in parsed.items():
+                if path.parent == self.spells_dir:
+                    self._apply_spells(path, entries, changes)
+                else:
+                    self._apply_items(path, entries, changes, rebinds)
+
+            if rebinds:
+                for ref in list(self._inventories.values()):
+                    inventory = ref()
+                    if inventory is not None:
+                        inventory.rebind_templates(rebinds)
+
+        if changes.changed:
+            self._notify("homebrew_changed", changes=changes)
+        return changes
+
+    def _apply_items(self, path: Path, entries: Dict[str, Equipment],
+                     changes: HomebrewChanges, rebinds: Dict[Equipment, Equipment]) -> None:
+        previous = self._file_items.pop(path, {})
+        if entries:
+            self._file_items[path] = entries
+
+        for name, old in previous.items():
+            if name in entries:
+                continue
+            if self.catalog.get(name) is not old:
+                continue  # Another file's version is in use; this one was already hidden
+            other = _provider(self._file_items, name)
+            if other is not None:
+                # Another file defines the same name; its version takes over
+                self._put(other, homebrew=True)
+                rebinds[old] = other
+                changes.updated_items.append(name)
+                continue
+            self.catalog.remove(name)
+            if self.search_index is not None:
+                self.search_index.remove(name)
+            restored = self._shadowed.pop(name, None)
+            if restored is not None:
+                self._put(restored, homebrew=False)
+                rebinds[old] = restored
+            changes.removed_items.append(name)
+
+        for name, item in entries.items():
+            old = previous.get(name)
+            if old is not None and old == item:
+                entries[name] = old  # Unchanged; keep the template items already use
+                continue
+            current = self.catalog.get(name)
+            if old is None:
+                if current is not None and _provider(self._file_items, name, path) is None:
+                    self._shadowed[name] = current
+                changes.added_items.append(name)
+            else:
+                rebinds[old] = item
+                changes.updated_items.append(name)
+            if current is not None:
+                rebinds[current] = item  # Also replaces another file's version of the name
+            self._put(item, homebrew=True)
+
+    def _put(self, item: Equipment, homebrew: bool) -> None:
+        self.catalog.add(item)
+        if self.search_index is not None:
+            self.search_index.add(item, homebrew=homebrew)
+
+    def _apply_spells(self, path: Path, entries: Dict[str, Spell], changes: HomebrewChanges) -> None:
+        previous = self._file_spells.pop(path, {})
+        if entries:
+            self._file_spells[path] = entries
+        for name, old in previous.items():
+            if name in entries or self.spells.get(name) is not old:
+                continue
+            other = _provider(self._file_spells, name)
+            if other is not None:
+                self.spells[name] = other
+                if self.compendium is not None:
+                    self.compendium.add(other)
+                changes.changed_spells.append(name)
+                continue
+            del self.spells[name]
+            changes.removed_spells.append(name)
+            if self.compendium is not None and name in self.compendium:
+                self.compendium.remove(name)
+                restored = self._shadowed_spells.pop(name, None)
+                if restored is not None:
+                    self.compendium.add(restored)
+        for name, spell in entries.items():
+            old = previous.get(name)
+            if old is not None and old == spell:
+                entries[name] = old
+                continue
+            if self.compendium is not None:
+                existing = self.compendium.get(name)
+                if existing is not None and name not in self.spells:
+                    self._shadowed_spells[name] = existing
+                self.compendium.add(spell)
+            self.spells[name] = spell
+            changes.changed_spells.append(name)
+
+    def start(self, interval: float = HOMEBREW_POLL_INTERVAL) -> None:
+        """
+        Read and parse edited files in a background thread
+
+        Nothing is applied until apply_pending runs on the thread that owns
+        the catalog; attach does that from the Tk main loop.
+        """
+        if self._watcher is not None:
+            return
+
+        def run():
+            while not self._stop_watcher.wait(interval):
+                parsed, changes = self._collect()
+                if parsed or changes.errors:
+                    self._parsed.put((parsed, changes))
+
+        self._stop_watcher.clear()
+        self._watcher = threading.Thread(target=run, name="homebrew-watcher", daemon=True)
+        self._watcher.start()
+
+    def apply_pending(self) -> List[HomebrewChanges]:
+        """Apply what the watcher has parsed so far, without blocking"""
+        applied = []
+        while True:
+            try:
+                parsed, changes = self._parsed.get_nowait()
+            except queue.Empty:
+                return applied
+            applied.append(self._apply(parsed, changes))
+
+    def attach(self, root, on_change: Optional[Callable[[HomebrewChanges], None]] = None,
+               interval_ms: int = HOMEBREW_APPLY_INTERVAL_MS) -> None:
+        """Apply the watcher's results from the Tk main loop"""
+        def apply():
+            for changes in self.apply_pending():
+                if on_change is not None:
+                    on_change(changes)
+            if self._watcher is not None:
+                root.after(interval_ms, apply)
+
+        root.after(interval_ms, apply)
+
+    def stop(self) -> None:
+        """Stop the background watcher"""
+        if self._watcher is not None:
+            self._stop_watcher.set()
+            self._watcher.join()
+            self._watcher = None
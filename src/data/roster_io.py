@@ -0,0 +1,133 @@
+"""
+Streaming JSONL roster import and export
+
+Rosters are written one character per line so that neither side ever holds
+the whole roster in memory. Imports can parse batches of lines in worker
+processes; batches are yielded in file order, with only a few in flight.
+"""
+import gzip
+import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Deque, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from ..config.settings import ROSTER_IMPORT_CHUNK_SIZE
+from ..models.character.base import Character
+from .serializers import CharacterSerializer
+
+ProgressCallback = Callable[[int], None]
+
+def open_roster(path: Path, mode: str = "rt") -> TextIO:
+    """Open a roster file, transparently gzipped when the name ends in .gz"""
+    path = Path(path)
+    if path.suffix == ".gz":
+        return gzip.open(path, mode, encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+def iter_export(roster: Iterable[Character], fp: TextIO,
+                progress: Optional[ProgressCallback] = None) -> Iterator[int]:
+    """
+    Write characters to fp, one JSON document per line
+
+    Yields:
+        Number of characters written so far, after each character
+    """
+    count = 0
+    for character in roster:
+        fp.write(json.dumps(CharacterSerializer.to_dict(character), separators=(",", ":")))
+        fp.write("\n")
+        count += 1
+        if progress:
+            progress(count)
+        yield count
+
+def export_roster(roster: Iterable[Character], path: Path,
+                  progress: Optional[ProgressCallback] = None) -> int:
+    """Export a roster to a file, return the number of characters written"""
+    count = 0
+    with open_roster(path, "wt") as fp:
+        for count in iter_export(roster, fp, progress):
+            pass
+    return count
+
+def _iter_batches(fp: TextIO, size: int) -> Iterator[Tuple[int, List[str]]]:
+    """Group lines into batches, tagged with the first line number"""
+    batch: List[str] = []
+    start = 1
+    for line_number, line in enumerate(fp, 1):
+        if not batch:
+            start = line_number
+        batch.append(line)
+        if len(batch) >= size:
+            yield start, batch
+            batch = []
+    if batch:
+        yield start, batch
+
+def _parse_batch(start: int, lines: List[str]) -> List[Character]:
+    characters = []
+    for line_number, line in enumerate(lines, start):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except ValueError as exc:
+            raise ValueError(f"Invalid character on line {line_number}: {exc}") from exc
+        if not isinstance(data, dict):
+            raise ValueError(f"Invalid character on line {line_number}: expected an object")
+        try:
+            characters.append(CharacterSerializer.from_dict(data))
+        except (ValueError, KeyError, TypeError) as exc:
+            raise ValueError(f"Invalid character on line {line_number}: {exc}") from exc
+    return characters
+
+def iter_import(fp: TextIO, workers: Optional[int] = None,
+                chunk_size: int = ROSTER_IMPORT_CHUNK_SIZE,
+                progress: Optional[ProgressCallback] = None) -> Iterator[Character]:
+    """
+    Read characters from a JSONL roster in file order
+
+    Args:
+        fp: Text stream with one character per line
+        workers: Number of parsing processes; None or 1 parses in-process
+        chunk_size: Lines per batch handed to a worker
+        progress: Called with the number of characters read so far
+    """
+    count = 0
+    batches = _iter_batches(fp, chunk_size)
+
+    if not workers or workers <= 1:
+        for start, lines in batches:
+            for character in _parse_batch(start, lines):
+                count += 1
+                if progress:
+                    progress(count)
+                yield character
+        return
+
+    # Keep a bounded window of batches in flight and consume them in order
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight: Deque = deque()
+        exhausted = False
+        while in_flight or not exhausted:
+            while not exhausted and len(in_flight) < workers * 2:
+                batch = next(batches, None)
+                if batch is None:
+                    exhausted = True
+                else:
+                    in_flight.append(pool.submit(_parse_batch, *batch))
+            if not in_flight:
+                break
+
+            for character in in_flight.popleft().result():
+                count += 1
+                if progress:
+                    progress(count)
+                yield character
+
+def import_roster(path: Path, workers: Optional[int] = None,
+                  progress: Optional[ProgressCallback] = None) -> Iterator[Character]:
+    """Stream characters from a roster file"""
+    with open_roster(path, "rt") as fp:
+        yield from iter_import(fp, workers=workers, progress=progress)
@@ -0,0 +1,163 @@
+"""
+Conversion between models and JSON-compatible dictionaries
+"""
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Dict, List, Union, get_args, get_origin, get_type_hints
+
+from ..models.character.base import Character
+from ..models.equipment.armor import Armor, Shield
+from ..models.equipment.base import Equipment
+from ..models.equipment.inventory import Currency, EquipmentSlot, Inventory, InventoryItem
+from ..models.equipment.magic_items import MagicArmor, MagicItem, MagicWeapon, WondrousItem
+from ..models.equipment.weapons import Weapon
+
+# Equipment classes that can be restored, keyed by the "kind" tag written to disk
+EQUIPMENT_CLASSES = {
+    cls.__name__: cls
+    for cls in (Equipment, Weapon, Armor, Shield, MagicItem, MagicWeapon, MagicArmor, WondrousItem)
+}
+
+# Fields that Shield.__init__ fills in itself
+_SHIELD_FIXED_FIELDS = ("category", "base_ac", "max_dex_bonus")
+
+@lru_cache(maxsize=None)
+def field_type_hints(cls) -> Dict[str, Any]:
+    """Resolved type hints of a dataclass, cached per class"""
+    return get_type_hints(cls)
+
+def encode(value: Any) -> Any:
+    """Convert dataclasses, enums and containers to JSON-compatible values"""
+    if isinstance(value, Enum):
+        return value.value
+    if is_dataclass(value) and not isinstance(value, type):
+        return {f.name: encode(getattr(value, f.name)) for f in fields(value)}
+    if isinstance(value, (list, tuple)):
+        return [encode(item) for item in value]
+    if isinstance(value, dict):
+        return {key.value if isinstance(key, Enum) else key: encode(item) for key, item in value.items()}
+    return value
+
+def decode(hint: Any, value: Any) -> Any:
+    """Convert a JSON-compatible value back to the type described by a type hint"""
+    if value is None:
+        return None
+
+    origin = get_origin(hint)
+    if origin is Union:
+        hint = next(arg for arg in get_args(hint) if arg is not type(None))
+        return decode(hint, value)
+    if origin in (list, List):
+        (item_hint,) = get_args(hint) or (Any,)
+        return [decode(item_hint, item) for item in value]
+    if origin in (dict, Dict):
+        key_hint, item_hint = get_args(hint) or (Any, Any)
+        return {decode(key_hint, key): decode(item_hint, item) for key, item in value.items()}
+    if isinstance(hint, type):
+        if issubclass(hint, Enum):
+            return hint(value)
+        if is_dataclass(hint):
+            return decode_dataclass(hint, value)
+        if hint in (int, float, str) and not isinstance(value, hint):
+            return hint(value)
+    return value
+
+def decode_dataclass(cls, data: Dict[str, Any]):
+    """Build a dataclass instance from a dictionary, ignoring unknown keys"""
+    hints = field_type_hints(cls)
+    kwargs = {
+        f.name: decode(hints[f.name], data[f.name])
+        for f in fields(cls)
+        if f.init and f.name in data
+    }
+    return cls(**kwargs)
+
+def equipment_to_dict(equipment: Equipment) -> Dict[str, Any]:
+    """Serialize equipment, tagged with its class"""
+    data = encode(equipment)
+    data["kind"] = type(equipment).__name__
+    return data
+
+def equipment_from_dict(data: Dict[str, Any]) -> Equipment:
+    """Restore equipment serialized by equipment_to_dict"""
+    data = dict(data)
+    kind = data.pop("kind", Equipment.__name__)
+    try:
+        cls = EQUIPMENT_CLASSES[kind]
+    except KeyError:
+        raise ValueError(f"Unknown equipment kind: {kind}") from None
+
+    if cls is Shield:
+        for name in _SHIELD_FIXED_FIELDS:
+            data.pop(name, None)
+    return decode_dataclass(cls, data)
+
+def inventory_item_to_dict(item: InventoryItem) -> Dict[str, Any]:
+    """Serialize a single inventory entry"""
+    return {
+        "equipment": equipment_to_dict(item.equipment),
+        "quantity": item.quantity,
+        "equipped": item.equipped,
+        "equipped_slot": item.equipped_slot.value if item.equipped_slot else None,
+        "attuned": item.attuned,
+        "custom_name": item.custom_name,
+        "notes": item.notes,
+        "item_id": item.item_id,
+        "charges": item.charges,
+        "container_id": item.container_id,
+    }
+
+def inventory_item_from_dict(data: Dict[str, Any]) -> InventoryItem:
+    """Restore an inventory entry serialized by inventory_item_to_dict"""
+    slot = data.get("equipped_slot")
+    item = InventoryItem(
+        equipment=equipment_from_dict(data["equipment"]),
+        quantity=data.get("quantity", 1),
+        equipped=data.get("equipped", False),
+        equipped_slot=EquipmentSlot(slot) if slot else None,
+        attuned=data.get("attuned", False),
+        custom_name=data.get("custom_name"),
+        notes=data.get("notes", ""),
+        charges=data.get("charges"),
+        container_id=data.get("container_id"),
+    )
+    if data.get("item_id"):
+        item.item_id = data["item_id"]
+    return item
+
+def inventory_to_dict(inventory: Inventory) -> Dict[str, Any]:
+    """Serialize an inventory"""
+    return {
+        "items": [inventory_item_to_dict(item) for item in inventory.items],
+        "currency": encode(inventory.currency),
+        "carrying_capacity_override": inventory.carrying_capacity_override,
+    }
+
+def inventory_from_dict(data: Dict[str, Any]) -> Inventory:
+    """Restore an inventory serialized by inventory_to_dict"""
+    items = [inventory_item_from_dict(item) for item in data.get("items", [])]
+    return Inventory(
+        items=items,
+        equipped_items={item.equipped_slot: item for item in items if item.equipped_slot},
+        currency=decode_dataclass(Currency, data.get("currency", {})),
+        carrying_capacity_override=data.get("carrying_capacity_override"),
+    )
+
+class CharacterSerializer:
+    """Serialize characters to and from JSON-compatible dictionaries"""
+
+    @staticmethod
+    def to_dict(character: Character) -> Dict[str, Any]:
+        """Convert a character, including its inventory, to a dictionary"""
+        data = encode(character)
+        data["inventory"] = inventory_to_dict(character.inventory)
+        return data
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> Character:
+        """Restore a character serialized by to_dict"""
+        character = decode_dataclass(Character, data)
+        if "inventory" in data:
+            character.inventory = inventory_from_dict(data["inventory"])
+        return character
@@ -2,8 +2,12 @@
 Base character model definitions
 """
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from enum import Enum
+from ..events import ChangeNotifier
+
+if TYPE_CHECKING:
+    from ..equipment.modifiers import ModifierStack
 
 class AbilityType(Enum):
     STRENGTH = "strength"
@@ -36,7 +40,7 @@ class AbilityScores:
         }
 
 @dataclass
-class CharacterVitals:
+class CharacterVitals(ChangeNotifier):
     """Character health and defensive stats"""
     hit_points: int = 8
     max_hit_points: int = 8
@@ -55,19 +59,73 @@ class CharacterVitals:
     def calculate_initiative(self, dex_modifier: int) -> int:
         return dex_modifier + self.initiative_modifier
 
+    def take_damage(self, amount: int) -> None:
+        """Apply damage, spending temporary hit points first"""
+        absorbed = min(self.temporary_hit_points, amount)
+        self.temporary_hit_points -= absorbed
+        self.hit_points = max(0, self.hit_points - (amount - absorbed))
+        self._notify_hit_points()
+
+    def heal(self, amount: int) -> None:
+        """Restore hit points up to the maximum"""
+        self.hit_points = min(self.max_hit_points, self.hit_points + amount)
+        self._notify_hit_points()
+
+    def add_temporary_hit_points(self, amount: int) -> None:
+        """Gain temporary hit points (they don't stack; keep the higher value)"""
+        self.temporary_hit_points = max(self.temporary_hit_points, amount)
+        self._notify_hit_points()
+
+    def _notify_hit_points(self) -> None:
+        self._notify(
+            "hit_points_changed",
+            hit_points=self.hit_points,
+            temporary_hit_points=self.temporary_hit_points,
+        )
+
 @dataclass
 class CharacterProgression:
     """Character level and experience"""
     level: int = 1
     experience_points: int = 0
     proficiency_bonus: int = 2
-    
+    hit_die: int = 8  # Sides of the class hit die
+    hit_dice_used: int = 0
+
     def calculate_proficiency_bonus(self) -> int:
         """Calculate proficiency bonus from level"""
         return 2 + ((self.level - 1) // 4)
 
+    @property
+    def hit_dice_remaining(self) -> int:
+        return self.level - self.hit_dice_used
+
+    def spend_hit_die(self) -> bool:
+        """Spend one hit die, if any are left"""
+        if self.hit_dice_remaining <= 0:
+            return False
+        self.hit_dice_used += 1
+        return True
+
+    def regain_hit_dice(self, count: Optional[int] = None) -> int:
+        """
+        Recover spent hit dice
+
+        Args:
+            count: Dice to recover; by default half the level (at least one),
+                as after a long rest
+
+        Returns:
+            Number of dice recovered
+        """
+        if count is None:
+            count = max(1, self.level // 2)
+        regained = min(count, self.hit_dice_used)
+        self.hit_dice_used -= regained
+        return regained
+
 @dataclass
-class Character:
+class Character(ChangeNotifier):
     """Main character model"""
     # Basic Info
     name: str = ""
@@ -93,7 +151,9 @@ class Character:
     equipment: List[str] = field(default_factory=list)  # Legacy - keep for compatibility
     
     # Spells
-    spell_slots: Dict[int, int] = field(default_factory=dict)
+    spell_slots: Dict[int, int] = field(default_factory=dict)  # Remaining, by slot level
+    spell_slot_maximums: Dict[int, int] = field(default_factory=dict)  # Entered by hand, for classes without a slot table
+    class_levels: Dict[str, int] = field(default_factory=dict)  # For multiclass characters
     spells_known: List[str] = field(default_factory=list)
     
     # Features & Traits
@@ -102,6 +162,7 @@ class Character:
     
     # Metadata
     notes: str = ""
+    id: Optional[str] = None  # Assigned when first saved
     
     def __post_init__(self):
         """Initialize calculated values"""
@@ -114,4 +175,97 @@ class Character:
         # Initialize inventory if not present (for equipment system)
         if not hasattr(self, 'inventory'):
             from ..equipment.inventory import Inventory
-            self.inventory = Inventory()
\ No newline at end of file
+            self.inventory = Inventory()
+
+        self._build_slot_tracker(None)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = super().__getstate__()
+        state.pop("_modifier_stack", None)  # Rebuilt on first use
+        return state
+
+    @property
+    def modifiers(self) -> "ModifierStack":
+        """Modifiers granted by the items in effect, following the current inventory"""
+        stack = self.__dict__.get("_modifier_stack")
+        if stack is None or stack.inventory is not self.inventory:
+            if stack is not None:
+                stack.detach()
+            from ..equipment.modifiers import ModifierStack
+            stack = self._modifier_stack = ModifierStack(self.inventory)
+        return stack
+
+    def get_armor_class(self) -> int:
+        """Armor class shown on the sheet: the entered AC plus item modifiers"""
+        from ..equipment.modifiers import ModifierType
+        return self.vitals.armor_class + self.modifiers.total(ModifierType.ARMOR_CLASS)
+
+    def get_saving_throw_modifier(self, ability: AbilityType) -> int:
+        """Saving throw modifier, with proficiency if proficient and item modifiers"""
+        proficient = ability.value in self.saving_throw_proficiencies
+        return self.modifiers.saving_throw_bonus(
+            self.ability_scores.get_modifier(ability),
+            self.progression.proficiency_bonus if proficient else 0,
+        )
+
+    def get_speed(self) -> int:
+        """Walking speed including item modifiers"""
+        return self.modifiers.speed(self.vitals.speed)
+
+    def _build_slot_tracker(self, previous) -> None:
+        from ..spells.slots import SpellSlots
+        slots = SpellSlots.for_classes(self.class_levels or {self.character_class: self.progression.level})
+        if not slots:
+            # No slot table: use the maximums entered by hand. Older sheets
+            # saved only one set of slots, which were the maximums.
+            if not self.spell_slot_maximums:
+                self.spell_slot_maximums = dict(self.spell_slots)
+            slots = SpellSlots.from_maximums(self.spell_slot_maximums)
+        if previous is not None:
+            slots.carry_over(previous)
+        elif self.spell_slots:
+            slots.load_remaining(self.spell_slots)
+        self.slot_tracker = slots
+        self.spell_slots = slots.as_dict()
+
+    def refresh_spell_slots(self) -> None:
+        """
+        Rebuild slot maximums from class levels, e.g. after levelling up
+
+        Slots already spent stay spent; new slots start unspent.
+        """
+        self._build_slot_tracker(self.slot_tracker)
+
+    def load_spell_slots(self, remaining: Dict[int, int], maximums: Optional[Dict[int, int]] = None) -> None:
+        """
+        Set the remaining slots, e.g. from a saved sheet
+
+        Args:
+            remaining: Unspent slots by slot level
+            maximums: Slots entered by hand, if the sheet has any
+        """
+        self.spell_slots = dict(remaining)
+        if maximums is not None:
+            self.spell_slot_maximums = dict(maximums)
+        self._build_slot_tracker(None)
+
+    def spend_spell_slot(self, level: int) -> bool:
+        """Spend a spell slot of the given level"""
+        if not self.slot_tracker.spend(level):
+            return False
+
+        self.spell_slots[level] = self.slot_tracker.remaining(level)
+        self._notify("spell_slot_spent", level=level)
+        return True
+
+    def restore_spell_slot(self, level: int, count: int = 1) -> int:
+        """Regain spent slots of one level; returns how many were regained"""
+        regained = self.slot_tracker.restore(level, count)
+        if regained:
+            self.sync_spell_slots()
+        return regained
+
+    def sync_spell_slots(self) -> None:
+        """Publish the tracker's remaining slots after it was changed directly, e.g. by a rest"""
+        self.spell_slots = self.slot_tracker.as_dict()
+        self._notify("spell_slots_restored", spell_slots=dict(self.spell_slots))
\ No newline at end of file
@@ -0,0 +1,220 @@
+"""
+Rest and recharge scheduling
+
+The scheduler keeps a registry of charged items; spell slots and hit dice
+are restored from each character's own trackers. Each item is registered
+with its trigger (dawn, short rest or long rest), so a rest only visits the
+entries registered for that trigger instead of every item of every
+character. Dawn recharges sit in a heap ordered by when they are next due;
+advancing the in-game clock pops only the entries whose dawn has come.
+All recharge and hit dice rolls of one pass are made together with
+roll_batch.
+"""
+import heapq
+import itertools
+import random
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from ..dice import roll_batch
+from ..equipment.inventory import InventoryItem
+from ..spells.slots import restore_roster
+from .base import AbilityType, Character
+
+HOURS_PER_DAY = 24.0
+DAWN_HOUR = 6.0
+
+class RestTrigger(Enum):
+    DAWN = "dawn"
+    SHORT_REST = "short rest"
+    LONG_REST = "long rest"
+
+@dataclass(eq=False)
+class RechargeEntry:
+    """A charged item and when it refreshes"""
+    owner: Character
+    item: InventoryItem
+    trigger: RestTrigger
+    dice: Optional[str] = None  # Charges regained; None restores all of them
+    active: bool = True  # Cleared when unregistered; stale heap entries are skipped
+
+@dataclass
+class RestReport:
+    """What one rest or dawn restored"""
+    charges: List[Tuple[InventoryItem, int]] = field(default_factory=list)
+    hit_points: List[Tuple[Character, int]] = field(default_factory=list)
+    hit_dice: List[Tuple[Character, int]] = field(default_factory=list)
+    spell_slots: List[Character] = field(default_factory=list)
+
+def recharge_trigger(item: InventoryItem) -> Optional[RestTrigger]:
+    """The trigger that recharges an item, or None if it has no charges to restore"""
+    equipment = item.equipment
+    if getattr(equipment, "max_charges", None) is None or item.charges is None:
+        return None
+    properties = equipment.properties if isinstance(equipment.properties, dict) else {}
+    return RestTrigger(properties.get("recharge", RestTrigger.DAWN.value))
+
+class RestScheduler:
+    """Registry of rechargeable items, spell slots and hit dice across a roster"""
+
+    def __init__(self, time: float = 0.0, rng: Optional[random.Random] = None):
+        """
+        Args:
+            time: In-game clock, in hours since the start of the campaign
+            rng: Random source for recharge and hit dice rolls
+        """
+        self.time = time
+        self.rng = rng or random.Random()
+        self._entries: Dict[int, RechargeEntry] = {}  # By id of the item
+        # Entries of each character, by trigger
+        self._by_owner: Dict[int, Dict[RestTrigger, List[RechargeEntry]]] = {}
+        self._dawns: List[Tuple[float, int, RechargeEntry]] = []
+        self._sequence = itertools.count()
+
+    def next_dawn(self, after: float) -> float:
+        """The first dawn strictly after a point in time"""
+        day = (after - DAWN_HOUR) // HOURS_PER_DAY + 1
+        return day * HOURS_PER_DAY + DAWN_HOUR
+
+    def register_character(self, character: Character) -> None:
+        """Register a character's charged items"""
+        self._by_owner.setdefault(id(character), {})
+        for item in character.inventory.items:
+            self.register_item(character, item)
+
+    def unregister_character(self, character: Character) -> None:
+        for entries in self._by_owner.pop(id(character), {}).values():
+            for entry in entries:
+                self._entries.pop(id(entry.item), None)
+                entry.active = False
+
+    def register_item(self, owner: Character, item: InventoryItem,
+                      trigger: Optional[RestTrigger] = None) -> Optional[RechargeEntry]:
+        """
+        Register an item that recharges
+
+        Args:
+            trigger: When the item recharges; read from the item by default
+
+        Returns:
+            The new entry, or None if the item has no charges to restore
+        """
+        trigger = trigger or recharge_trigger(item)
+        if trigger is None:
+            return None
+        self.unregister_item(item)
+        entry = RechargeEntry(owner, item, trigger, getattr(item.equipment, "recharge_dice", None))
+        self._entries[id(item)] = entry
+        self._by_owner.setdefault(id(owner), {}).setdefault(trigger, []).append(entry)
+        if trigger == RestTrigger.DAWN:
+            heapq.heappush(self._dawns, (self.next_dawn(self.time), next(self._sequence), entry))
+        return entry
+
+    def unregister_item(self, item: InventoryItem) -> None:
+        entry = self._entries.pop(id(item), None)
+        if entry is None:
+            return
+        entry.active = False
+        self._by_owner[id(entry.owner)][entry.trigger].remove(entry)
+
+    def advance(self, hours: float) -> RestReport:
+        """Move the clock forward, recharging every item whose dawn has passed"""
+        self.time += hours
+        due: List[Tuple[RechargeEntry, int]] = []
+        while self._dawns and self._dawns[0][0] <= self.time:
+            when, _, entry = heapq.heappop(self._dawns)
+            if not entry.active:
+                continue
+            dawns = int((self.time - when) // HOURS_PER_DAY) + 1
+            due.append((entry, dawns))
+            heapq.heappush(self._dawns, (when + dawns * HOURS_PER_DAY, next(self._sequence), entry))
+        report = RestReport()
+        self._recharge(due, report)
+        return report
+
+    def short_rest(self, characters: Iterable[Character],
+                   hit_dice: Union[int, Sequence[int]] = 0) -> RestReport:
+        """
+        Finish a short rest for several characters
+
+        Warlocks regain their pact slots.
+
+        Args:
+            hit_dice: Hit dice each character spends to heal, as one number
+                for everyone or one per character
+        """
+        characters = list(characters)
+        spend = [hit_dice] * len(characters) if isinstance(hit_dice, int) else list(hit_dice)
+        report = RestReport()
+        self._recharge(self._triggered(characters, RestTrigger.SHORT_REST), report)
+        for character in characters:
+            slots = character.slot_tracker
+            if slots.pact_used:
+                slots.short_rest()
+                character.sync_spell_slots()
+                report.spell_slots.append(character)
+
+        # Roll every spent hit die in one batch
+        rolls: List[Tuple[Character, str]] = []
+        for character, count in zip(characters, spend):
+            progression = character.progression
+            constitution = character.ability_scores.get_modifier(AbilityType.CONSTITUTION)
+            for _ in range(count):
+                if not progression.spend_hit_die():
+                    break
+                rolls.append((character, f"1d{progression.hit_die}{constitution:+d}"))
+        healing: Dict[int, int] = {}
+        for (character, _), total in zip(rolls, roll_batch([dice for _, dice in rolls], self.rng)):
+            healing[id(character)] = healing.get(id(character), 0) + max(0, total)
+        for character in characters:
+            if id(character) in healing:
+                report.hit_points.append((character, self._heal(character, healing[id(character)])))
+        return report
+
+    def long_rest(self, characters: Iterable[Character]) -> RestReport:
+        """
+        Finish a long rest for several characters
+
+        Hit points are restored in full, half the hit dice are regained,
+        spell slots return to their maximums and long-rest items recharge.
+        """
+        characters = list(characters)
+        report = RestReport()
+        self._recharge(self._triggered(characters, RestTrigger.LONG_REST), report)
+        spent = [character for character in characters
+                 if any(character.slot_tracker.used) or character.slot_tracker.pact_used]
+        restore_roster(character.slot_tracker for character in spent)
+        for character in characters:
+            vitals = character.vitals
+            report.hit_points.append((character, self._heal(character, vitals.max_hit_points)))
+            report.hit_dice.append((character, character.progression.regain_hit_dice()))
+        for character in spent:
+            character.sync_spell_slots()
+        report.spell_slots.extend(spent)
+        return report
+
+    def _triggered(self, characters: List[Character], trigger: RestTrigger) -> List[Tuple[RechargeEntry, int]]:
+        return [(entry, 1) for character in characters
+                for entry in self._by_owner.get(id(character), {}).get(trigger, [])]
+
+    def _heal(self, character: Character, amount: int) -> int:
+        vitals = character.vitals
+        before = vitals.hit_points
+        if before < vitals.max_hit_points:
+            vitals.heal(amount)
+        return vitals.hit_points - before
+
+    def _recharge(self, due: List[Tuple[RechargeEntry, int]], report: RestReport) -> None:
+        """Recharge entries, rolling the dice of all of them (once per trigger passed) together"""
+        rolls = [entry.dice for entry, times in due if entry.dice for _ in range(times)]
+        totals = iter(roll_batch(rolls, self.rng))
+        for entry, times in due:
+            item = entry.item
+            amount = sum(next(totals) for _ in range(times)) if entry.dice else None
+            if item not in entry.owner.inventory.items:
+                self.unregister_item(item)  # Sold, dropped or handed over since registering
+                continue
+            before = item.charges
+            entry.owner.inventory.recharge_item(item, amount)
+            report.charges.append((item, item.charges - before))
@@ -0,0 +1,266 @@
+"""
+Rules validation for characters and whole rosters
+
+Characters are first flattened into columns of plain integers so each rule
+runs as a single pass over one column. Large rosters are split into shards
+and checked in a process pool; only the columns cross the process boundary.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, asdict
+from enum import Enum
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ...config.settings import ABILITY_SCORE_MIN, ABILITY_SCORE_MAX, MAX_LEVEL, MAX_ATTUNED_ITEMS
+from ..equipment.armor import Armor, Shield
+from ..equipment.inventory import EquipmentSlot
+from ..equipment.weapons import Weapon
+from .base import AbilityType, Character
+
+# Rosters smaller than this are always checked in-process
+DEFAULT_SHARD_SIZE = 5000
+
+class Severity(Enum):
+    ERROR = "error"
+    WARNING = "warning"
+
+@dataclass
+class ValidationIssue:
+    """A single rules violation found on a character"""
+    index: int  # Position of the character in the validated roster
+    character_name: str
+    code: str
+    message: str
+    severity: Severity = Severity.ERROR
+
+    def to_dict(self) -> Dict[str, object]:
+        """Convert to a plain dictionary for reporting"""
+        data = asdict(self)
+        data["severity"] = self.severity.value
+        return data
+
+@dataclass
+class ValidationReport:
+    """Result of validating a roster"""
+    checked: int = 0
+    issues: List[ValidationIssue] = field(default_factory=list)
+
+    @property
+    def errors(self) -> List[ValidationIssue]:
+        return [issue for issue in self.issues if issue.severity == Severity.ERROR]
+
+    @property
+    def warnings(self) -> List[ValidationIssue]:
+        return [issue for issue in self.issues if issue.severity == Severity.WARNING]
+
+    @property
+    def is_valid(self) -> bool:
+        """Check if the roster has no errors (warnings are allowed)"""
+        return not self.errors
+
+    def by_character(self) -> Dict[int, List[ValidationIssue]]:
+        """Group issues by roster index"""
+        grouped: Dict[int, List[ValidationIssue]] = {}
+        for issue in self.issues:
+            grouped.setdefault(issue.index, []).append(issue)
+        return grouped
+
+    def to_dict(self) -> Dict[str, object]:
+        """Convert to a plain dictionary for reporting"""
+        return {
+            "checked": self.checked,
+            "valid": self.is_valid,
+            "issues": [issue.to_dict() for issue in self.issues],
+        }
+
+@dataclass
+class RosterColumns:
+    """Columnar view of the fields the rules engine checks"""
+    names: List[str] = field(default_factory=list)
+    abilities: Dict[str, List[int]] = field(
+        default_factory=lambda: {ability.value: [] for ability in AbilityType}
+    )
+    level: List[int] = field(default_factory=list)
+    hit_points: List[int] = field(default_factory=list)
+    max_hit_points: List[int] = field(default_factory=list)
+    attuned_items: List[int] = field(default_factory=list)
+    armor_min_strength: List[int] = field(default_factory=list)  # 0 = no requirement
+    slot_problems: List[Tuple[str, ...]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @classmethod
+    def from_characters(cls, characters: Sequence[Character]) -> "RosterColumns":
+        """Flatten characters into columns"""
+        columns = cls()
+        for character in characters:
+            columns.names.append(character.name)
+            for ability, column in columns.abilities.items():
+                column.append(getattr(character.ability_scores, ability))
+            columns.level.append(character.progression.level)
+            columns.hit_points.append(character.vitals.hit_points)
+            columns.max_hit_points.append(character.vitals.max_hit_points)
+
+            inventory = getattr(character, "inventory", None)
+            if inventory is None:
+                columns.attuned_items.append(0)
+                columns.armor_min_strength.append(0)
+                columns.slot_problems.append(())
+                continue
+
+            columns.attuned_items.append(sum(1 for item in inventory.items if item.attuned))
+            armor = inventory.get_equipped_armor()
+            columns.armor_min_strength.append((armor.min_strength or 0) if armor else 0)
+            columns.slot_problems.append(_find_slot_problems(inventory))
+        return columns
+
+    def slice(self, start: int, stop: int) -> "RosterColumns":
+        """Get the columns for a contiguous range of characters"""
+        return RosterColumns(
+            names=self.names[start:stop],
+            abilities={ability: column[start:stop] for ability, column in self.abilities.items()},
+            level=self.level[start:stop],
+            hit_points=self.hit_points[start:stop],
+            max_hit_points=self.max_hit_points[start:stop],
+            attuned_items=self.attuned_items[start:stop],
+            armor_min_strength=self.armor_min_strength[start:stop],
+            slot_problems=self.slot_problems[start:stop],
+        )
+
+def _find_slot_problems(inventory) -> Tuple[str, ...]:
+    """Describe inconsistencies between equipped_items and the item flags"""
+    problems = []
+    for slot, item in inventory.equipped_items.items():
+        name = item.display_name
+        if item not in inventory.items:
+            problems.append(f"{name} is equipped in {slot.value} but is not in the inventory")
+        if not item.equipped or item.equipped_slot != slot:
+            problems.append(f"{name} is in the {slot.value} slot but is not marked as equipped there")
+
+        equipment = item.equipment
+        if slot == EquipmentSlot.ARMOR and (not isinstance(equipment, Armor) or isinstance(equipment, Shield)):
+            problems.append(f"{name} cannot be worn in the armor slot")
+        elif slot == EquipmentSlot.SHIELD and not isinstance(equipment, Shield):
+            problems.append(f"{name} cannot be held in the shield slot")
+
+    for item in inventory.items:
+        if item.equipped and inventory.equipped_items.get(item.equipped_slot) is not item:
+            problems.append(f"{item.display_name} is marked as equipped but does not occupy a slot")
+
+    main_hand = inventory.equipped_items.get(EquipmentSlot.MAIN_HAND)
+    if (main_hand is not None and isinstance(main_hand.equipment, Weapon)
+            and main_hand.equipment.is_two_handed_weapon()):
+        for slot in (EquipmentSlot.OFF_HAND, EquipmentSlot.SHIELD):
+            if slot in inventory.equipped_items:
+                problems.append(
+                    f"{main_hand.display_name} is two-handed but {slot.value} is also occupied"
+                )
+    return tuple(problems)
+
+def _check_ability_scores(columns: RosterColumns, offset: int) -> List[ValidationIssue]:
+    issues = []
+    for ability, column in columns.abilities.items():
+        for i, score in enumerate(column):
+            if not ABILITY_SCORE_MIN <= score <= ABILITY_SCORE_MAX:
+                issues.append(ValidationIssue(
+                    offset + i, columns.names[i], "ability_score",
+                    f"{ability.capitalize()} {score} is outside "
+                    f"{ABILITY_SCORE_MIN}-{ABILITY_SCORE_MAX}"
+                ))
+    return issues
+
+def _check_level(columns: RosterColumns, offset: int) -> List[ValidationIssue]:
+    return [
+        ValidationIssue(offset + i, columns.names[i], "level",
+                        f"Level {level} is outside 1-{MAX_LEVEL}")
+        for i, level in enumerate(columns.level)
+        if not 1 <= level <= MAX_LEVEL
+    ]
+
+def _check_hit_points(columns: RosterColumns, offset: int) -> List[ValidationIssue]:
+    issues = []
+    for i, (hp, max_hp) in enumerate(zip(columns.hit_points, columns.max_hit_points)):
+        if max_hp < 1:
+            issues.append(ValidationIssue(offset + i, columns.names[i], "max_hit_points",
+                                          f"Maximum hit points {max_hp} must be at least 1"))
+        elif hp > max_hp:
+            issues.append(ValidationIssue(offset + i, columns.names[i], "hit_points",
+                                          f"Hit points {hp} exceed maximum {max_hp}"))
+        if hp < 0:
+            issues.append(ValidationIssue(offset + i, columns.names[i], "hit_points",
+                                          f"Hit points {hp} cannot be negative"))
+    return issues
+
+def _check_attunement(columns: RosterColumns, offset: int) -> List[ValidationIssue]:
+    return [
+        ValidationIssue(offset + i, columns.names[i], "attunement",
+                        f"Attuned to {count} items (maximum {MAX_ATTUNED_ITEMS})")
+        for i, count in enumerate(columns.attuned_items)
+        if count > MAX_ATTUNED_ITEMS
+    ]
+
+def _check_armor_strength(columns: RosterColumns, offset: int) -> List[ValidationIssue]:
+    strength = columns.abilities[AbilityType.STRENGTH.value]
+    return [
+        ValidationIssue(offset + i, columns.names[i], "armor_strength",
+                        f"Equipped armor requires Strength {required} (has {score}); "
+                        f"speed is reduced by 10 feet",
+                        Severity.WARNING)
+        for i, (required, score) in enumerate(zip(columns.armor_min_strength, strength))
+        if score < required
+    ]
+
+def _check_equipment_slots(columns: RosterColumns, offset: int) -> List[ValidationIssue]:
+    return [
+        ValidationIssue(offset + i, columns.names[i], "equipment_slot", problem)
+        for i, problems in enumerate(columns.slot_problems)
+        for problem in problems
+    ]
+
+ROSTER_CHECKS = [
+    _check_ability_scores,
+    _check_level,
+    _check_hit_points,
+    _check_attunement,
+    _check_armor_strength,
+    _check_equipment_slots,
+]
+
+def _run_checks(columns: RosterColumns, offset: int = 0) -> List[ValidationIssue]:
+    """Run every check over a block of columns"""
+    issues = []
+    for check in ROSTER_CHECKS:
+        issues.extend(check(columns, offset))
+    return issues
+
+def validate_roster(characters: Sequence[Character], workers: Optional[int] = None,
+                    shard_size: int = DEFAULT_SHARD_SIZE) -> ValidationReport:
+    """
+    Validate a roster of characters against the D&D rules
+
+    Args:
+        characters: Characters to validate
+        workers: Number of worker processes; None or 1 checks in-process
+        shard_size: Number of characters per worker shard
+
+    Returns:
+        ValidationReport with issues ordered by roster index
+    """
+    columns = RosterColumns.from_characters(characters)
+    total = len(columns)
+
+    if workers and workers > 1 and total > shard_size:
+        offsets = list(range(0, total, shard_size))
+        shards = [columns.slice(start, start + shard_size) for start in offsets]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_run_checks, shards, offsets))
+        issues = [issue for shard_issues in results for issue in shard_issues]
+    else:
+        issues = _run_checks(columns)
+
+    issues.sort(key=lambda issue: issue.index)
+    return ValidationReport(checked=total, issues=issues)
+
+def validate_character(character: Character) -> List[ValidationIssue]:
+    """Validate a single character"""
+    return validate_roster([character]).issues
@@ -0,0 +1,58 @@
+"""
+Dice expressions
+
+Parsing, averaging and batch rolling of expressions such as "2d6" or "1d4+1".
+"""
+import random
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+_DICE = re.compile(r"^\s*(\d*)d(\d+)\s*([+-]\s*\d+)?\s*$")
+
+@lru_cache(maxsize=256)
+def parse_dice(dice: str) -> Tuple[int, int, int]:
+    """
+    Split a dice expression into its parts
+
+    Raises:
+        ValueError: If the expression is not of the form NdS+M
+
+    Returns:
+        (number of dice, sides, modifier)
+    """
+    match = _DICE.match(dice)
+    if not match:
+        raise ValueError(f"Invalid dice expression: {dice}")
+    count = int(match.group(1) or 1)
+    sides = int(match.group(2))
+    modifier = int(match.group(3).replace(" ", "")) if match.group(3) else 0
+    return count, sides, modifier
+
+def average_roll(dice: str) -> float:
+    """Expected total of a dice expression such as "2d6" or "1d8+1" """
+    count, sides, modifier = parse_dice(dice)
+    return count * (sides + 1) / 2 + modifier
+
+def roll_batch(expressions: Sequence[str], rng: Optional[random.Random] = None) -> List[int]:
+    """
+    Roll many dice expressions at once
+
+    Identical expressions are grouped so each group's dice come from a single
+    draw, however many entries share it.
+
+    Returns:
+        The total of each expression, in order
+    """
+    rng = rng or random
+    groups: Dict[str, List[int]] = {}
+    for index, dice in enumerate(expressions):
+        groups.setdefault(dice, []).append(index)
+
+    totals = [0] * len(expressions)
+    for dice, indexes in groups.items():
+        count, sides, modifier = parse_dice(dice)
+        faces = rng.choices(range(1, sides + 1), k=count * len(indexes))
+        for n, index in enumerate(indexes):
+            totals[index] = sum(faces[n * count:(n + 1) * count]) + modifier
+    return totals
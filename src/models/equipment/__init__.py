@@ -5,6 +5,26 @@ from .weapons import Weapon, WeaponCategory, DamageType, WeaponProperty, ALL_WEA
 from .armor import Armor, ArmorCategory, Shield, ALL_ARMOR
 from .inventory import Inventory, InventoryItem, EquipmentSlot, Currency
 from .magic_items import MagicItem, MagicWeapon, MagicArmor, WondrousItem, ALL_MAGIC_ITEMS
+from importlib import import_module
+
+# Imported on first access, so importing the package stays cheap
+_LAZY_EXPORTS = {
+    'EquipmentCatalog': 'catalog', 'EquipmentQuery': 'catalog', 'get_default_catalog': 'catalog',
+    'Ledger': 'ledger', 'PartyTreasury': 'ledger', 'Transaction': 'ledger',
+    'InsufficientFundsError': 'ledger',
+    'SharedInventory': 'shared', 'transfer_items': 'shared',
+    'InventoryTransaction': 'transaction', 'TransactionError': 'transaction',
+    'Modifier': 'modifiers', 'ModifierStack': 'modifiers', 'ModifierType': 'modifiers',
+}
+
+def __getattr__(name):
+    try:
+        module = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     # Base classes
@@ -21,4 +41,19 @@ __all__ = [
     
     # Magic Items
     'MagicItem', 'MagicWeapon', 'MagicArmor', 'WondrousItem', 'ALL_MAGIC_ITEMS',
+
+    # Catalog
+    'EquipmentCatalog', 'EquipmentQuery', 'get_default_catalog',
+
+    # Ledger
+    'Ledger', 'PartyTreasury', 'Transaction', 'InsufficientFundsError',
+
+    # Shared inventories
+    'SharedInventory', 'transfer_items',
+
+    # Transactions
+    'InventoryTransaction', 'TransactionError',
+
+    # Modifiers
+    'Modifier', 'ModifierStack', 'ModifierType',
 ]
\ No newline at end of file
@@ -5,6 +5,7 @@ from dataclasses import dataclass, field
 from typing import Optional, Dict, Any
 from enum import Enum
 from .base import Equipment, EquipmentType, Rarity
+from .lazy_catalog import CombinedCatalog, LazyCatalog
 
 class ArmorCategory(Enum):
     LIGHT = "light"
@@ -12,7 +13,7 @@ class ArmorCategory(Enum):
     HEAVY = "heavy"
     SHIELD = "shield"
 
-@dataclass
+@dataclass(frozen=True)
 class Armor(Equipment):
     """D&D 5e armor implementation"""
     category: ArmorCategory = ArmorCategory.LIGHT
@@ -22,9 +23,11 @@ class Armor(Equipment):
     stealth_disadvantage: bool = False
     magic_bonus: int = 0
     
+    __hash__ = Equipment.__hash__
+    
     def __post_init__(self):
         super().__post_init__()
-        self.type = EquipmentType.ARMOR
+        self._set("type", EquipmentType.ARMOR)
     
     def calculate_ac(self, dex_modifier: int) -> int:
         """Calculate AC with this armor equipped"""
@@ -57,10 +60,12 @@ class Armor(Equipment):
     def is_shield(self) -> bool:
         return self.category == ArmorCategory.SHIELD
 
-@dataclass
+@dataclass(frozen=True)
 class Shield(Armor):
     """Shield implementation"""
     
+    __hash__ = Equipment.__hash__
+    
     def __init__(self, name: str = "Shield", **kwargs):
         super().__init__(
             name=name,
@@ -70,14 +75,18 @@ class Shield(Armor):
             **kwargs
         )
     
+    def __post_init__(self):
+        super().__post_init__()
+        self._set("type", EquipmentType.SHIELD)
+    
     def calculate_ac_bonus(self) -> int:
         """Shields provide AC bonus, not base AC"""
         return self.base_ac + self.magic_bonus
 
 
 # Predefined armor from D&D 5e SRD
-LIGHT_ARMOR = {
-    "Padded": Armor(
+LIGHT_ARMOR = LazyCatalog(Armor, {
+    "Padded": dict(
         name="Padded",
         category=ArmorCategory.LIGHT,
         base_ac=11,
@@ -86,7 +95,7 @@ LIGHT_ARMOR = {
         weight=8.0,
         value=500  # 5 gp
     ),
-    "Leather": Armor(
+    "Leather": dict(
         name="Leather",
         category=ArmorCategory.LIGHT,
         base_ac=11,
@@ -94,7 +103,7 @@ LIGHT_ARMOR = {
         weight=10.0,
         value=1000  # 10 gp
     ),
-    "Studded leather": Armor(
+    "Studded leather": dict(
         name="Studded leather",
         category=ArmorCategory.LIGHT,
         base_ac=12,
@@ -102,10 +111,10 @@ LIGHT_ARMOR = {
         weight=13.0,
         value=4500  # 45 gp
     ),
-}
+})
 
-MEDIUM_ARMOR = {
-    "Hide": Armor(
+MEDIUM_ARMOR = LazyCatalog(Armor, {
+    "Hide": dict(
         name="Hide",
         category=ArmorCategory.MEDIUM,
         base_ac=12,
@@ -113,7 +122,7 @@ MEDIUM_ARMOR = {
         weight=12.0,
         value=1000  # 10 gp
     ),
-    "Chain shirt": Armor(
+    "Chain shirt": dict(
         name="Chain shirt",
         category=ArmorCategory.MEDIUM,
         base_ac=13,
@@ -121,7 +130,7 @@ MEDIUM_ARMOR = {
         weight=20.0,
         value=5000  # 50 gp
     ),
-    "Scale mail": Armor(
+    "Scale mail": dict(
         name="Scale mail",
         category=ArmorCategory.MEDIUM,
         base_ac=14,
@@ -130,7 +139,7 @@ MEDIUM_ARMOR = {
         weight=45.0,
         value=5000  # 50 gp
     ),
-    "Breastplate": Armor(
+    "Breastplate": dict(
         name="Breastplate",
         category=ArmorCategory.MEDIUM,
         base_ac=14,
@@ -138,7 +147,7 @@ MEDIUM_ARMOR = {
         weight=20.0,
         value=40000  # 400 gp
     ),
-    "Half plate": Armor(
+    "Half plate": dict(
         name="Half plate",
         category=ArmorCategory.MEDIUM,
         base_ac=15,
@@ -147,10 +156,10 @@ MEDIUM_ARMOR = {
         weight=40.0,
         value=75000  # 750 gp
     ),
-}
+})
 
-HEAVY_ARMOR = {
-    "Ring mail": Armor(
+HEAVY_ARMOR = LazyCatalog(Armor, {
+    "Ring mail": dict(
         name="Ring mail",
         category=ArmorCategory.HEAVY,
         base_ac=14,
@@ -159,7 +168,7 @@ HEAVY_ARMOR = {
         weight=40.0,
         value=3000  # 30 gp
     ),
-    "Chain mail": Armor(
+    "Chain mail": dict(
         name="Chain mail",
         category=ArmorCategory.HEAVY,
         base_ac=16,
@@ -169,7 +178,7 @@ HEAVY_ARMOR = {
         weight=55.0,
         value=7500  # 75 gp
     ),
-    "Splint": Armor(
+    "Splint": dict(
         name="Splint",
         category=ArmorCategory.HEAVY,
         base_ac=17,
@@ -179,7 +188,7 @@ HEAVY_ARMOR = {
         weight=60.0,
         value=200000  # 200 gp
     ),
-    "Plate": Armor(
+    "Plate": dict(
         name="Plate",
         category=ArmorCategory.HEAVY,
         base_ac=18,
@@ -189,20 +198,20 @@ HEAVY_ARMOR = {
         weight=65.0,
         value=150000  # 1500 gp
     ),
-}
+})
 
-SHIELDS = {
-    "Shield": Shield(
+SHIELDS = LazyCatalog(Shield, {
+    "Shield": dict(
         name="Shield",
         weight=6.0,
         value=1000  # 10 gp
     ),
-}
+})
 
 # Combined armor database
-ALL_ARMOR = {
-    **LIGHT_ARMOR,
-    **MEDIUM_ARMOR,
-    **HEAVY_ARMOR,
-    **SHIELDS,
-}
\ No newline at end of file
+ALL_ARMOR = CombinedCatalog(
+    LIGHT_ARMOR,
+    MEDIUM_ARMOR,
+    HEAVY_ARMOR,
+    SHIELDS,
+)
\ No newline at end of file
@@ -1,7 +1,7 @@
 """
 Equipment model definitions
 """
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import List, Optional, Dict, Any
 from enum import Enum
 
@@ -34,12 +34,37 @@ class Rarity(Enum):
     LEGENDARY = "legendary"
     ARTIFACT = "artifact"
 
-@dataclass
+class FrozenDict(dict):
+    """Read-only dict for the mapping fields of shared templates"""
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(f"'{type(self).__name__}' object is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+def freeze(value: Any) -> Any:
+    """Read-only copy of a value: lists become tuples and dicts FrozenDicts, recursively"""
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+@dataclass(frozen=True)
 class Equipment:
-    """Base equipment item"""
+    """
+    Base equipment item
+
+    Equipment objects are immutable templates shared by every inventory that
+    holds them; per-copy state such as charges lives on InventoryItem.
+    """
     name: str
-    type: EquipmentType
-    description: str
+    type: EquipmentType = EquipmentType.ADVENTURING_GEAR
+    description: str = ""
     weight: float = 0.0
     value: int = 0  # in copper pieces
     rarity: Rarity = Rarity.COMMON
@@ -51,7 +76,23 @@ class Equipment:
         """Convert value to gold pieces"""
         return self.value / 100
 
-@dataclass
+    def __hash__(self) -> int:
+        # Lists and dicts among the fields rule out the generated hash;
+        # equal templates always share class and name
+        return hash((type(self), self.name))
+
+    def __post_init__(self):
+        """Freeze list and dict fields, which every holder of the template shares"""
+        for template_field in fields(self):
+            value = getattr(self, template_field.name)
+            if isinstance(value, (list, dict)) and not isinstance(value, FrozenDict):
+                self._set(template_field.name, freeze(value))
+
+    def _set(self, name: str, value: Any) -> None:
+        """Assign a field while a frozen template is being initialized"""
+        object.__setattr__(self, name, value)
+
+@dataclass(frozen=True)
 class Weapon(Equipment):
     """Weapon equipment"""
     weapon_type: WeaponType = WeaponType.SIMPLE_MELEE
@@ -60,10 +101,13 @@ class Weapon(Equipment):
     range_normal: Optional[int] = None
     range_long: Optional[int] = None
     
+    __hash__ = Equipment.__hash__
+    
     def __post_init__(self):
-        self.type = EquipmentType.WEAPON
+        super().__post_init__()
+        self._set("type", EquipmentType.WEAPON)
 
-@dataclass
+@dataclass(frozen=True)
 class Armor(Equipment):
     """Armor equipment"""
     armor_type: ArmorType = ArmorType.LIGHT
@@ -72,8 +116,11 @@ class Armor(Equipment):
     min_strength: Optional[int] = None
     stealth_disadvantage: bool = False
     
+    __hash__ = Equipment.__hash__
+    
     def __post_init__(self):
-        self.type = EquipmentType.ARMOR
+        super().__post_init__()
+        self._set("type", EquipmentType.ARMOR)
 
 @dataclass
 class InventoryItem:
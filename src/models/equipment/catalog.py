@@ -0,0 +1,210 @@
+"""
+Indexed equipment catalog
+
+The catalog keeps secondary indexes over every item so that questions such as
+"finesse weapons under 3 lb" or "armor with AC 16+ and no stealth
+disadvantage" are answered by intersecting small sets of names instead of
+scanning every item. Equality filters use hash indexes (value -> names);
+weight, value and armor class use sorted indexes searched with bisect.
+"""
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .armor import ALL_ARMOR, Armor
+from .base import Equipment, EquipmentType, Rarity
+from .magic_items import ALL_MAGIC_ITEMS
+from .weapons import ALL_WEAPONS, DamageType, Weapon, WeaponProperty
+
+def _weapon_properties(equipment: Equipment) -> Iterable[Any]:
+    return equipment.properties if isinstance(equipment, Weapon) else ()
+
+# Hash indexes: name -> function returning the index keys of an item
+KEY_INDEXES: Dict[str, Callable[[Equipment], Iterable[Any]]] = {
+    "type": lambda equipment: (equipment.type,),
+    "category": lambda equipment: (equipment.category,) if isinstance(equipment, (Weapon, Armor)) else (),
+    "property": _weapon_properties,
+    "damage_type": lambda equipment: (equipment.damage_type,) if isinstance(equipment, Weapon) else (),
+    "rarity": lambda equipment: (equipment.rarity,),
+    "requires_attunement": lambda equipment: (equipment.requires_attunement,),
+    "stealth_disadvantage": lambda equipment: (equipment.stealth_disadvantage,) if isinstance(equipment, Armor) else (),
+}
+
+# Sorted indexes: name -> function returning the numeric key, or None if not applicable
+RANGE_INDEXES: Dict[str, Callable[[Equipment], Optional[float]]] = {
+    "weight": lambda equipment: equipment.weight,
+    "value": lambda equipment: equipment.value,
+    "base_ac": lambda equipment: equipment.base_ac if isinstance(equipment, Armor) else None,
+}
+
+@dataclass
+class EquipmentQuery:
+    """Filters for finding catalog items; unset filters match everything"""
+    type: Optional[EquipmentType] = None
+    category: Optional[Any] = None  # WeaponCategory or ArmorCategory
+    properties: List[WeaponProperty] = field(default_factory=list)  # All must be present
+    damage_type: Optional[DamageType] = None
+    rarity: Optional[Rarity] = None
+    requires_attunement: Optional[bool] = None
+    stealth_disadvantage: Optional[bool] = None
+    min_weight: Optional[float] = None
+    max_weight: Optional[float] = None
+    min_value: Optional[int] = None  # in copper pieces
+    max_value: Optional[int] = None
+    min_ac: Optional[int] = None
+    max_ac: Optional[int] = None
+
+    def key_terms(self) -> List[Tuple[str, Any]]:
+        """Equality filters as (index, key) pairs"""
+        terms = [
+            (index, getattr(self, index))
+            for index in ("type", "category", "damage_type", "rarity",
+                          "requires_attunement", "stealth_disadvantage")
+            if getattr(self, index) is not None
+        ]
+        terms.extend(("property", prop) for prop in self.properties)
+        return terms
+
+    def range_terms(self) -> List[Tuple[str, Optional[float], Optional[float]]]:
+        """Range filters as (index, low, high) triples, bounds inclusive"""
+        ranges = [
+            ("weight", self.min_weight, self.max_weight),
+            ("value", self.min_value, self.max_value),
+            ("base_ac", self.min_ac, self.max_ac),
+        ]
+        return [term for term in ranges if term[1] is not None or term[2] is not None]
+
+class _SortedIndex:
+    """Sorted (key, name) pairs searched with bisect"""
+
+    def __init__(self):
+        self.keys: List[Tuple[float, str]] = []
+
+    def add(self, key: float, name: str) -> None:
+        insort(self.keys, (key, name))
+
+    def remove(self, key: float, name: str) -> None:
+        position = bisect_left(self.keys, (key, name))
+        if position < len(self.keys) and self.keys[position] == (key, name):
+            del self.keys[position]
+
+    def bounds(self, low: Optional[float], high: Optional[float]) -> Tuple[int, int]:
+        """Positions of the first and one past the last entry in [low, high]"""
+        start = 0 if low is None else bisect_left(self.keys, (low,))
+        # (high, chr(0x10FFFF)) sorts after every (high, name) entry
+        end = len(self.keys) if high is None else bisect_right(self.keys, (high, chr(0x10FFFF)))
+        return start, max(start, end)
+
+    def names(self, start: int, end: int) -> Set[str]:
+        return {name for _, name in self.keys[start:end]}
+
+class EquipmentCatalog:
+    """Equipment keyed by name, with secondary indexes for queries"""
+
+    def __init__(self, items: Iterable[Equipment] = ()):
+        self._items: Dict[str, Equipment] = {}
+        self._key_indexes: Dict[str, Dict[Any, Set[str]]] = {index: {} for index in KEY_INDEXES}
+        self._range_indexes: Dict[str, _SortedIndex] = {index: _SortedIndex() for index in RANGE_INDEXES}
+        for equipment in items:
+            self.add(equipment)
+
+    @classmethod
+    def from_dicts(cls, *catalogs: Dict[str, Equipment]) -> "EquipmentCatalog":
+        """Build a catalog from name -> equipment dicts such as ALL_WEAPONS"""
+        return cls(equipment for catalog in catalogs for equipment in catalog.values())
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._items
+
+    def __iter__(self) -> Iterator[Equipment]:
+        return iter(self._items.values())
+
+    def __getitem__(self, name: str) -> Equipment:
+        return self._items[name]
+
+    def get(self, name: str) -> Optional[Equipment]:
+        return self._items.get(name)
+
+    def names(self) -> List[str]:
+        return list(self._items)
+
+    def add(self, equipment: Equipment) -> None:
+        """Add an item, replacing any item with the same name"""
+        if equipment.name in self._items:
+            self.remove(equipment.name)
+        self._items[equipment.name] = equipment
+
+        for index, keys_of in KEY_INDEXES.items():
+            postings = self._key_indexes[index]
+            for key in keys_of(equipment):
+                postings.setdefault(key, set()).add(equipment.name)
+        for index, key_of in RANGE_INDEXES.items():
+            key = key_of(equipment)
+            if key is not None:
+                self._range_indexes[index].add(key, equipment.name)
+
+    def remove(self, name: str) -> Equipment:
+        """Remove an item by name and return it"""
+        equipment = self._items.pop(name)
+        for index, keys_of in KEY_INDEXES.items():
+            postings = self._key_indexes[index]
+            for key in keys_of(equipment):
+                names = postings.get(key)
+                if names is not None:
+                    names.discard(name)
+                    if not names:
+                        del postings[key]
+        for index, key_of in RANGE_INDEXES.items():
+            key = key_of(equipment)
+            if key is not None:
+                self._range_indexes[index].remove(key, name)
+        return equipment
+
+    def find_names(self, query: EquipmentQuery) -> Set[str]:
+        """Names of items matching every filter in the query"""
+        # Each filter is a candidate source; start from the most selective one
+        sources = []
+        for index, key in query.key_terms():
+            names = self._key_indexes[index].get(key, set())
+            sources.append((len(names), index, names))
+        for index, low, high in query.range_terms():
+            start, end = self._range_indexes[index].bounds(low, high)
+            sources.append((end - start, index, (start, end, low, high)))
+        if not sources:
+            return set(self._items)
+
+        sources.sort(key=lambda source: source[0])
+        _, index, first = sources[0]
+        if isinstance(first, set):
+            result = set(first)
+        else:
+            result = self._range_indexes[index].names(first[0], first[1])
+
+        for _, index, source in sources[1:]:
+            if not result:
+                break
+            if isinstance(source, set):
+                result &= source
+            else:
+                # The running result is smaller than this range, so check items directly
+                _, _, low, high = source
+                key_of = RANGE_INDEXES[index]
+                result = {
+                    name for name in result
+                    if (key := key_of(self._items[name])) is not None
+                    and (low is None or key >= low) and (high is None or key <= high)
+                }
+        return result
+
+    def find(self, query: EquipmentQuery) -> List[Equipment]:
+        """Items matching the query, ordered by name"""
+        return [self._items[name] for name in sorted(self.find_names(query))]
+
+@lru_cache(maxsize=None)
+def get_default_catalog() -> EquipmentCatalog:
+    """Catalog of all predefined SRD weapons, armor and magic items"""
+    return EquipmentCatalog.from_dicts(ALL_WEAPONS, ALL_ARMOR, ALL_MAGIC_ITEMS)
@@ -1,9 +1,11 @@
 """
 Inventory management system for D&D 5e equipment
 """
-from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any, Tuple
+import uuid
+from dataclasses import dataclass, field, fields
+from typing import List, Dict, Optional, Any, Iterable, Iterator, Tuple, Union
 from enum import Enum
+from ..events import ChangeNotifier
 from .base import Equipment, EquipmentType
 from .weapons import Weapon
 from .armor import Armor, Shield
@@ -23,9 +25,23 @@ class EquipmentSlot(Enum):
     RING_2 = "ring_2"
     BELT = "belt"
 
+def _with_slots(cls):
+    """
+    Rebuild a dataclass with __slots__, like dataclass(slots=True) on Python 3.10+
+
+    The generated methods keep their defaults in closures, so the class
+    attributes holding the defaults can be dropped in favour of slots.
+    """
+    names = tuple(template_field.name for template_field in fields(cls))
+    namespace = {key: value for key, value in cls.__dict__.items()
+                 if key not in names and key not in ("__dict__", "__weakref__")}
+    namespace["__slots__"] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+@_with_slots
 @dataclass
 class InventoryItem:
-    """Item in character inventory"""
+    """Owned copy of a shared equipment template, with its per-copy state"""
     equipment: Equipment
     quantity: int = 1
     equipped: bool = False
@@ -33,6 +49,13 @@ class InventoryItem:
     attuned: bool = False
     custom_name: Optional[str] = None  # For renamed items
     notes: str = ""
+    item_id: str = field(default_factory=lambda: uuid.uuid4().hex, compare=False)
+    charges: Optional[int] = None  # Starts from the template's charges
+    container_id: Optional[str] = None  # item_id of the container holding this item
+    
+    def __post_init__(self):
+        if self.charges is None:
+            self.charges = getattr(self.equipment, "charges", None)
     
     @property
     def display_name(self) -> str:
@@ -49,6 +72,16 @@ class InventoryItem:
         """Calculate total value in copper pieces"""
         return self.equipment.value * self.quantity
     
+    @property
+    def is_container(self) -> bool:
+        """Check if other items can be stored inside this one"""
+        return container_capacity(self.equipment) is not None
+    
+    @property
+    def is_charged(self) -> bool:
+        """Check if this copy tracks charges of its own"""
+        return getattr(self.equipment, "max_charges", None) is not None
+    
     def can_equip(self) -> bool:
         """Check if item can be equipped"""
         return self.equipment.type in [
@@ -61,6 +94,153 @@ class InventoryItem:
     def requires_attunement(self) -> bool:
         """Check if item requires attunement"""
         return self.equipment.requires_attunement
+    
+    def use_charge(self, count: int = 1) -> bool:
+        """Use charges from this copy of the item"""
+        if self.charges is None:
+            return True  # Unlimited use
+        
+        if self.charges >= count:
+            self.charges -= count
+            return True
+        return False
+    
+    def recharge(self, amount: int = None) -> None:
+        """Recharge this copy, fully or by amount"""
+        max_charges = getattr(self.equipment, "max_charges", None)
+        if self.charges is None or max_charges is None:
+            return
+        
+        if amount is None:
+            self.charges = max_charges
+        else:
+            self.charges = min(max_charges, self.charges + amount)
+
+# Items with the same stack key merge when added unequipped
+StackKey = Tuple[str, EquipmentType, Optional[str]]
+
+def stack_key(equipment: Equipment, container_id: Optional[str] = None) -> StackKey:
+    return (equipment.name, equipment.type, container_id)
+
+def _item_properties(equipment: Equipment) -> Dict[str, Any]:
+    # Weapons reuse the properties field for their list of weapon properties
+    properties = equipment.properties
+    return properties if isinstance(properties, dict) else {}
+
+def container_capacity(equipment: Equipment) -> Optional[float]:
+    """Pounds an item can hold, or None if it is not a container"""
+    return _item_properties(equipment).get("container_capacity")
+
+def has_weightless_contents(equipment: Equipment) -> bool:
+    """Check if a container's contents add nothing to the weight carried"""
+    return bool(_item_properties(equipment).get("weightless_contents"))
+
+# Running weight totals are kept in hundredths of a pound so they never drift
+WEIGHT_SCALE = 100
+
+def weight_units(equipment: Equipment) -> int:
+    """Weight of one item in hundredths of a pound"""
+    return round(equipment.weight * WEIGHT_SCALE)
+
+class ItemList:
+    """
+    Inventory items in insertion order, indexed by item_id
+
+    Membership, lookup, append and removal are O(1); iteration and
+    positional access follow the order items were added.
+    """
+
+    def __init__(self, items: Iterable[InventoryItem] = ()):
+        self._items: Dict[str, InventoryItem] = {}
+        self._positions: Dict[str, int] = {}
+        self._next_position = 0
+        self._unsorted = False  # Set when an item is put back at an earlier position
+        self._ordered: Optional[List[InventoryItem]] = None  # Cache for positional access
+        for item in items:
+            self.append(item)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[InventoryItem]:
+        if self._unsorted:
+            self._items = dict(sorted(self._items.items(), key=lambda entry: self._positions[entry[0]]))
+            self._unsorted = False
+        return iter(self._items.values())
+
+    def __contains__(self, item: object) -> bool:
+        return self._items.get(getattr(item, "item_id", None)) is item
+
+    def __getitem__(self, index: Union[int, slice]):
+        if self._ordered is None:
+            self._ordered = list(self)
+        return self._ordered[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (ItemList, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ItemList({list(self)!r})"
+
+    def get(self, item_id: str) -> Optional[InventoryItem]:
+        return self._items.get(item_id)
+
+    def position(self, item: InventoryItem) -> int:
+        """Sort key of an item's place in the list, for putting it back later"""
+        return self._positions[item.item_id]
+
+    def append(self, item: InventoryItem, position: Optional[int] = None) -> None:
+        """Add an item at the end, or back at a position it was removed from"""
+        if item.item_id in self._items:
+            raise ValueError(f"Duplicate inventory item id {item.item_id}")
+        if position is None:
+            position = self._next_position
+        self._next_position = max(self._next_position, position + 1)
+        self._unsorted = self._unsorted or position < self._next_position - 1
+        self._items[item.item_id] = item
+        self._positions[item.item_id] = position
+        self._ordered = None
+
+    def remove(self, item: InventoryItem) -> None:
+        if item not in self:
+            raise ValueError("Item is not in the inventory")
+        del self._items[item.item_id]
+        del self._positions[item.item_id]
+        self._ordered = None
+
+def _discard(index: Dict[Any, Dict[str, InventoryItem]], key: Any, item: InventoryItem) -> None:
+    """Remove an item from one bucket of an index, dropping the bucket once empty"""
+    bucket = index.get(key)
+    if bucket is not None and bucket.pop(item.item_id, None) is not None and not bucket:
+        del index[key]
+
+# Copper value of each coin, largest first
+COIN_VALUES: Tuple[Tuple[str, int], ...] = (
+    ("platinum", 1000), ("gold", 100), ("electrum", 50), ("silver", 10), ("copper", 1),
+)
+# Denominations used when making change; electrum is accepted but never handed out
+CHANGE_VALUES: Tuple[Tuple[str, int], ...] = (
+    ("platinum", 1000), ("gold", 100), ("silver", 10), ("copper", 1),
+)
+
+def make_change(copper_value: int) -> Dict[str, int]:
+    """
+    Fewest coins worth copper_value, in constant time
+
+    Every coin used for change is worth a multiple of the next smaller one,
+    so taking the largest coins first is optimal.
+
+    Raises:
+        ValueError: If copper_value is negative
+    """
+    if copper_value < 0:
+        raise ValueError(f"Cannot make change for {copper_value} cp")
+    change = {}
+    for name, value in CHANGE_VALUES:
+        change[name], copper_value = divmod(copper_value, value)
+    return change
 
 @dataclass
 class Currency:
@@ -92,70 +272,185 @@ class Currency:
         self.copper += amount
     
     def add_value_in_copper(self, copper_value: int) -> None:
-        """Add value and convert to appropriate denominations"""
-        # Convert to highest denomination possible
-        if copper_value >= 1000:
-            platinum_to_add = copper_value // 1000
-            self.platinum += platinum_to_add
-            copper_value -= platinum_to_add * 1000
-        
-        if copper_value >= 100:
-            gold_to_add = copper_value // 100
-            self.gold += gold_to_add
-            copper_value -= gold_to_add * 100
-        
-        if copper_value >= 50:
-            electrum_to_add = copper_value // 50
-            self.electrum += electrum_to_add
-            copper_value -= electrum_to_add * 50
-        
-        if copper_value >= 10:
-            silver_to_add = copper_value // 10
-            self.silver += silver_to_add
-            copper_value -= silver_to_add * 10
-        
-        self.copper += copper_value
+        """
+        Add value and convert to appropriate denominations
+
+        Raises:
+            ValueError: If copper_value is negative; use spend to take money away
+        """
+        for name, amount in make_change(copper_value).items():
+            setattr(self, name, getattr(self, name) + amount)
     
     def can_afford(self, cost_in_copper: int) -> bool:
         """Check if character can afford a purchase"""
         return self.total_copper_value >= cost_in_copper
     
     def spend(self, cost_in_copper: int) -> bool:
-        """Spend money if affordable"""
+        """
+        Spend money if affordable, using the smallest coins first and taking change
+
+        Raises:
+            ValueError: If the cost is negative
+        """
+        if cost_in_copper < 0:
+            raise ValueError(f"Cannot spend {cost_in_copper} cp")
         if not self.can_afford(cost_in_copper):
             return False
         
-        # Simple implementation: convert all to copper, subtract, then convert back
-        total_copper = self.total_copper_value - cost_in_copper
+        remaining = cost_in_copper
+        for name, value in reversed(COIN_VALUES):
+            if remaining <= 0:
+                break
+            coins = getattr(self, name)
+            paid = min(coins, -(-remaining // value))  # Round up: a coin may overpay
+            setattr(self, name, coins - paid)
+            remaining -= paid * value
         
-        # Reset all currencies
-        self.copper = self.silver = self.electrum = self.gold = self.platinum = 0
-        
-        # Convert back to denominations
-        self.add_value_in_copper(total_copper)
+        # Anything overpaid comes back as change
+        self.add_value_in_copper(-remaining)
         return True
 
 @dataclass
-class Inventory:
+class Inventory(ChangeNotifier):
     """Character inventory management"""
-    items: List[InventoryItem] = field(default_factory=list)
+    items: ItemList = field(default_factory=ItemList)
     equipped_items: Dict[EquipmentSlot, InventoryItem] = field(default_factory=dict)
     currency: Currency = field(default_factory=Currency)
     carrying_capacity_override: Optional[int] = None
+    # Unequipped items by stack key, oldest first, so stacking is a lookup
+    _stacks: Dict[StackKey, Dict[str, InventoryItem]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    # Running aggregates, updated by every mutation below so queries are O(1)
+    _weight_units: int = field(default=0, init=False, repr=False, compare=False)
+    _total_value: int = field(default=0, init=False, repr=False, compare=False)
+    _by_type: Dict[EquipmentType, Dict[str, InventoryItem]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    _attuned: Dict[str, InventoryItem] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    _by_name: Dict[str, Dict[str, InventoryItem]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    # Container tree: children by container id (None for the top level), and
+    # each container's rolled-up contents, kept current through parent pointers
+    _children: Dict[Optional[str], Dict[str, InventoryItem]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    _contents_weight: Dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    _contents_value: Dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
     
-    def add_item(self, equipment: Equipment, quantity: int = 1) -> InventoryItem:
-        """Add item to inventory"""
-        # Check if item already exists (stackable)
+    def __post_init__(self):
+        if not isinstance(self.items, ItemList):
+            self.items = ItemList(self.items)
         for item in self.items:
-            if (item.equipment.name == equipment.name and 
-                item.equipment.type == equipment.type and
-                not item.equipped):
-                item.quantity += quantity
-                return item
+            self._track(item)
+    
+    def _track(self, item: InventoryItem) -> None:
+        """Add an item to the indexes and running totals"""
+        self._index_position(item)
+        self._adjust_totals(item, item.quantity)
+        self._by_type.setdefault(item.equipment.type, {})[item.item_id] = item
+        self._by_name.setdefault(item.equipment.name.lower(), {})[item.item_id] = item
+        if item.attuned:
+            self._attuned[item.item_id] = item
+    
+    def _untrack(self, item: InventoryItem) -> None:
+        """Remove an item from the indexes and running totals"""
+        self._unindex_position(item)
+        self._adjust_totals(item, -item.quantity)
+        _discard(self._by_type, item.equipment.type, item)
+        _discard(self._by_name, item.equipment.name.lower(), item)
+        self._attuned.pop(item.item_id, None)
+    
+    def _adjust_totals(self, item: InventoryItem, quantity: int) -> None:
+        value = item.equipment.value * quantity
+        self._total_value += value
+        self._roll_up(item.container_id, weight_units(item.equipment) * quantity, value)
+    
+    def _roll_up(self, container_id: Optional[str], weight: int, value: int) -> None:
+        """Apply a change in carried weight and value to each enclosing container, O(depth)"""
+        while container_id is not None:
+            container = self.items.get(container_id)
+            if container is None:
+                break  # Container missing from loaded data; treat as top level
+            self._contents_weight[container_id] = self._contents_weight.get(container_id, 0) + weight
+            self._contents_value[container_id] = self._contents_value.get(container_id, 0) + value
+            if has_weightless_contents(container.equipment):
+                weight = 0
+            container_id = container.container_id
+        self._weight_units += weight
+    
+    def _subtree_totals(self, item: InventoryItem) -> Tuple[int, int]:
+        """Carried weight units and value of an item together with its contents"""
+        weight = weight_units(item.equipment) * item.quantity
+        if not has_weightless_contents(item.equipment):
+            weight += self._contents_weight.get(item.item_id, 0)
+        value = item.equipment.value * item.quantity + self._contents_value.get(item.item_id, 0)
+        return weight, value
+    
+    def _index_position(self, item: InventoryItem) -> None:
+        self._children.setdefault(item.container_id, {})[item.item_id] = item
+        self._index_stack(item)
+    
+    def _unindex_position(self, item: InventoryItem) -> None:
+        _discard(self._children, item.container_id, item)
+        self._unindex_stack(item)
+    
+    def _index_stack(self, item: InventoryItem) -> None:
+        # Containers and charged items never stack: each has its own contents or charges
+        if not item.equipped and not item.is_container and not item.is_charged:
+            key = stack_key(item.equipment, item.container_id)
+            self._stacks.setdefault(key, {})[item.item_id] = item
+    
+    def _unindex_stack(self, item: InventoryItem) -> None:
+        _discard(self._stacks, stack_key(item.equipment, item.container_id), item)
+    
+    def _fits(self, container: InventoryItem, weight: int) -> bool:
+        """Check if a container has room for this much more weight"""
+        capacity = container_capacity(container.equipment) * WEIGHT_SCALE
+        return self._contents_weight.get(container.item_id, 0) + weight <= capacity
+    
+    def get_item(self, item_id: str) -> Optional[InventoryItem]:
+        """Find an item by its item_id"""
+        return self.items.get(item_id)
+    
+    def add_item(self, equipment: Equipment, quantity: int = 1,
+                 item_id: Optional[str] = None,
+                 container: Optional[InventoryItem] = None) -> InventoryItem:
+        """
+        Add item to inventory, stacking onto an unequipped copy if there is one
+
+        Args:
+            item_id: Id for a newly created entry, e.g. when replaying history
+            container: Container to put the item in, or None for the top level
+
+        Raises:
+            ValueError: If the container is not in this inventory or is too full
+        """
+        container_id = None
+        if container is not None:
+            if container not in self.items or not container.is_container:
+                raise ValueError(f"{container.display_name} is not a container in this inventory")
+            if not self._fits(container, weight_units(equipment) * quantity):
+                raise ValueError(f"{container.display_name} cannot hold {quantity} x {equipment.name}")
+            container_id = container.item_id
+        
+        stack = self._stacks.get(stack_key(equipment, container_id))
+        if stack:
+            item = next(iter(stack.values()))
+            item.quantity += quantity
+            self._adjust_totals(item, quantity)
+            self._notify("item_added", item=item, equipment=equipment, quantity=quantity,
+                         container=container)
+            return item
         
         # Create new inventory item
-        new_item = InventoryItem(equipment=equipment, quantity=quantity)
+        new_item = InventoryItem(equipment=equipment, quantity=quantity, container_id=container_id)
+        if item_id is not None:
+            new_item.item_id = item_id
         self.items.append(new_item)
+        self._track(new_item)
+        self._notify("item_added", item=new_item, equipment=equipment, quantity=quantity,
+                     container=container)
         return new_item
     
     def remove_item(self, item: InventoryItem, quantity: int = None) -> bool:
@@ -164,16 +459,142 @@ class Inventory:
             return False
         
         if quantity is None or quantity >= item.quantity:
-            # Remove entire stack
+            # Remove entire stack, along with anything stored in it
+            for content in list(self._children.get(item.item_id, {}).values()):
+                self.remove_item(content)
             if item.equipped:
                 self.unequip_item(item)
             self.items.remove(item)
+            self._untrack(item)
+            removed = item.quantity
         else:
             # Remove partial quantity
             item.quantity -= quantity
+            self._adjust_totals(item, -quantity)
+            removed = quantity
+        
+        self._notify("item_removed", item=item, quantity=removed)
+        return True
+    
+    def _reinsert(self, item: InventoryItem, position: int) -> None:
+        """Put back a removed stack as it was, e.g. when undoing a transaction"""
+        self.items.append(item, position)
+        self._track(item)
+        if item.equipped and item.equipped_slot is not None:
+            self.equipped_items[item.equipped_slot] = item
+    
+    def set_quantity(self, item: InventoryItem, quantity: int) -> bool:
+        """Change how many of an item are held; zero or less removes it"""
+        if item not in self.items:
+            return False
+        if quantity <= 0:
+            return self.remove_item(item)
         
+        self._adjust_totals(item, quantity - item.quantity)
+        item.quantity = quantity
+        self._notify("item_quantity_changed", item=item, quantity=quantity)
         return True
     
+    def move_item(self, item: InventoryItem, container: Optional[InventoryItem],
+                  quantity: Optional[int] = None, item_id: Optional[str] = None) -> Optional[InventoryItem]:
+        """
+        Move a stack, or part of one, into a container or back to the top level
+
+        Weight and value rollups are updated along the old and new container
+        chains only, so a move costs O(depth) however large the inventory is.
+
+        Args:
+            container: Destination container, or None for the top level
+            quantity: How many to move; all of them by default
+            item_id: Id for a stack split off by the move, e.g. when replaying history
+
+        Returns:
+            The stack now holding the moved items, or None if the move is not possible
+        """
+        if item not in self.items:
+            return None
+        target_id = None
+        if container is not None:
+            if container not in self.items or not container.is_container:
+                return None
+            # A container cannot go inside itself or its own contents
+            ancestor: Optional[InventoryItem] = container
+            while ancestor is not None:
+                if ancestor is item:
+                    return None
+                ancestor = self.items.get(ancestor.container_id) if ancestor.container_id else None
+            target_id = container.item_id
+        
+        if quantity is None or quantity >= item.quantity:
+            quantity = item.quantity
+        whole = quantity == item.quantity
+        if whole and item.container_id == target_id:
+            return item
+        if not whole and self._children.get(item.item_id):
+            return None  # A container's contents cannot be split between copies
+        moving_weight = self._subtree_totals(item)[0] if whole else weight_units(item.equipment) * quantity
+        if container is not None and not self._fits(container, moving_weight):
+            return None
+        if item.equipped:
+            self.unequip_item(item)
+        
+        stack = self._stacks.get(stack_key(item.equipment, target_id))
+        if whole and not stack:
+            # Re-parent the stack with its contents
+            weight, value = self._subtree_totals(item)
+            self._roll_up(item.container_id, -weight, -value)
+            self._unindex_position(item)
+            item.container_id = target_id
+            self._index_position(item)
+            self._roll_up(target_id, weight, value)
+            moved = item
+        else:
+            if stack:
+                moved = next(iter(stack.values()))
+                moved.quantity += quantity
+                self._adjust_totals(moved, quantity)
+            else:
+                moved = InventoryItem(equipment=item.equipment, quantity=quantity,
+                                      custom_name=item.custom_name, notes=item.notes,
+                                      charges=item.charges, container_id=target_id)
+                if item_id is not None:
+                    moved.item_id = item_id
+                self.items.append(moved)
+                self._track(moved)
+            if whole:
+                self.items.remove(item)
+                self._untrack(item)
+            else:
+                item.quantity -= quantity
+                self._adjust_totals(item, -quantity)
+        
+        self._notify("item_moved", item=item, container=container, quantity=quantity, moved=moved)
+        return moved
+    
+    def get_contents(self, container: Optional[InventoryItem] = None) -> List[InventoryItem]:
+        """Items directly inside a container, or at the top level for None"""
+        return list(self._children.get(container.item_id if container else None, {}).values())
+    
+    def get_container(self, item: InventoryItem) -> Optional[InventoryItem]:
+        """The container holding an item, or None at the top level"""
+        return self.items.get(item.container_id) if item.container_id else None
+    
+    def calculate_carried_weight(self, item: InventoryItem) -> float:
+        """Weight an item adds to its holder, including its contents where they count"""
+        return self._subtree_totals(item)[0] / WEIGHT_SCALE
+    
+    def calculate_contents_weight(self, container: InventoryItem) -> float:
+        """Weight of a container's contents, which counts against its capacity"""
+        return self._contents_weight.get(container.item_id, 0) / WEIGHT_SCALE
+    
+    def calculate_contents_value(self, container: InventoryItem) -> int:
+        """Value of everything inside a container, in copper pieces"""
+        return self._contents_value.get(container.item_id, 0)
+    
+    def find_items(self, name: str) -> List[InventoryItem]:
+        """Items with this equipment name anywhere in the container tree"""
+        return list(self._by_name.get(name.lower(), {}).values())
+    
     def equip_item(self, item: InventoryItem, slot: EquipmentSlot = None) -> bool:
         """Equip an item to a slot"""
         if item not in self.items or not item.can_equip():
@@ -184,6 +605,8 @@ class Inventory:
             slot = self._determine_equipment_slot(item.equipment)
             if slot is None:
                 return False
+        if item.container_id is not None and self.move_item(item, None) is None:
+            return False  # Take it out of its container first
         
         # Check if slot is available
         if slot in self.equipped_items:
@@ -192,10 +615,12 @@ class Inventory:
             self.unequip_item(current_item)
         
         # Equip the item
+        self._unindex_stack(item)
         item.equipped = True
         item.equipped_slot = slot
         self.equipped_items[slot] = item
         
+        self._notify("item_equipped", item=item, slot=slot)
         return True
     
     def unequip_item(self, item: InventoryItem) -> bool:
@@ -207,10 +632,15 @@ class Inventory:
         if item.equipped_slot in self.equipped_items:
             del self.equipped_items[item.equipped_slot]
         
+        slot = item.equipped_slot
         item.equipped = False
         item.equipped_slot = None
         item.attuned = False  # Lose attunement when unequipped
+        self._attuned.pop(item.item_id, None)
+        if item in self.items:
+            self._index_stack(item)
         
+        self._notify("item_unequipped", item=item, slot=slot)
         return True
     
     def _determine_equipment_slot(self, equipment: Equipment) -> Optional[EquipmentSlot]:
@@ -225,8 +655,20 @@ class Inventory:
             return EquipmentSlot.ARMOR
         elif equipment.type == EquipmentType.SHIELD:
             return EquipmentSlot.SHIELD
-        
-        return None
+
+        # Worn items name their slot, e.g. properties={"slot": "ring"}
+        slot = _item_properties(equipment).get("slot")
+        if slot == "ring":
+            # Use the second ring slot while only the first is taken
+            if EquipmentSlot.RING_1 in self.equipped_items and EquipmentSlot.RING_2 not in self.equipped_items:
+                return EquipmentSlot.RING_2
+            return EquipmentSlot.RING_1
+        if slot is None:
+            return None
+        try:
+            return EquipmentSlot(slot)
+        except ValueError:
+            return None  # Unknown slot name, e.g. from a homebrew file
     
     def get_equipped_weapon(self, slot: EquipmentSlot = EquipmentSlot.MAIN_HAND) -> Optional[Weapon]:
         """Get equipped weapon in specified slot"""
@@ -254,7 +696,11 @@ class Inventory:
     
     def calculate_total_weight(self) -> float:
         """Calculate total weight of all items"""
-        return sum(item.total_weight for item in self.items)
+        return self._weight_units / WEIGHT_SCALE
+    
+    def calculate_total_value(self) -> int:
+        """Calculate total value of all items in copper pieces"""
+        return self._total_value
     
     def calculate_carrying_capacity(self, strength_score: int) -> int:
         """Calculate carrying capacity based on strength"""
@@ -264,18 +710,18 @@ class Inventory:
     
     def is_encumbered(self, strength_score: int) -> bool:
         """Check if character is encumbered"""
-        total_weight = self.calculate_total_weight()
         capacity = self.calculate_carrying_capacity(strength_score)
-        return total_weight > capacity
+        return self._weight_units > capacity * WEIGHT_SCALE
     
     def get_encumbrance_level(self, strength_score: int) -> str:
         """Get encumbrance level description"""
-        total_weight = self.calculate_total_weight()
-        capacity = self.calculate_carrying_capacity(strength_score)
+        # Compared in integer weight units: weight <= capacity * 5/6
+        weight = self._weight_units
+        capacity = self.calculate_carrying_capacity(strength_score) * WEIGHT_SCALE
         
-        if total_weight <= capacity * 5 / 6:
+        if weight * 6 <= capacity * 5:
             return "Unencumbered"
-        elif total_weight <= capacity:
+        elif weight <= capacity:
             return "Encumbered"
         else:
             return "Heavily Encumbered"
@@ -296,21 +742,57 @@ class Inventory:
         
         return ac
     
+    def rebind_templates(self, templates: Dict[Equipment, Equipment]) -> List[InventoryItem]:
+        """
+        Point items at replacement templates, e.g. after a homebrew item is edited
+
+        Args:
+            templates: Old template -> new template
+
+        Returns:
+            Items whose template changed
+        """
+        rebound = []
+        for item in self.items:
+            replacement = templates.get(item.equipment)
+            if replacement is not None and replacement is not item.equipment:
+                # The contents stay put; only whether they count toward weight can change
+                contents = self._contents_weight.get(item.item_id, 0)
+                counted = 0 if has_weightless_contents(item.equipment) else contents
+                self._untrack(item)
+                item.equipment = replacement
+                self._track(item)
+                if has_weightless_contents(replacement):
+                    self._roll_up(item.container_id, -counted, 0)
+                else:
+                    self._roll_up(item.container_id, contents - counted, 0)
+                rebound.append(item)
+        if rebound:
+            self._notify("templates_changed", items=rebound)
+        return rebound
+    
     def get_items_by_type(self, equipment_type: EquipmentType) -> List[InventoryItem]:
         """Get all items of a specific type"""
-        return [item for item in self.items if item.equipment.type == equipment_type]
+        return list(self._by_type.get(equipment_type, {}).values())
+    
+    def count_items_by_type(self, equipment_type: EquipmentType) -> int:
+        """Count inventory entries of a specific type"""
+        return len(self._by_type.get(equipment_type, ()))
     
     def get_attuned_items(self) -> List[InventoryItem]:
         """Get all attuned items"""
-        return [item for item in self.items if item.attuned]
+        return list(self._attuned.values())
+    
+    @property
+    def attuned_count(self) -> int:
+        return len(self._attuned)
     
     def can_attune_item(self, item: InventoryItem) -> bool:
         """Check if character can attune to item (max 3 attuned items)"""
         if not item.requires_attunement():
             return False
         
-        attuned_count = len(self.get_attuned_items())
-        return attuned_count < 3
+        return self.attuned_count < 3
     
     def attune_item(self, item: InventoryItem) -> bool:
         """Attune to an item"""
@@ -318,6 +800,8 @@ class Inventory:
             return False
         
         item.attuned = True
+        self._attuned[item.item_id] = item
+        self._notify("item_attuned", item=item)
         return True
     
     def unattune_item(self, item: InventoryItem) -> bool:
@@ -326,4 +810,47 @@ class Inventory:
             return False
         
         item.attuned = False
-        return True
\ No newline at end of file
+        self._attuned.pop(item.item_id, None)
+        self._notify("item_unattuned", item=item)
+        return True
+    
+    def use_charge(self, item: InventoryItem, count: int = 1) -> bool:
+        """Use charges from an item, recording the change"""
+        if not item.use_charge(count):
+            return False
+        if item.charges is not None:
+            self._notify("item_charges_changed", item=item, charges=item.charges)
+        return True
+    
+    def recharge_item(self, item: InventoryItem, amount: int = None) -> None:
+        """Recharge an item, fully or by amount, recording the change"""
+        before = item.charges
+        item.recharge(amount)
+        if item.charges != before:
+            self._notify("item_charges_changed", item=item, charges=item.charges)
+    
+    def spend(self, cost_in_copper: int) -> bool:
+        """
+        Spend money from the purse if affordable, recording the new coins
+
+        Raises:
+            ValueError: If the cost is negative
+        """
+        if not self.currency.spend(cost_in_copper):
+            return False
+        self._notify_currency()
+        return True
+    
+    def add_value_in_copper(self, copper_value: int) -> None:
+        """
+        Add money to the purse, recording the new coins
+
+        Raises:
+            ValueError: If copper_value is negative
+        """
+        self.currency.add_value_in_copper(copper_value)
+        self._notify_currency()
+    
+    def _notify_currency(self) -> None:
+        coins = {name: getattr(self.currency, name) for name in Currency.__dataclass_fields__}
+        self._notify("currency_changed", coins=coins)
@@ -0,0 +1,78 @@
+"""
+Read-only catalogs that build their entries on first access
+
+Predefined equipment is declared as keyword arguments rather than instances,
+so importing the equipment package does not construct every item. Each entry
+is built once, the first time it is looked up, and the same instance is
+returned afterwards.
+"""
+from typing import Any, Callable, Dict, Generic, Iterator, Mapping, TypeVar
+
+T = TypeVar("T")
+
+class LazyCatalog(Mapping[str, T], Generic[T]):
+    """Mapping of name -> item whose items are built on first access"""
+
+    def __init__(self, factory: Callable[..., T], specs: Dict[str, Dict[str, Any]]):
+        """
+        Args:
+            factory: Class or function called with an entry's keyword arguments
+            specs: Keyword arguments for each entry, keyed by name
+        """
+        self._factory = factory
+        self._specs = specs
+        self._built: Dict[str, T] = {}
+
+    def __getitem__(self, name: str) -> T:
+        try:
+            return self._built[name]
+        except KeyError:
+            pass
+        item = self._built[name] = self._factory(**self._specs[name])
+        return item
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._specs
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._specs)
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    def __repr__(self) -> str:
+        name = getattr(self._factory, "__name__", repr(self._factory))
+        return f"LazyCatalog({name}, {list(self._specs)!r})"
+
+    def is_built(self, name: str) -> bool:
+        """Check whether an entry has been constructed yet"""
+        return name in self._built
+
+class CombinedCatalog(Mapping[str, T], Generic[T]):
+    """Union of catalogs, like {**a, **b}, without building any entries"""
+
+    def __init__(self, *catalogs: Mapping[str, T]):
+        # Later catalogs win on duplicate names, as with dict unpacking
+        self._owners: Dict[str, Mapping[str, T]] = {
+            name: catalog for catalog in catalogs for name in catalog
+        }
+
+    def __getitem__(self, name: str) -> T:
+        return self._owners[name][name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._owners
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._owners)
+
+    def __len__(self) -> int:
+        return len(self._owners)
+
+    def __repr__(self) -> str:
+        return f"CombinedCatalog({list(self._owners)!r})"
+
+    def is_built(self, name: str) -> bool:
+        """Check whether an entry has been constructed yet"""
+        owner = self._owners[name]
+        return not hasattr(owner, "is_built") or owner.is_built(name)
@@ -0,0 +1,234 @@
+"""
+Currency ledger and party treasury
+
+Money is tracked as integer copper amounts in an append-only ledger of
+transactions. Running balances make the current balance O(1); a checkpoint
+of all balances is cached every CHECKPOINT_INTERVAL transactions, so the
+balance at any earlier point is the nearest checkpoint plus a short replay.
+Batches (such as a loot split) are validated as a whole and appended
+together, or not at all.
+"""
+import threading
+import time
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+from .inventory import Currency, Inventory, make_change
+
+# Money paid in or out of the treasury goes through an inventory, which
+# records the change for its listeners (such as the journal), or a bare Currency
+Purse = Union[Inventory, Currency]
+
+# Transactions between cached balance checkpoints
+CHECKPOINT_INTERVAL = 256
+
+class InsufficientFundsError(ValueError):
+    """Raised when a transaction would overdraw an account"""
+
+    def __init__(self, account: str, balance: int, amount: int):
+        self.account = account
+        self.balance = balance
+        self.amount = amount
+        super().__init__(f"{account} has {balance} cp and cannot pay {amount} cp")
+
+@dataclass(frozen=True)
+class Transaction:
+    """One posting to one account"""
+    seq: int
+    account: str
+    amount: int  # in copper pieces; negative for withdrawals
+    memo: str = ""
+    batch: int = 0  # Postings made together share a batch number
+    timestamp: float = 0.0
+
+def _require_positive(amount: int) -> None:
+    if amount <= 0:
+        raise ValueError(f"Amount must be positive, got {amount} cp")
+
+def split_evenly(amount: int, shares: int) -> List[int]:
+    """
+    Divide copper into near-equal shares; the first shares get the odd pieces
+
+    Raises:
+        ValueError: If there are no shares
+    """
+    if shares <= 0:
+        raise ValueError(f"Cannot split {amount} cp into {shares} shares")
+    base, extra = divmod(amount, shares)
+    return [base + 1 if i < extra else base for i in range(shares)]
+
+class Ledger:
+    """Append-only, thread-safe record of copper movements between accounts"""
+
+    def __init__(self, checkpoint_interval: int = CHECKPOINT_INTERVAL):
+        self.checkpoint_interval = checkpoint_interval
+        self._transactions: List[Transaction] = []
+        self._balances: Dict[str, int] = {}
+        # Balances after the first _checkpoint_seqs[i] transactions
+        self._checkpoint_seqs: List[int] = [0]
+        self._checkpoints: List[Dict[str, int]] = [{}]
+        self._batches = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._transactions)
+
+    def balance(self, account: str) -> int:
+        """Current balance of an account in copper pieces"""
+        return self._balances.get(account, 0)
+
+    def balances(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._balances)
+
+    def post(self, account: str, amount: int, memo: str = "") -> Transaction:
+        """Deposit (positive) or withdraw (negative) copper"""
+        return self.post_batch([(account, amount)], memo)[0]
+
+    def post_batch(self, entries: Iterable[Tuple[str, int]], memo: str = "") -> List[Transaction]:
+        """
+        Post several transactions as one unit
+
+        Raises:
+            InsufficientFundsError: If any account would go below zero; nothing is posted
+        """
+        entries = list(entries)
+        with self._lock:
+            net: Dict[str, int] = {}
+            for account, amount in entries:
+                net[account] = net.get(account, 0) + amount
+            for account, amount in net.items():
+                if self.balance(account) + amount < 0:
+                    raise InsufficientFundsError(account, self.balance(account), -amount)
+
+            self._batches += 1
+            now = time.time()
+            posted = []
+            for account, amount in entries:
+                transaction = Transaction(len(self._transactions), account, amount, memo, self._batches, now)
+                self._transactions.append(transaction)
+                self._balances[account] = self._balances.get(account, 0) + amount
+                posted.append(transaction)
+                if len(self._transactions) % self.checkpoint_interval == 0:
+                    self._checkpoint_seqs.append(len(self._transactions))
+                    self._checkpoints.append(dict(self._balances))
+            return posted
+
+    def transfer(self, source: str, destination: str, amount: int, memo: str = "") -> List[Transaction]:
+        """
+        Move copper from one account to another
+
+        Raises:
+            ValueError: If the amount is not positive
+        """
+        _require_positive(amount)
+        return self.post_batch([(source, -amount), (destination, amount)], memo)
+
+    def split(self, source: str, accounts: Sequence[str], amount: Optional[int] = None,
+              memo: str = "") -> Dict[str, int]:
+        """
+        Share copper from one account among several in a single batch
+
+        Args:
+            amount: Copper to share; the whole source balance by default
+
+        Returns:
+            Copper received by each account
+
+        Raises:
+            ValueError: If there are no accounts, or an amount is given and is not positive
+        """
+        if not accounts:
+            raise ValueError("No accounts to split between")
+        with self._lock:
+            if amount is None:
+                amount = self.balance(source)
+                if amount == 0:
+                    return {account: 0 for account in accounts}
+            _require_positive(amount)
+            shares = dict(zip(accounts, split_evenly(amount, len(accounts))))
+            self.post_batch([(source, -amount), *shares.items()], memo)
+            return shares
+
+    def balance_at(self, account: str, seq: int) -> int:
+        """Balance of an account after the first seq transactions"""
+        with self._lock:
+            index = bisect_right(self._checkpoint_seqs, seq) - 1
+            start, balances = self._checkpoint_seqs[index], self._checkpoints[index]
+            balance = balances.get(account, 0)
+            for transaction in self._transactions[start:seq]:
+                if transaction.account == account:
+                    balance += transaction.amount
+            return balance
+
+    def history(self, account: Optional[str] = None) -> Iterator[Transaction]:
+        """Transactions in posting order, optionally for one account"""
+        with self._lock:
+            transactions = list(self._transactions)
+        return (t for t in transactions if account is None or t.account == account)
+
+class PartyTreasury:
+    """Shared party funds kept on a ledger, paid out into members' purses"""
+
+    def __init__(self, ledger: Optional[Ledger] = None, account: str = "treasury"):
+        self.ledger = ledger or Ledger()
+        self.account = account
+
+    @property
+    def balance(self) -> int:
+        """Treasury balance in copper pieces"""
+        return self.ledger.balance(self.account)
+
+    def coins(self) -> Currency:
+        """The balance as the fewest coins"""
+        return Currency(**make_change(self.balance))
+
+    def deposit(self, amount: int, memo: str = "", purse: Optional[Purse] = None) -> bool:
+        """
+        Add copper to the treasury, paid from a member's purse if one is given
+
+        Raises:
+            ValueError: If the amount is not positive
+        """
+        _require_positive(amount)
+        if purse is not None and not purse.spend(amount):
+            return False
+        self.ledger.post(self.account, amount, memo)
+        return True
+
+    def withdraw(self, amount: int, memo: str = "", purse: Optional[Purse] = None) -> bool:
+        """
+        Take copper out of the treasury if there is enough, into a purse if one is given
+
+        Raises:
+            ValueError: If the amount is not positive
+        """
+        _require_positive(amount)
+        try:
+            self.ledger.post(self.account, -amount, memo)
+        except InsufficientFundsError:
+            return False
+        if purse is not None:
+            purse.add_value_in_copper(amount)
+        return True
+
+    def distribute(self, purses: Mapping[str, Purse], amount: Optional[int] = None,
+                   memo: str = "") -> Dict[str, int]:
+        """
+        Split treasury funds evenly among members and add each share to their purse
+
+        Args:
+            purses: Each member's inventory (or bare currency), by ledger account
+            amount: Copper to split; the whole balance by default
+
+        Returns:
+            Copper given to each member
+
+        Raises:
+            ValueError: If there are no purses, or an amount is given and is not positive
+        """
+        shares = self.ledger.split(self.account, list(purses), amount, memo)
+        for member, share in shares.items():
+            purses[member].add_value_in_copper(share)
+        return shares
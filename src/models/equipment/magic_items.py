@@ -5,6 +5,7 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 from enum import Enum
 from .base import Equipment, EquipmentType, Rarity
+from .lazy_catalog import CombinedCatalog, LazyCatalog
 from .weapons import Weapon, WeaponCategory, DamageType, WeaponProperty
 from .armor import Armor, ArmorCategory
 
@@ -18,7 +19,7 @@ class MagicSchool(Enum):
     NECROMANCY = "necromancy"
     TRANSMUTATION = "transmutation"
 
-@dataclass
+@dataclass(frozen=True)
 class MagicProperty:
     """Magic property that can be applied to items"""
     name: str
@@ -27,55 +28,39 @@ class MagicProperty:
     charges: Optional[int] = None
     recharge: Optional[str] = None  # "dawn", "1d6+4", etc.
 
-@dataclass
+@dataclass(frozen=True)
 class MagicItem(Equipment):
     """Base magic item implementation"""
     magic_bonus: int = 0
     magic_properties: List[MagicProperty] = field(default_factory=list)
     spell_effects: List[str] = field(default_factory=list)
-    charges: Optional[int] = None
+    charges: Optional[int] = None  # Charges a newly acquired copy starts with
     max_charges: Optional[int] = None
     recharge_dice: Optional[str] = None
     curse: Optional[str] = None
     
+    __hash__ = Equipment.__hash__
+    
     def __post_init__(self):
         super().__post_init__()
         if self.max_charges and self.charges is None:
-            self.charges = self.max_charges
-    
-    def use_charge(self, count: int = 1) -> bool:
-        """Use charges from the item"""
-        if self.charges is None:
-            return True  # Unlimited use
-        
-        if self.charges >= count:
-            self.charges -= count
-            return True
-        return False
-    
-    def recharge(self, amount: int = None) -> None:
-        """Recharge the item"""
-        if self.charges is None or self.max_charges is None:
-            return
-        
-        if amount is None:
-            self.charges = self.max_charges
-        else:
-            self.charges = min(self.max_charges, self.charges + amount)
+            self._set("charges", self.max_charges)
     
     def is_cursed(self) -> bool:
         """Check if item is cursed"""
         return self.curse is not None
 
-@dataclass
+@dataclass(frozen=True)
 class MagicWeapon(Weapon, MagicItem):
     """Magic weapon implementation"""
     
+    __hash__ = Equipment.__hash__
+    
     def __post_init__(self):
         Weapon.__post_init__(self)
         MagicItem.__post_init__(self)
         if self.magic_bonus > 0:
-            self.rarity = self._determine_rarity_by_bonus()
+            self._set("rarity", self._determine_rarity_by_bonus())
     
     def _determine_rarity_by_bonus(self) -> Rarity:
         """Determine rarity based on magic bonus"""
@@ -87,26 +72,18 @@ class MagicWeapon(Weapon, MagicItem):
             return Rarity.VERY_RARE
         else:
             return Rarity.LEGENDARY
-    
-    def calculate_attack_bonus(self, ability_modifier: int, proficiency_bonus: int, is_proficient: bool = True) -> int:
-        """Calculate attack roll bonus including magic bonus"""
-        base_bonus = super().calculate_attack_bonus(ability_modifier, proficiency_bonus, is_proficient)
-        return base_bonus + self.magic_bonus
-    
-    def calculate_damage_bonus(self, ability_modifier: int) -> int:
-        """Calculate damage roll bonus including magic bonus"""
-        base_bonus = super().calculate_damage_bonus(ability_modifier)
-        return base_bonus + self.magic_bonus
 
-@dataclass
+@dataclass(frozen=True)
 class MagicArmor(Armor, MagicItem):
     """Magic armor implementation"""
     
+    __hash__ = Equipment.__hash__
+    
     def __post_init__(self):
         Armor.__post_init__(self)
         MagicItem.__post_init__(self)
         if self.magic_bonus > 0:
-            self.rarity = self._determine_rarity_by_bonus()
+            self._set("rarity", self._determine_rarity_by_bonus())
     
     def _determine_rarity_by_bonus(self) -> Rarity:
         """Determine rarity based on magic bonus"""
@@ -118,24 +95,21 @@ class MagicArmor(Armor, MagicItem):
             return Rarity.VERY_RARE
         else:
             return Rarity.LEGENDARY
-    
-    def calculate_ac(self, dex_modifier: int) -> int:
-        """Calculate AC including magic bonus"""
-        base_ac = super().calculate_ac(dex_modifier)
-        return base_ac + self.magic_bonus
 
-@dataclass
+@dataclass(frozen=True)
 class WondrousItem(MagicItem):
     """Wondrous magic item implementation"""
     
+    __hash__ = Equipment.__hash__
+    
     def __post_init__(self):
         super().__post_init__()
-        self.type = EquipmentType.WONDROUS_ITEM
+        self._set("type", EquipmentType.WONDROUS_ITEM)
 
 
 # Predefined magic items
-MAGIC_WEAPONS = {
-    "Longsword +1": MagicWeapon(
+MAGIC_WEAPONS = LazyCatalog(MagicWeapon, {
+    "Longsword +1": dict(
         name="Longsword +1",
         category=WeaponCategory.MARTIAL_MELEE,
         damage_dice="1d8",
@@ -148,7 +122,7 @@ MAGIC_WEAPONS = {
         value=100000,  # 1000 gp
         description="A magical longsword with a +1 bonus to attack and damage rolls."
     ),
-    "Flame Tongue": MagicWeapon(
+    "Flame Tongue": dict(
         name="Flame Tongue",
         category=WeaponCategory.MARTIAL_MELEE,
         damage_dice="1d8",
@@ -162,7 +136,7 @@ MAGIC_WEAPONS = {
         spell_effects=["2d6 fire damage on command"],
         description="A magical sword that can burst into flames, dealing extra fire damage."
     ),
-    "Dagger +2": MagicWeapon(
+    "Dagger +2": dict(
         name="Dagger +2",
         category=WeaponCategory.SIMPLE_MELEE,
         damage_dice="1d4",
@@ -174,10 +148,10 @@ MAGIC_WEAPONS = {
         value=200000,  # 2000 gp
         description="A finely crafted dagger with a +2 bonus to attack and damage rolls."
     ),
-}
+})
 
-MAGIC_ARMOR = {
-    "Leather Armor +1": MagicArmor(
+MAGIC_ARMOR = LazyCatalog(MagicArmor, {
+    "Leather Armor +1": dict(
         name="Leather Armor +1",
         category=ArmorCategory.LIGHT,
         base_ac=11,
@@ -187,7 +161,7 @@ MAGIC_ARMOR = {
         value=500000,  # 5000 gp
         description="Well-crafted leather armor with a +1 bonus to AC."
     ),
-    "Chain Mail +2": MagicArmor(
+    "Chain Mail +2": dict(
         name="Chain Mail +2",
         category=ArmorCategory.HEAVY,
         base_ac=16,
@@ -200,7 +174,7 @@ MAGIC_ARMOR = {
         value=1000000,  # 10000 gp
         description="Masterwork chain mail with a +2 bonus to AC."
     ),
-    "Elven Chain": MagicArmor(
+    "Elven Chain": dict(
         name="Elven Chain",
         category=ArmorCategory.MEDIUM,
         base_ac=13,
@@ -212,33 +186,36 @@ MAGIC_ARMOR = {
         value=400000,  # 4000 gp
         description="Magical chain shirt that doesn't impose disadvantage on stealth checks."
     ),
-}
+})
 
-WONDROUS_ITEMS = {
-    "Bag of Holding": WondrousItem(
+WONDROUS_ITEMS = LazyCatalog(WondrousItem, {
+    "Bag of Holding": dict(
         name="Bag of Holding",
         rarity=Rarity.UNCOMMON,
         weight=15.0,
         value=400000,  # 4000 gp
-        description="A magical bag that can hold up to 500 pounds and 64 cubic feet of material."
+        description="A magical bag that can hold up to 500 pounds and 64 cubic feet of material.",
+        properties={"container_capacity": 500, "weightless_contents": True},
     ),
-    "Cloak of Elvenkind": WondrousItem(
+    "Cloak of Elvenkind": dict(
         name="Cloak of Elvenkind",
         rarity=Rarity.UNCOMMON,
         weight=1.0,
         value=500000,  # 5000 gp
         requires_attunement=True,
-        description="Grants advantage on Dexterity (Stealth) checks and Wisdom (Perception) checks."
+        description="Grants advantage on Dexterity (Stealth) checks and Wisdom (Perception) checks.",
+        properties={"slot": "cloak"},
     ),
-    "Ring of Protection": WondrousItem(
+    "Ring of Protection": dict(
         name="Ring of Protection",
         rarity=Rarity.RARE,
         weight=0.0,
         value=350000,  # 3500 gp
         requires_attunement=True,
-        description="Grants a +1 bonus to AC and saving throws."
+        description="Grants a +1 bonus to AC and saving throws.",
+        properties={"slot": "ring", "modifiers": {"armor_class": 1, "saving_throws": 1}},
     ),
-    "Boots of Speed": WondrousItem(
+    "Boots of Speed": dict(
         name="Boots of Speed",
         rarity=Rarity.RARE,
         weight=1.0,
@@ -247,13 +224,14 @@ WONDROUS_ITEMS = {
         charges=3,
         max_charges=3,
         recharge_dice="1d4",
-        description="Can be activated to double your speed for 10 minutes."
+        description="Can be activated to double your speed for 10 minutes.",
+        properties={"slot": "boots"},
     ),
-}
+})
 
 # Combined magic items database
-ALL_MAGIC_ITEMS = {
-    **MAGIC_WEAPONS,
-    **MAGIC_ARMOR,
-    **WONDROUS_ITEMS,
-}
\ No newline at end of file
+ALL_MAGIC_ITEMS = CombinedCatalog(
+    MAGIC_WEAPONS,
+    MAGIC_ARMOR,
+    WONDROUS_ITEMS,
+)
\ No newline at end of file
@@ -0,0 +1,168 @@
+"""
+Modifier stack for magic item effects
+
+Items worn by a character grant typed modifiers: a Ring of Protection adds
+1 to AC and saving throws, for instance. An item declares them in its
+properties,
+
+    properties={"slot": "ring", "modifiers": {"armor_class": 1, "saving_throws": 1}}
+
+and they are compiled into Modifier tuples once per template. A
+ModifierStack listens to an inventory and keeps a running total for each
+modifier type. When an item is equipped, attuned, unequipped or removed,
+only that item's modifiers are added or taken away, so reading a total
+never rescans the inventory. Items that require attunement count only
+while attuned. Copies of the same item don't stack: for each type, items
+of the same name contribute their highest value once.
+
+A weapon's or armor's own magic bonus is already part of its attack, damage
+and AC calculations and is not repeated on the stack.
+"""
+from dataclasses import dataclass
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+
+from ..events import ChangeNotifier
+from .base import Equipment
+from .inventory import Inventory, InventoryItem, _item_properties
+from .weapons import Weapon
+
+class ModifierType(Enum):
+    ARMOR_CLASS = "armor_class"
+    ATTACK = "attack"
+    DAMAGE = "damage"
+    SAVING_THROWS = "saving_throws"
+    SPEED = "speed"
+
+@dataclass(frozen=True)
+class Modifier:
+    """A bonus (or penalty) an item grants while it is in effect"""
+    type: ModifierType
+    value: int
+    source: str  # Name of the item granting it
+
+@lru_cache(maxsize=1024)
+def compile_modifiers(equipment: Equipment) -> Tuple[Modifier, ...]:
+    """
+    The modifiers an item template declares
+
+    Raises:
+        ValueError: If a modifier type is unknown
+    """
+    declared = _item_properties(equipment).get("modifiers", {})
+    return tuple(Modifier(ModifierType(name), value, equipment.name) for name, value in declared.items())
+
+# Inventory events after which one item's modifiers may have changed
+_ITEM_EVENTS = {"item_equipped", "item_unequipped", "item_attuned", "item_unattuned", "item_removed"}
+
+class ModifierStack(ChangeNotifier):
+    """Running modifier totals for the items in effect in one inventory"""
+
+    def __init__(self, inventory: Inventory):
+        self.inventory = inventory
+        self._active: Dict[str, Tuple[Modifier, ...]] = {}  # By item_id
+        # Values granted per (type, item name); only the highest counts
+        self._values: Dict[Tuple[ModifierType, str], List[int]] = {}
+        self._totals: Dict[ModifierType, int] = dict.fromkeys(ModifierType, 0)
+        inventory.add_listener(self._on_inventory_event)
+        self.rebuild()
+
+    def detach(self) -> None:
+        """Stop following the inventory"""
+        self.inventory.remove_listener(self._on_inventory_event)
+
+    def total(self, modifier_type: ModifierType) -> int:
+        return self._totals[modifier_type]
+
+    def totals(self) -> Dict[ModifierType, int]:
+        return dict(self._totals)
+
+    def modifiers(self) -> List[Modifier]:
+        """Every modifier currently in effect"""
+        return [modifier for modifiers in self._active.values() for modifier in modifiers]
+
+    def in_effect(self, item: InventoryItem) -> bool:
+        """Check if an item's modifiers apply: equipped, and attuned if it needs to be"""
+        return (item.equipped and item in self.inventory.items
+                and (item.attuned or not item.requires_attunement()))
+
+    def refresh(self, item: InventoryItem) -> bool:
+        """
+        Bring one item's contribution up to date
+
+        Returns:
+            Whether any total changed
+        """
+        new = compile_modifiers(item.equipment) if self.in_effect(item) else ()
+        old = self._active.get(item.item_id, ())
+        if new == old:
+            return False
+        before = dict(self._totals)
+        for modifier in old:
+            self._apply(modifier, remove=True)
+        for modifier in new:
+            self._apply(modifier)
+        if new:
+            self._active[item.item_id] = new
+        else:
+            del self._active[item.item_id]
+        if self._totals == before:
+            return False
+        self._notify("modifiers_changed", totals=self.totals())
+        return True
+
+    def rebuild(self) -> None:
+        """Recompute every total, e.g. after item flags were changed directly"""
+        self._active.clear()
+        self._values.clear()
+        self._totals = dict.fromkeys(ModifierType, 0)
+        for item in self.inventory.equipped_items.values():
+            if self.in_effect(item):
+                self._active[item.item_id] = compile_modifiers(item.equipment)
+                for modifier in self._active[item.item_id]:
+                    self._apply(modifier)
+
+    def _apply(self, modifier: Modifier, remove: bool = False) -> None:
+        key = (modifier.type, modifier.source)
+        values = self._values.setdefault(key, [])
+        before = max(values) if values else 0
+        if remove:
+            values.remove(modifier.value)
+        else:
+            values.append(modifier.value)
+        after = max(values) if values else 0
+        if not values:
+            del self._values[key]
+        self._totals[modifier.type] += after - before
+
+    def _on_inventory_event(self, event: str, payload: Dict[str, Any]) -> None:
+        if event in _ITEM_EVENTS:
+            self.refresh(payload["item"])
+        elif event == "templates_changed":
+            for item in payload["items"]:
+                self.refresh(item)
+        elif event == "transaction_committed":
+            for sub_event, sub_payload in payload["events"]:
+                self._on_inventory_event(sub_event, sub_payload)
+
+    def armor_class(self, dex_modifier: int, base_ac: int = 10) -> int:
+        """AC from equipped armor and shield plus item modifiers"""
+        return self.inventory.calculate_ac(dex_modifier, base_ac) + self._totals[ModifierType.ARMOR_CLASS]
+
+    def attack_bonus(self, weapon: Weapon, ability_modifier: int, proficiency_bonus: int,
+                     is_proficient: bool = True) -> int:
+        """Attack bonus with a weapon, including its own magic bonus and item modifiers"""
+        bonus = weapon.calculate_attack_bonus(ability_modifier, proficiency_bonus, is_proficient)
+        return bonus + self._totals[ModifierType.ATTACK]
+
+    def damage_bonus(self, weapon: Weapon, ability_modifier: int) -> int:
+        """Damage bonus with a weapon, including its own magic bonus and item modifiers"""
+        return weapon.calculate_damage_bonus(ability_modifier) + self._totals[ModifierType.DAMAGE]
+
+    def saving_throw_bonus(self, ability_modifier: int = 0, proficiency_bonus: int = 0) -> int:
+        """Saving throw bonus; pass the proficiency bonus only for proficient saves"""
+        return ability_modifier + proficiency_bonus + self._totals[ModifierType.SAVING_THROWS]
+
+    def speed(self, base_speed: int = 30) -> int:
+        return base_speed + self._totals[ModifierType.SPEED]
@@ -0,0 +1,241 @@
+"""
+Loadout optimization
+
+Finds the armor, shield and weapons from a catalog that maximize armor class
+and/or expected damage per round within a weight limit and a budget.
+
+The objective splits into an armor part (body armor AC) and a hands part
+(shield bonus plus weapon damage), so the search works on two option lists:
+1. Each list is reduced to its Pareto front: an option is dropped when
+   another is at least as good, no heavier and no more expensive. Fronts stay
+   small however large the catalog is.
+2. Armor and hands options are combined by branch-and-bound. Both lists are
+   sorted by value, so the scan stops as soon as the best remaining armor
+   plus the best hands option cannot beat the best loadout found.
+Per-weapon damage figures are memoized, since templates are hashable.
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from ..character.base import AbilityScores, AbilityType
+from ..dice import average_roll
+from .armor import Armor, Shield
+from .base import Equipment
+from .inventory import Currency
+from .weapons import Weapon, WeaponProperty
+
+DEFAULT_TARGET_AC = 15
+
+@lru_cache(maxsize=4096)
+def expected_damage(weapon: Weapon, ability_modifier: int, proficiency_bonus: int,
+                    target_ac: int, two_handed: bool = False, off_hand: bool = False) -> float:
+    """
+    Expected damage of one attack against a target AC
+
+    A natural 20 always hits and doubles the damage dice; a natural 1 always
+    misses. Off-hand attacks add a negative ability modifier but not a positive one.
+    """
+    dice = average_roll(weapon.get_damage_dice(two_handed))
+    attack = weapon.calculate_attack_bonus(ability_modifier, proficiency_bonus)
+    damage_modifier = min(ability_modifier, 0) if off_hand else ability_modifier
+    hit_chance = min(0.95, max(0.05, (21 - target_ac + attack) / 20))
+    return hit_chance * (dice + weapon.calculate_damage_bonus(damage_modifier)) + 0.05 * dice
+
+@dataclass
+class Loadout:
+    """Chosen equipment and its statistics"""
+    armor: Optional[Armor] = None
+    shield: Optional[Shield] = None
+    main_hand: Optional[Weapon] = None
+    off_hand: Optional[Weapon] = None
+    two_handed: bool = False
+    armor_class: int = 10
+    damage_per_round: float = 0.0
+    weight: float = 0.0
+    cost: int = 0  # in copper pieces
+
+    @property
+    def items(self) -> List[Equipment]:
+        return [item for item in (self.armor, self.shield, self.main_hand, self.off_hand) if item]
+
+class _Option(NamedTuple):
+    """A choice for one part of the loadout"""
+    value: float
+    weight: float
+    cost: int
+    armor_class: int  # AC contributed
+    damage: float  # Damage per round contributed
+    pieces: Tuple  # (armor,) or (shield, main_hand, off_hand, two_handed)
+
+def pareto_front(options: Iterable[_Option]) -> List[_Option]:
+    """Drop options beaten on value, weight and cost by another option"""
+    front: List[_Option] = []
+    for option in sorted(options, key=lambda o: (-o.value, o.weight, o.cost)):
+        # Everything already kept has at least this option's value
+        if not any(kept.weight <= option.weight and kept.cost <= option.cost for kept in front):
+            front.append(option)
+    return front
+
+class LoadoutOptimizer:
+    """Search a catalog for the best armor and weapon combination"""
+
+    def __init__(self, items: Iterable[Equipment], ability_scores: AbilityScores,
+                 proficiency_bonus: int = 2, attacks_per_round: int = 1,
+                 target_ac: int = DEFAULT_TARGET_AC):
+        """
+        Args:
+            items: Candidate equipment, e.g. an EquipmentCatalog
+            ability_scores: Scores of the character being equipped
+            proficiency_bonus: Added to attacks; proficiency with all weapons is assumed
+            attacks_per_round: Main-hand attacks per Attack action
+            target_ac: Armor class used for hit chances
+        """
+        self.ability_scores = ability_scores
+        self.proficiency_bonus = proficiency_bonus
+        self.attacks_per_round = attacks_per_round
+        self.target_ac = target_ac
+
+        self.armors: List[Armor] = []
+        self.shields: List[Shield] = []
+        self.weapons: List[Weapon] = []
+        for item in items:
+            if isinstance(item, Shield):
+                self.shields.append(item)
+            elif isinstance(item, Armor):
+                if item.meets_strength_requirement(ability_scores.strength):
+                    self.armors.append(item)
+            elif isinstance(item, Weapon):
+                self.weapons.append(item)
+
+    @classmethod
+    def for_character(cls, character, items: Iterable[Equipment], **kwargs) -> "LoadoutOptimizer":
+        """Optimizer using a character's ability scores and proficiency bonus"""
+        kwargs.setdefault("proficiency_bonus", character.progression.calculate_proficiency_bonus())
+        return cls(items, character.ability_scores, **kwargs)
+
+    def _attack_modifier(self, weapon: Weapon) -> int:
+        strength = self.ability_scores.get_modifier(AbilityType.STRENGTH)
+        dexterity = self.ability_scores.get_modifier(AbilityType.DEXTERITY)
+        if weapon.is_ranged_weapon():
+            return dexterity
+        if weapon.is_finesse_weapon():
+            return max(strength, dexterity)
+        return strength
+
+    def _damage(self, weapon: Weapon, two_handed: bool = False, off_hand: bool = False) -> float:
+        return expected_damage(weapon, self._attack_modifier(weapon), self.proficiency_bonus,
+                               self.target_ac, two_handed, off_hand)
+
+    def _armor_options(self, ac_weight: float) -> List[_Option]:
+        dexterity = self.ability_scores.get_modifier(AbilityType.DEXTERITY)
+        unarmored = 10 + dexterity
+        options = [_Option(ac_weight * unarmored, 0.0, 0, unarmored, 0.0, (None,))]
+        for armor in self.armors:
+            armor_class = armor.calculate_ac(dexterity)
+            options.append(_Option(ac_weight * armor_class, armor.weight, armor.value,
+                                   armor_class, 0.0, (armor,)))
+        return pareto_front(options)
+
+    def _hands_options(self, ac_weight: float, dpr_weight: float) -> List[_Option]:
+        attacks = self.attacks_per_round
+
+        def option(shield=None, main=None, off=None, two_handed=False, damage=0.0):
+            armor_class = shield.calculate_ac_bonus() if shield else 0
+            parts = [item for item in (shield, main, off) if item]
+            return _Option(ac_weight * armor_class + dpr_weight * damage,
+                           sum(item.weight for item in parts), sum(item.value for item in parts),
+                           armor_class, damage, (shield, main, off, two_handed))
+
+        shields = pareto_front(option(shield=shield) for shield in self.shields)
+        one_handed = pareto_front(
+            option(main=weapon, damage=attacks * self._damage(weapon))
+            for weapon in self.weapons if not weapon.is_two_handed_weapon()
+        )
+        light_main = pareto_front(
+            option(main=weapon, damage=attacks * self._damage(weapon))
+            for weapon in self.weapons if weapon.is_light_weapon()
+        )
+        light_off = pareto_front(
+            option(main=weapon, damage=self._damage(weapon, off_hand=True))
+            for weapon in self.weapons if weapon.is_light_weapon()
+        )
+
+        options = [option(), *shields]
+        for main in one_handed:
+            options.append(main)
+            options.extend(option(shield=shield.pieces[0], main=main.pieces[1], damage=main.damage)
+                           for shield in shields)
+        for weapon in self.weapons:
+            if weapon.is_two_handed_weapon() or WeaponProperty.VERSATILE in weapon.properties:
+                options.append(option(main=weapon, two_handed=True,
+                                      damage=attacks * self._damage(weapon, two_handed=True)))
+        # Two-weapon fighting: both weapons light, one bonus-action off-hand attack.
+        # Combining only front members is exact because the parts add up independently.
+        for main in light_main:
+            for off in light_off:
+                options.append(option(main=main.pieces[1], off=off.pieces[1], damage=main.damage + off.damage))
+        return pareto_front(options)
+
+    def optimize(self, max_weight: float, budget: Currency,
+                 ac_weight: float = 1.0, dpr_weight: float = 1.0) -> Optional[Loadout]:
+        """
+        Best loadout within a weight limit and what the budget can afford
+
+        Args:
+            max_weight: Pounds the loadout may weigh, e.g. remaining carrying capacity
+            budget: Money available to buy the items
+            ac_weight: Objective weight of each point of armor class
+            dpr_weight: Objective weight of each point of expected damage per round
+
+        Returns:
+            The loadout with the highest ac_weight * AC + dpr_weight * DPR, or None
+            if nothing (not even going unarmored and unarmed) fits
+        """
+        armor_options = [o for o in self._armor_options(ac_weight) if o.weight <= max_weight]
+        hands_options = [o for o in self._hands_options(ac_weight, dpr_weight) if o.weight <= max_weight]
+        if not armor_options or not hands_options:
+            return None
+        best_hands_value = hands_options[0].value
+
+        best: Optional[Tuple[float, float, int, _Option, _Option]] = None
+        for armor in armor_options:
+            if best is not None and armor.value + best_hands_value < best[0]:
+                break  # No remaining armor can catch up
+            for hands in hands_options:
+                if best is not None and armor.value + hands.value < best[0]:
+                    break
+                weight = armor.weight + hands.weight
+                cost = armor.cost + hands.cost
+                if weight > max_weight or not budget.can_afford(cost):
+                    continue
+                score = (armor.value + hands.value, weight, cost)
+                if best is None or (score[0], -score[1], -score[2]) > (best[0], -best[1], -best[2]):
+                    best = (*score, armor, hands)
+                break  # Hands options are sorted by value; later ones are no better
+        if best is None:
+            return None
+
+        _, weight, cost, armor, hands = best
+        shield, main_hand, off_hand, two_handed = hands.pieces
+        return Loadout(
+            armor=armor.pieces[0],
+            shield=shield,
+            main_hand=main_hand,
+            off_hand=off_hand,
+            two_handed=two_handed,
+            armor_class=armor.armor_class + hands.armor_class,
+            damage_per_round=hands.damage,
+            weight=weight,
+            cost=cost,
+        )
+
+    def optimize_for(self, character, ac_weight: float = 1.0, dpr_weight: float = 1.0) -> Optional[Loadout]:
+        """Best loadout for a character's spare carrying capacity and purse"""
+        inventory = character.inventory
+        capacity = inventory.calculate_carrying_capacity(character.ability_scores.strength)
+        # Equipped items are what the loadout replaces, so only the rest counts against capacity.
+        # The running total already leaves out the contents of bags of holding.
+        equipped = sum(inventory.calculate_carried_weight(item) for item in inventory.equipped_items.values())
+        carried = inventory.calculate_total_weight() - equipped
+        return self.optimize(capacity - carried, inventory.currency, ac_weight, dpr_weight)
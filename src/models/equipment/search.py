@@ -0,0 +1,230 @@
+"""
+Name search over catalog and homebrew equipment
+
+Two indexes back type-ahead lookup:
+- a trie over item names and the words in them, where every node keeps its
+  best few completions so a prefix lookup costs O(len(prefix)) plus the
+  size of the answer;
+- a trigram index used to find candidates for misspelled queries
+  ("longswrod"), which are then ranked by edit distance.
+"""
+import re
+from bisect import insort
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .base import Equipment
+from .catalog import get_default_catalog
+
+# Completions kept at each trie node, and so the most a prefix search returns
+SUGGESTION_LIMIT = 10
+# Shorter queries are still being typed; matching them fuzzily is mostly noise
+FUZZY_MIN_LENGTH = 4
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+def normalize(text: str) -> str:
+    """Lowercase and collapse whitespace"""
+    return " ".join(text.lower().split())
+
+def _rank(name: str) -> Tuple[int, str]:
+    # Shorter names first, so "Dagger" comes before "Dagger +2"
+    return (len(name), name.lower())
+
+def _trigrams(key: str) -> Set[str]:
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    Optimal string alignment distance (adjacent transpositions count as one)
+
+    Returns:
+        The distance, or limit + 1 once it is known to exceed limit
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+class _TrieNode:
+    __slots__ = ("children", "names", "top")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.names: Set[str] = set()  # Names with a key ending at this node
+        self.top: List[Tuple[Tuple[int, str], str]] = []  # Best (rank, name) completions in this subtree
+
+    def recompute_top(self) -> None:
+        candidates = {(_rank(name), name) for name in self.names}
+        for child in self.children.values():
+            candidates.update(child.top)
+        self.top = sorted(candidates)[:SUGGESTION_LIMIT]
+
+class NameSearchIndex:
+    """Prefix and typo-tolerant lookup of equipment by name"""
+
+    def __init__(self, items: Iterable[Equipment] = ()):
+        self._items: Dict[str, Equipment] = {}
+        self._root = _TrieNode()
+        self._keys: Dict[str, Set[str]] = {}  # search key -> names
+        self._trigrams: Dict[str, Set[str]] = {}  # trigram -> search keys
+        self.homebrew: Set[str] = set()
+        for equipment in items:
+            self.add(equipment)
+
+    @classmethod
+    def from_catalog(cls, catalog) -> "NameSearchIndex":
+        """Index every item in an EquipmentCatalog"""
+        return cls(catalog)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._items
+
+    def get(self, name: str) -> Optional[Equipment]:
+        return self._items.get(name)
+
+    @staticmethod
+    def _search_keys(name: str) -> Set[str]:
+        """The full name plus each word, so "tongue" finds "Flame Tongue" """
+        key = normalize(name)
+        return {key, *_WORD.findall(key)}
+
+    def add(self, equipment: Equipment, homebrew: bool = False) -> None:
+        """Index an item, replacing any item with the same name"""
+        name = equipment.name
+        if name in self._items:
+            self.remove(name)
+        self._items[name] = equipment
+        if homebrew:
+            self.homebrew.add(name)
+
+        entry = (_rank(name), name)
+        for key in self._search_keys(name):
+            node = self._root
+            path = [node]
+            for char in key:
+                node = node.children.setdefault(char, _TrieNode())
+                path.append(node)
+            node.names.add(name)
+            for visited in path:
+                if entry not in visited.top and (
+                    len(visited.top) < SUGGESTION_LIMIT or entry < visited.top[-1]
+                ):
+                    insort(visited.top, entry)
+                    del visited.top[SUGGESTION_LIMIT:]
+
+            if key not in self._keys:
+                for trigram in _trigrams(key):
+                    self._trigrams.setdefault(trigram, set()).add(key)
+            self._keys.setdefault(key, set()).add(name)
+
+    def add_homebrew(self, equipment: Equipment) -> None:
+        """Index a user-created item"""
+        self.add(equipment, homebrew=True)
+
+    def remove(self, name: str) -> Equipment:
+        """Remove an item from the index and return it"""
+        equipment = self._items.pop(name)
+        self.homebrew.discard(name)
+        entry = (_rank(name), name)
+        for key in self._search_keys(name):
+            path = [self._root]
+            for char in key:
+                path.append(path[-1].children[char])
+            path[-1].names.discard(name)
+            # Rebuild completions bottom-up, pruning nodes that became empty
+            for depth in range(len(path) - 1, -1, -1):
+                node = path[depth]
+                if entry in node.top:
+                    node.recompute_top()
+                if depth and not node.names and not node.children:
+                    del path[depth - 1].children[key[depth - 1]]
+
+            names = self._keys[key]
+            names.discard(name)
+            if not names:
+                del self._keys[key]
+                for trigram in _trigrams(key):
+                    keys = self._trigrams[trigram]
+                    keys.discard(key)
+                    if not keys:
+                        del self._trigrams[trigram]
+        return equipment
+
+    def complete(self, prefix: str, limit: int = SUGGESTION_LIMIT) -> List[str]:
+        """Names with a word or the whole name starting with prefix"""
+        node = self._root
+        for char in normalize(prefix):
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return [name for _, name in node.top[:limit]]
+
+    def fuzzy(self, text: str, limit: int = SUGGESTION_LIMIT,
+              max_distance: Optional[int] = None) -> List[str]:
+        """
+        Names whose full name or a word is within a small edit distance of text
+
+        Args:
+            max_distance: Allowed edits; defaults to one per four characters
+        """
+        query = normalize(text)
+        if not query:
+            return []
+        if max_distance is None:
+            max_distance = max(1, len(query) // 4)
+
+        # One edit changes at most four trigrams (a transposition touches four),
+        # which bounds the overlap a match can have
+        query_trigrams = _trigrams(query)
+        needed = len(query_trigrams) - 4 * max_distance
+        overlap: Counter = Counter()
+        for trigram in query_trigrams:
+            overlap.update(self._trigrams.get(trigram, ()))
+
+        best: Dict[str, Tuple[int, Tuple[int, str]]] = {}
+        for key, shared in overlap.most_common():
+            if shared < needed:
+                break
+            distance = edit_distance(query, key, max_distance)
+            if distance > max_distance:
+                continue
+            for name in self._keys[key]:
+                score = (distance, _rank(name))
+                if name not in best or score < best[name]:
+                    best[name] = score
+        return sorted(best, key=best.get)[:limit]
+
+    def search(self, text: str, limit: int = SUGGESTION_LIMIT) -> List[str]:
+        """Prefix completions, topped up with typo-tolerant matches"""
+        results = self.complete(text, limit)
+        if len(results) < limit and len(normalize(text)) >= FUZZY_MIN_LENGTH:
+            seen = set(results)
+            results.extend(name for name in self.fuzzy(text, limit) if name not in seen)
+        return results[:limit]
+
+@lru_cache(maxsize=None)
+def get_default_search_index() -> NameSearchIndex:
+    """
+    Search index over the predefined SRD catalog
+
+    The index is shared, so treat it as read-only; anything that adds
+    homebrew items should build its own with NameSearchIndex.from_catalog.
+    """
+    return NameSearchIndex.from_catalog(get_default_catalog())
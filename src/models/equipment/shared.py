@@ -0,0 +1,129 @@
+"""
+Thread-safe inventories for multi-client sessions
+
+A SharedInventory guards one Inventory with its own lock, so players editing
+different inventories never wait on each other. The lock covers the whole
+inventory rather than single stacks because every change also updates the
+inventory-wide weight, value and index totals. Transfers between
+inventories take the locks of every inventory involved in one fixed global
+order, which rules out deadlocks, and validate all moves before applying any.
+"""
+import itertools
+import threading
+from contextlib import ExitStack, contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .base import Equipment
+from .inventory import EquipmentSlot, Inventory, InventoryItem
+
+# Global lock order for transfers
+_serials = itertools.count()
+
+class SharedInventory:
+    """An Inventory whose operations are safe to call from several threads"""
+
+    def __init__(self, inventory: Optional[Inventory] = None, name: str = ""):
+        self.inventory = inventory if inventory is not None else Inventory()
+        self.name = name
+        self.lock = threading.RLock()
+        self._serial = next(_serials)
+
+    @contextmanager
+    def locked(self) -> Iterator[Inventory]:
+        """Hold the lock for a compound operation on the inventory"""
+        with self.lock:
+            yield self.inventory
+
+    def add_item(self, equipment: Equipment, quantity: int = 1, **kwargs) -> InventoryItem:
+        with self.lock:
+            return self.inventory.add_item(equipment, quantity, **kwargs)
+
+    def remove_item(self, item: InventoryItem, quantity: int = None) -> bool:
+        with self.lock:
+            return self.inventory.remove_item(item, quantity)
+
+    def set_quantity(self, item: InventoryItem, quantity: int) -> bool:
+        with self.lock:
+            return self.inventory.set_quantity(item, quantity)
+
+    def move_item(self, item: InventoryItem, container: Optional[InventoryItem],
+                  quantity: Optional[int] = None) -> Optional[InventoryItem]:
+        with self.lock:
+            return self.inventory.move_item(item, container, quantity)
+
+    def equip_item(self, item: InventoryItem, slot: EquipmentSlot = None) -> bool:
+        with self.lock:
+            return self.inventory.equip_item(item, slot)
+
+    def unequip_item(self, item: InventoryItem) -> bool:
+        with self.lock:
+            return self.inventory.unequip_item(item)
+
+    def attune_item(self, item: InventoryItem) -> bool:
+        with self.lock:
+            return self.inventory.attune_item(item)
+
+    def unattune_item(self, item: InventoryItem) -> bool:
+        with self.lock:
+            return self.inventory.unattune_item(item)
+
+    def get_item(self, item_id: str) -> Optional[InventoryItem]:
+        with self.lock:
+            return self.inventory.get_item(item_id)
+
+    def find_items(self, name: str) -> List[InventoryItem]:
+        with self.lock:
+            return self.inventory.find_items(name)
+
+    def calculate_total_weight(self) -> float:
+        with self.lock:
+            return self.inventory.calculate_total_weight()
+
+    def snapshot(self) -> List[Tuple[str, str, int]]:
+        """Consistent (item_id, name, quantity) view of every item"""
+        with self.lock:
+            return [(item.item_id, item.display_name, item.quantity) for item in self.inventory.items]
+
+# (source, item, destination, quantity or None for the whole stack)
+Transfer = Tuple[SharedInventory, InventoryItem, SharedInventory, Optional[int]]
+
+def transfer_items(transfers: Sequence[Transfer]) -> List[InventoryItem]:
+    """
+    Move items between inventories as one atomic step
+
+    Raises:
+        ValueError: If any transfer is invalid; nothing is moved
+
+    Returns:
+        The destination stack of each transfer
+    """
+    parties = {id(shared): shared for source, _, destination, _ in transfers
+               for shared in (source, destination)}
+    with ExitStack() as stack:
+        for shared in sorted(parties.values(), key=lambda shared: shared._serial):
+            stack.enter_context(shared.lock)
+
+        # Validate everything first, allowing for several transfers of one stack
+        requested: Dict[int, int] = {}
+        for source, item, destination, quantity in transfers:
+            if item not in source.inventory.items:
+                raise ValueError(f"{item.display_name} is not in {source.name or 'the source inventory'}")
+            if source.inventory.get_contents(item):
+                raise ValueError(f"Empty {item.display_name} before handing it over")
+            wanted = item.quantity if quantity is None else quantity
+            if wanted <= 0:
+                raise ValueError("Transfer quantity must be positive")
+            requested[id(item)] = requested.get(id(item), 0) + wanted
+            if requested[id(item)] > item.quantity:
+                raise ValueError(f"Not enough {item.display_name} to transfer")
+
+        received = []
+        for source, item, destination, quantity in transfers:
+            wanted = item.quantity if quantity is None else quantity
+            charges = item.charges
+            source.inventory.remove_item(item, wanted)
+            result = destination.inventory.add_item(item.equipment, wanted)
+            if result.is_charged:
+                result.charges = charges  # Charged items never stack, so this is the copy's own entry
+            received.append(result)
+        return received
@@ -0,0 +1,279 @@
+"""
+Atomic inventory transactions
+
+Trades and shop purchases stage their steps on an InventoryTransaction and
+commit them together:
+
+    with InventoryTransaction(inventory, strength_score=14) as trade:
+        trade.remove(old_sword)
+        trade.spend(1500)
+        sword = trade.add(LONGSWORD)
+        trade.equip(sword)
+
+Staged steps are checked against the inventory before anything changes, then
+applied in one pass while an undo log records how to reverse each one.
+Carrying capacity and attunement are checked once, on the final state,
+using the inventory's running totals. If any step fails, the undo log is
+replayed backwards and the inventory is left exactly as it was. Listeners
+receive one "transaction_committed" event listing every change.
+"""
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from ...config.settings import MAX_ATTUNED_ITEMS
+from .base import Equipment
+from .inventory import Currency, EquipmentSlot, Inventory, InventoryItem
+
+class TransactionError(ValueError):
+    """Raised when a transaction cannot be committed; nothing is changed"""
+
+    def __init__(self, problems: List[str]):
+        self.problems = problems
+        super().__init__("; ".join(problems))
+
+@dataclass
+class StagedItem:
+    """An item a transaction will add, usable in later steps of the same transaction"""
+    equipment: Equipment
+    quantity: int = 1
+    item: Optional[InventoryItem] = None  # Set once committed
+
+ItemRef = Union[InventoryItem, StagedItem]
+
+def _require_positive(value: int, name: str = "Quantity") -> None:
+    if value <= 0:
+        raise ValueError(f"{name} must be positive, got {value}")
+
+class InventoryTransaction:
+    """Stage inventory and currency changes, then commit them all or none"""
+
+    def __init__(self, inventory: Inventory, strength_score: Optional[int] = None):
+        """
+        Args:
+            inventory: Inventory the transaction changes
+            strength_score: If given, the result may not exceed carrying capacity
+                (unless it is lighter than before)
+        """
+        self.inventory = inventory
+        self.strength_score = strength_score
+        self.committed = False
+        self._steps: List[Tuple[str, tuple]] = []
+        self._copper = 0  # Net currency change in copper pieces
+
+    def __enter__(self) -> "InventoryTransaction":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        # Nothing has been applied while staging, so an error just discards the steps
+        if exc_type is None:
+            self.commit()
+        return False
+
+    def add(self, equipment: Equipment, quantity: int = 1,
+            container: Optional[ItemRef] = None) -> StagedItem:
+        """
+        Raises:
+            ValueError: If the quantity is not positive
+        """
+        _require_positive(quantity)
+        staged = StagedItem(equipment, quantity)
+        self._steps.append(("add", (staged, container)))
+        return staged
+
+    def remove(self, item: ItemRef, quantity: Optional[int] = None) -> None:
+        """
+        Remove some or all of an item; for a staged item, all means what was staged
+
+        Raises:
+            ValueError: If the quantity is not positive
+        """
+        if quantity is not None:
+            _require_positive(quantity)
+        self._steps.append(("remove", (item, quantity)))
+
+    def equip(self, item: ItemRef, slot: Optional[EquipmentSlot] = None) -> None:
+        self._steps.append(("equip", (item, slot)))
+
+    def unequip(self, item: ItemRef) -> None:
+        self._steps.append(("unequip", (item,)))
+
+    def attune(self, item: ItemRef) -> None:
+        self._steps.append(("attune", (item,)))
+
+    def spend(self, copper: int) -> None:
+        """
+        Raises:
+            ValueError: If the amount is not positive
+        """
+        _require_positive(copper, "Amount")
+        self._copper -= copper
+
+    def receive(self, copper: int) -> None:
+        """
+        Raises:
+            ValueError: If the amount is not positive
+        """
+        _require_positive(copper, "Amount")
+        self._copper += copper
+
+    def validate(self) -> List[str]:
+        """Problems the staged steps would run into, found without changing anything"""
+        problems = []
+        items = self.inventory.items
+        removing: Dict[int, int] = {}  # id(item) -> quantity removed by the steps so far
+        for step, args in self._steps:
+            item = args[0]
+            staged = isinstance(item, StagedItem)
+            name = item.equipment.name if staged else item.display_name
+            if step == "add":
+                if item.quantity <= 0:
+                    problems.append(f"Cannot add {item.quantity} x {name}")
+                continue
+            if not staged and item not in items:
+                problems.append(f"{name} is not in the inventory")
+                continue
+            if step == "remove":
+                quantity = args[1] if args[1] is not None else item.quantity
+                if quantity <= 0:
+                    problems.append(f"Cannot remove {quantity} x {name}")
+                    continue
+                # A staged item may have joined an existing stack; only what was staged can go
+                removing[id(item)] = removing.get(id(item), 0) + quantity
+                if removing[id(item)] > item.quantity:
+                    problems.append(f"Not enough {name}")
+                if not staged and self.inventory.get_contents(item):
+                    problems.append(f"{name} is not empty")
+        if self._copper < 0 and not self.inventory.currency.can_afford(-self._copper):
+            problems.append(f"Cannot afford {-self._copper} cp")
+        return problems
+
+    def commit(self) -> None:
+        """
+        Apply every staged step, or none of them
+
+        Raises:
+            TransactionError: If validation fails or a step cannot be applied
+        """
+        if self.committed:
+            raise TransactionError(["Transaction already committed"])
+        problems = self.validate()
+        if problems:
+            raise TransactionError(problems)
+
+        inventory = self.inventory
+        weight_before = inventory.calculate_total_weight()
+        undo: List[Callable[[], None]] = []
+        with inventory.coalesced_events("transaction_committed") as events:
+            try:
+                for step, args in self._steps:
+                    getattr(self, f"_apply_{step}")(undo, *args)
+                if self._copper:
+                    self._apply_currency(undo)
+                    coins = {name: getattr(inventory.currency, name) for name in Currency.__dataclass_fields__}
+                    events.append(("currency_changed", {"coins": coins}))
+                self._check_final_state(weight_before)
+            except Exception:
+                for step in reversed(undo):
+                    step()
+                raise
+        self.committed = True
+
+    def _resolve(self, item: Optional[ItemRef]) -> Optional[InventoryItem]:
+        return item.item if isinstance(item, StagedItem) else item
+
+    def _apply_add(self, undo: List[Callable[[], None]], staged: StagedItem,
+                   container: Optional[ItemRef]) -> None:
+        inventory = self.inventory
+        try:
+            item = inventory.add_item(staged.equipment, staged.quantity, container=self._resolve(container))
+        except ValueError as exc:
+            raise TransactionError([str(exc)]) from exc
+        staged.item = item
+        if item.quantity == staged.quantity:
+            undo.append(lambda: inventory.remove_item(item))  # A new stack
+        else:
+            undo.append(lambda: inventory.remove_item(item, staged.quantity))
+
+    def _apply_remove(self, undo: List[Callable[[], None]], item: ItemRef,
+                      quantity: Optional[int]) -> None:
+        inventory = self.inventory
+        if isinstance(item, StagedItem) and quantity is None:
+            quantity = item.quantity  # Not the rest of a stack it was merged into
+        item = self._resolve(item)
+        if quantity is not None and quantity < item.quantity:
+            inventory.remove_item(item, quantity)
+            undo.append(lambda: inventory.set_quantity(item, item.quantity + quantity))
+            return
+
+        equipped, slot, attuned = item.equipped, item.equipped_slot, item.attuned
+        position = inventory.items.position(item)
+        inventory.remove_item(item)
+
+        def put_back():
+            item.equipped, item.equipped_slot, item.attuned = equipped, slot, attuned
+            inventory._reinsert(item, position)
+        undo.append(put_back)
+
+    def _apply_equip(self, undo: List[Callable[[], None]], item: ItemRef,
+                     slot: Optional[EquipmentSlot]) -> None:
+        item = self._resolve(item)
+        undo.append(self._equipment_state(item))
+        if not self.inventory.equip_item(item, slot):
+            raise TransactionError([f"Cannot equip {item.display_name}"])
+
+    def _apply_unequip(self, undo: List[Callable[[], None]], item: ItemRef) -> None:
+        item = self._resolve(item)
+        undo.append(self._equipment_state(item))
+        if not self.inventory.unequip_item(item):
+            raise TransactionError([f"{item.display_name} is not equipped"])
+
+    def _apply_attune(self, undo: List[Callable[[], None]], item: ItemRef) -> None:
+        item = self._resolve(item)
+        if not self.inventory.attune_item(item):
+            raise TransactionError([f"Cannot attune to {item.display_name}"])
+        undo.append(lambda: self.inventory.unattune_item(item))
+
+    def _equipment_state(self, item: InventoryItem) -> Callable[[], None]:
+        """Record the equipped slots and where item is stored, returning a restore step"""
+        inventory = self.inventory
+        occupants = {slot: (occupant, occupant.attuned) for slot, occupant in inventory.equipped_items.items()}
+        container = inventory.get_container(item)
+
+        def restore():
+            for slot, occupant in list(inventory.equipped_items.items()):
+                if occupants.get(slot, (None,))[0] is not occupant:
+                    inventory.unequip_item(occupant)
+            for slot, (occupant, attuned) in occupants.items():
+                if inventory.equipped_items.get(slot) is not occupant:
+                    inventory.equip_item(occupant, slot)
+                if attuned and not occupant.attuned:
+                    inventory.attune_item(occupant)
+            if container is not None and inventory.get_container(item) is not container:
+                inventory.move_item(item, container)
+        return restore
+
+    def _apply_currency(self, undo: List[Callable[[], None]]) -> None:
+        currency = self.inventory.currency
+        coins = {name: getattr(currency, name) for name in Currency.__dataclass_fields__}
+        if self._copper < 0:
+            if not currency.spend(-self._copper):
+                raise TransactionError([f"Cannot afford {-self._copper} cp"])
+        else:
+            currency.add_value_in_copper(self._copper)
+
+        def restore():
+            for name, count in coins.items():
+                setattr(currency, name, count)
+        undo.append(restore)
+
+    def _check_final_state(self, weight_before: float) -> None:
+        inventory = self.inventory
+        problems = []
+        if self.strength_score is not None:
+            weight = inventory.calculate_total_weight()
+            if inventory.is_encumbered(self.strength_score) and weight > weight_before:
+                problems.append(f"{weight:g} lb exceeds carrying capacity")
+        if inventory.attuned_count > MAX_ATTUNED_ITEMS:
+            problems.append(f"More than {MAX_ATTUNED_ITEMS} attuned items")
+        if problems:
+            raise TransactionError(problems)
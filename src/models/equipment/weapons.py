@@ -5,6 +5,7 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 from enum import Enum
 from .base import Equipment, EquipmentType, Rarity
+from .lazy_catalog import CombinedCatalog, LazyCatalog
 
 class WeaponCategory(Enum):
     SIMPLE_MELEE = "simple_melee"
@@ -50,7 +51,7 @@ class WeaponRange:
     def is_ranged(self) -> bool:
         return self.long is not None
 
-@dataclass
+@dataclass(frozen=True)
 class Weapon(Equipment):
     """D&D 5e weapon implementation"""
     category: WeaponCategory = WeaponCategory.SIMPLE_MELEE
@@ -61,15 +62,17 @@ class Weapon(Equipment):
     versatile_damage: Optional[str] = None  # For versatile weapons
     magic_bonus: int = 0
     
+    __hash__ = Equipment.__hash__
+    
     def __post_init__(self):
         super().__post_init__()
-        self.type = EquipmentType.WEAPON
+        self._set("type", EquipmentType.WEAPON)
         
         # Set default range for melee weapons
         if not self.weapon_range:
             if self.category in [WeaponCategory.SIMPLE_MELEE, WeaponCategory.MARTIAL_MELEE]:
                 reach = 10 if WeaponProperty.REACH in self.properties else 5
-                self.weapon_range = WeaponRange(normal=reach)
+                self._set("weapon_range", WeaponRange(normal=reach))
     
     def calculate_attack_bonus(self, ability_modifier: int, proficiency_bonus: int, is_proficient: bool = True) -> int:
         """Calculate attack roll bonus"""
@@ -114,8 +117,8 @@ class Weapon(Equipment):
 
 
 # Predefined weapons from D&D 5e SRD
-SIMPLE_MELEE_WEAPONS = {
-    "Club": Weapon(
+SIMPLE_MELEE_WEAPONS = LazyCatalog(Weapon, {
+    "Club": dict(
         name="Club",
         category=WeaponCategory.SIMPLE_MELEE,
         damage_dice="1d4",
@@ -124,7 +127,7 @@ SIMPLE_MELEE_WEAPONS = {
         weight=2.0,
         value=10  # 1 sp
     ),
-    "Dagger": Weapon(
+    "Dagger": dict(
         name="Dagger",
         category=WeaponCategory.SIMPLE_MELEE,
         damage_dice="1d4",
@@ -134,7 +137,7 @@ SIMPLE_MELEE_WEAPONS = {
         weight=1.0,
         value=200  # 2 gp
     ),
-    "Handaxe": Weapon(
+    "Handaxe": dict(
         name="Handaxe",
         category=WeaponCategory.SIMPLE_MELEE,
         damage_dice="1d6",
@@ -144,7 +147,7 @@ SIMPLE_MELEE_WEAPONS = {
         weight=2.0,
         value=500  # 5 gp
     ),
-    "Javelin": Weapon(
+    "Javelin": dict(
         name="Javelin",
         category=WeaponCategory.SIMPLE_MELEE,
         damage_dice="1d6",
@@ -154,7 +157,7 @@ SIMPLE_MELEE_WEAPONS = {
         weight=2.0,
         value=50  # 5 sp
     ),
-    "Mace": Weapon(
+    "Mace": dict(
         name="Mace",
         category=WeaponCategory.SIMPLE_MELEE,
         damage_dice="1d6",
@@ -162,7 +165,7 @@ SIMPLE_MELEE_WEAPONS = {
         weight=4.0,
         value=500  # 5 gp
     ),
-    "Quarterstaff": Weapon(
+    "Quarterstaff": dict(
         name="Quarterstaff",
         category=WeaponCategory.SIMPLE_MELEE,
         damage_dice="1d6",
@@ -172,7 +175,7 @@ SIMPLE_MELEE_WEAPONS = {
         weight=4.0,
         value=20  # 2 sp
     ),
-    "Spear": Weapon(
+    "Spear": dict(
         name="Spear",
         category=WeaponCategory.SIMPLE_MELEE,
         damage_dice="1d6",
@@ -183,10 +186,10 @@ SIMPLE_MELEE_WEAPONS = {
         weight=3.0,
         value=100  # 1 gp
     ),
-}
+})
 
-SIMPLE_RANGED_WEAPONS = {
-    "Crossbow, light": Weapon(
+SIMPLE_RANGED_WEAPONS = LazyCatalog(Weapon, {
+    "Crossbow, light": dict(
         name="Crossbow, light",
         category=WeaponCategory.SIMPLE_RANGED,
         damage_dice="1d8",
@@ -196,7 +199,7 @@ SIMPLE_RANGED_WEAPONS = {
         weight=5.0,
         value=2500  # 25 gp
     ),
-    "Dart": Weapon(
+    "Dart": dict(
         name="Dart",
         category=WeaponCategory.SIMPLE_RANGED,
         damage_dice="1d4",
@@ -206,7 +209,7 @@ SIMPLE_RANGED_WEAPONS = {
         weight=0.25,
         value=5  # 5 cp
     ),
-    "Shortbow": Weapon(
+    "Shortbow": dict(
         name="Shortbow",
         category=WeaponCategory.SIMPLE_RANGED,
         damage_dice="1d6",
@@ -216,7 +219,7 @@ SIMPLE_RANGED_WEAPONS = {
         weight=2.0,
         value=2500  # 25 gp
     ),
-    "Sling": Weapon(
+    "Sling": dict(
         name="Sling",
         category=WeaponCategory.SIMPLE_RANGED,
         damage_dice="1d4",
@@ -226,10 +229,10 @@ SIMPLE_RANGED_WEAPONS = {
         weight=0.0,
         value=10  # 1 sp
     ),
-}
+})
 
-MARTIAL_MELEE_WEAPONS = {
-    "Battleaxe": Weapon(
+MARTIAL_MELEE_WEAPONS = LazyCatalog(Weapon, {
+    "Battleaxe": dict(
         name="Battleaxe",
         category=WeaponCategory.MARTIAL_MELEE,
         damage_dice="1d8",
@@ -239,7 +242,7 @@ MARTIAL_MELEE_WEAPONS = {
         weight=4.0,
         value=1000  # 10 gp
     ),
-    "Longsword": Weapon(
+    "Longsword": dict(
         name="Longsword",
         category=WeaponCategory.MARTIAL_MELEE,
         damage_dice="1d8",
@@ -249,7 +252,7 @@ MARTIAL_MELEE_WEAPONS = {
         weight=3.0,
         value=1500  # 15 gp
     ),
-    "Rapier": Weapon(
+    "Rapier": dict(
         name="Rapier",
         category=WeaponCategory.MARTIAL_MELEE,
         damage_dice="1d8",
@@ -258,7 +261,7 @@ MARTIAL_MELEE_WEAPONS = {
         weight=2.0,
         value=2500  # 25 gp
     ),
-    "Shortsword": Weapon(
+    "Shortsword": dict(
         name="Shortsword",
         category=WeaponCategory.MARTIAL_MELEE,
         damage_dice="1d6",
@@ -267,7 +270,7 @@ MARTIAL_MELEE_WEAPONS = {
         weight=2.0,
         value=1000  # 10 gp
     ),
-    "Greatsword": Weapon(
+    "Greatsword": dict(
         name="Greatsword",
         category=WeaponCategory.MARTIAL_MELEE,
         damage_dice="2d6",
@@ -276,10 +279,10 @@ MARTIAL_MELEE_WEAPONS = {
         weight=6.0,
         value=5000  # 50 gp
     ),
-}
+})
 
-MARTIAL_RANGED_WEAPONS = {
-    "Longbow": Weapon(
+MARTIAL_RANGED_WEAPONS = LazyCatalog(Weapon, {
+    "Longbow": dict(
         name="Longbow",
         category=WeaponCategory.MARTIAL_RANGED,
         damage_dice="1d8",
@@ -289,7 +292,7 @@ MARTIAL_RANGED_WEAPONS = {
         weight=2.0,
         value=5000  # 50 gp
     ),
-    "Crossbow, heavy": Weapon(
+    "Crossbow, heavy": dict(
         name="Crossbow, heavy",
         category=WeaponCategory.MARTIAL_RANGED,
         damage_dice="1d10",
@@ -299,12 +302,12 @@ MARTIAL_RANGED_WEAPONS = {
         weight=18.0,
         value=5000  # 50 gp
     ),
-}
+})
 
 # Combined weapon database
-ALL_WEAPONS = {
-    **SIMPLE_MELEE_WEAPONS,
-    **SIMPLE_RANGED_WEAPONS,
-    **MARTIAL_MELEE_WEAPONS,
-    **MARTIAL_RANGED_WEAPONS,
-}
\ No newline at end of file
+ALL_WEAPONS = CombinedCatalog(
+    SIMPLE_MELEE_WEAPONS,
+    SIMPLE_RANGED_WEAPONS,
+    MARTIAL_MELEE_WEAPONS,
+    MARTIAL_RANGED_WEAPONS,
+)
\ No newline at end of file
@@ -0,0 +1,60 @@
+"""
+Change notification for model objects
+"""
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+# Called with the event name and its payload
+ChangeListener = Callable[[str, Dict[str, Any]], None]
+
+class ChangeNotifier:
+    """Mixin that lets observers subscribe to a model's mutations"""
+
+    def add_listener(self, listener: ChangeListener) -> None:
+        """Subscribe to change events"""
+        self.__dict__.setdefault("_listeners", []).append(listener)
+
+    def remove_listener(self, listener: ChangeListener) -> None:
+        """Unsubscribe from change events"""
+        listeners: List[ChangeListener] = self.__dict__.get("_listeners", [])
+        if listener in listeners:
+            listeners.remove(listener)
+
+    def _notify(self, event: str, **payload: Any) -> None:
+        """Send an event to all listeners"""
+        deferred = self.__dict__.get("_deferred")
+        if deferred is not None:
+            deferred.append((event, payload))
+            return
+        listeners = self.__dict__.get("_listeners")
+        if listeners:
+            for listener in list(listeners):
+                listener(event, payload)
+
+    @contextmanager
+    def coalesced_events(self, event: str) -> Iterator[List[Tuple[str, Dict[str, Any]]]]:
+        """
+        Collect the events raised inside the block and send them as one event
+
+        Listeners get event with an "events" payload of (event, payload) pairs.
+        If the block raises, the collected events are dropped.
+        """
+        previous = self.__dict__.get("_deferred")
+        events: List[Tuple[str, Dict[str, Any]]] = []
+        self.__dict__["_deferred"] = events
+        try:
+            yield events
+        finally:
+            if previous is None:
+                self.__dict__.pop("_deferred", None)
+            else:
+                self.__dict__["_deferred"] = previous
+        if events:
+            self._notify(event, events=events)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Listeners belong to the running session and are not copied or pickled
+        state = dict(self.__dict__)
+        state.pop("_listeners", None)
+        state.pop("_deferred", None)
+        return state
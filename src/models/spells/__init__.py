@@ -1 +1,13 @@
-# Spells models package
\ No newline at end of file
+# Spells models package
+
+from .base import Spell, SpellSchool, SpellComponent
+from .srd import SRD_SPELLS
+from .compendium import SpellCompendium, SpellQuery, get_default_compendium
+
+__all__ = [
+    # Base classes
+    'Spell', 'SpellSchool', 'SpellComponent', 'SRD_SPELLS',
+
+    # Compendium
+    'SpellCompendium', 'SpellQuery', 'get_default_compendium',
+]
@@ -35,6 +35,7 @@ class Spell:
     higher_levels: Optional[str] = None
     ritual: bool = False
     concentration: bool = False
+    classes: List[str] = field(default_factory=list)  # Classes whose spell list has it
     
     @property
     def component_string(self) -> str:
@@ -0,0 +1,192 @@
+"""
+Indexed spell compendium
+
+Every spell is given a small integer id, and each filter value (a level, a
+school, a component, a class, ritual or concentration) keeps a bitset of the
+ids that have it, stored as a Python int. A combined filter is then a few
+ANDs and ORs of machine words, even over thousands of spells, and only the
+final set bits are turned back into spells.
+
+Full-text search uses an inverted index from each word of a spell's name,
+description and higher-level text to the bitset of spells containing it.
+All query words must match; results are ranked by how often the words
+occur, with words in the name counting most.
+"""
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .base import Spell, SpellComponent, SpellSchool
+from .srd import SRD_SPELLS
+
+MAX_SPELL_LEVEL = 9
+# Occurrences in a spell's name weigh this much more than in its text
+NAME_WEIGHT = 5
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase words of a text"""
+    return _WORD.findall(text.lower())
+
+def iter_bits(bits: int) -> Iterator[int]:
+    """Positions of the set bits of an int, lowest first"""
+    while bits:
+        lowest = bits & -bits
+        yield lowest.bit_length() - 1
+        bits ^= lowest
+
+@dataclass
+class SpellQuery:
+    """Filters for finding spells; unset filters match everything"""
+    min_level: Optional[int] = None
+    max_level: Optional[int] = None
+    school: Optional[SpellSchool] = None
+    components: List[SpellComponent] = field(default_factory=list)  # All must be present
+    without_components: List[SpellComponent] = field(default_factory=list)  # None may be present
+    ritual: Optional[bool] = None
+    concentration: Optional[bool] = None
+    spell_class: Optional[str] = None  # e.g. "Wizard"
+    text: str = ""  # Words that must all appear in the name, description or higher levels
+
+class SpellCompendium:
+    """Spells keyed by name, with bitset indexes for filtering and full-text search"""
+
+    def __init__(self, spells: Iterable[Spell] = ()):
+        self._spells: Dict[str, Spell] = {}
+        self._ids: Dict[str, int] = {}
+        self._by_id: List[Optional[Spell]] = []
+        self._free: List[int] = []  # Ids of removed spells, reused first
+        self._all = 0
+        self._bits: Dict[Tuple[str, Any], int] = {}
+        self._postings: Dict[str, int] = {}  # Word -> spells containing it
+        self._weights: Dict[str, Dict[int, int]] = {}  # Word -> spell id -> ranking weight
+        for spell in spells:
+            self.add(spell)
+
+    def __len__(self) -> int:
+        return len(self._spells)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._spells
+
+    def __iter__(self) -> Iterator[Spell]:
+        return iter(self._spells.values())
+
+    def __getitem__(self, name: str) -> Spell:
+        return self._spells[name]
+
+    def get(self, name: str) -> Optional[Spell]:
+        return self._spells.get(name)
+
+    def names(self) -> List[str]:
+        return list(self._spells)
+
+    @staticmethod
+    def _keys(spell: Spell) -> List[Tuple[str, Any]]:
+        keys = [("level", spell.level), ("school", spell.school),
+                ("ritual", spell.ritual), ("concentration", spell.concentration)]
+        keys += [("component", component) for component in set(spell.components)]
+        keys += [("class", name.lower()) for name in set(spell.classes)]
+        return keys
+
+    @staticmethod
+    def _word_weights(spell: Spell) -> Counter:
+        weights = Counter(tokenize(f"{spell.description} {spell.higher_levels or ''}"))
+        for word in tokenize(spell.name):
+            weights[word] += NAME_WEIGHT
+        return weights
+
+    def add(self, spell: Spell) -> None:
+        """Add a spell, replacing any spell with the same name"""
+        if spell.name in self._spells:
+            self.remove(spell.name)
+        if self._free:
+            spell_id = self._free.pop()
+            self._by_id[spell_id] = spell
+        else:
+            spell_id = len(self._by_id)
+            self._by_id.append(spell)
+        self._spells[spell.name] = spell
+        self._ids[spell.name] = spell_id
+
+        bit = 1 << spell_id
+        self._all |= bit
+        for key in self._keys(spell):
+            self._bits[key] = self._bits.get(key, 0) | bit
+        for word, weight in self._word_weights(spell).items():
+            self._postings[word] = self._postings.get(word, 0) | bit
+            self._weights.setdefault(word, {})[spell_id] = weight
+
+    def remove(self, name: str) -> Spell:
+        """Remove a spell by name and return it"""
+        spell = self._spells.pop(name)
+        spell_id = self._ids.pop(name)
+        self._by_id[spell_id] = None
+        self._free.append(spell_id)
+
+        mask = ~(1 << spell_id)
+        self._all &= mask
+        for key in self._keys(spell):
+            self._bits[key] &= mask
+            if not self._bits[key]:
+                del self._bits[key]
+        for word in self._word_weights(spell):
+            self._postings[word] &= mask
+            del self._weights[word][spell_id]
+            if not self._postings[word]:
+                del self._postings[word]
+                del self._weights[word]
+        return spell
+
+    def match(self, query: SpellQuery) -> int:
+        """Bitset of the ids of spells matching every filter in the query"""
+        bits = self._all
+        if query.min_level is not None or query.max_level is not None:
+            low = 0 if query.min_level is None else query.min_level
+            high = MAX_SPELL_LEVEL if query.max_level is None else query.max_level
+            levels = 0
+            for level in range(low, high + 1):
+                levels |= self._bits.get(("level", level), 0)
+            bits &= levels
+        terms = [("school", query.school), ("ritual", query.ritual), ("concentration", query.concentration),
+                 ("class", query.spell_class.lower() if query.spell_class else None)]
+        terms += [("component", component) for component in query.components]
+        for key in terms:
+            if key[1] is not None:
+                bits &= self._bits.get(key, 0)
+        for component in query.without_components:
+            bits &= ~self._bits.get(("component", component), 0)
+        for word in tokenize(query.text):
+            bits &= self._postings.get(word, 0)
+        return bits
+
+    def count(self, query: SpellQuery) -> int:
+        return bin(self.match(query)).count("1")
+
+    def find(self, query: SpellQuery) -> List[Spell]:
+        """
+        Spells matching the query
+
+        Returns:
+            By relevance when the query has text, otherwise by level and name
+        """
+        spells = [self._by_id[spell_id] for spell_id in iter_bits(self.match(query))]
+        words = tokenize(query.text)
+        if words:
+            def relevance(spell: Spell) -> Tuple[int, str]:
+                spell_id = self._ids[spell.name]
+                return (-sum(self._weights[word][spell_id] for word in words), spell.name)
+            return sorted(spells, key=relevance)
+        return sorted(spells, key=lambda spell: (spell.level, spell.name))
+
+    def search(self, text: str, **filters: Any) -> List[Spell]:
+        """Full-text search, e.g. search("fire damage", max_level=3, spell_class="Wizard")"""
+        return self.find(SpellQuery(text=text, **filters))
+
+@lru_cache(maxsize=None)
+def get_default_compendium() -> SpellCompendium:
+    """Compendium of the predefined SRD spells"""
+    return SpellCompendium(SRD_SPELLS.values())
@@ -0,0 +1,206 @@
+"""
+Spell slot tables and tracking
+
+Slot maximums come from tables built once at import: the multiclass
+spellcaster table (caster level x slot level), each caster type's own table
+by class level, and the warlock pact magic table. A character's slots are
+then two small byte arrays indexed by slot level, one of maximums and one of
+slots used, plus the pact slots, which come back on a short rest. Spending
+or restoring a slot is one array update, and a long rest clears the used
+array in one slice assignment.
+"""
+from array import array
+from enum import Enum
+from typing import Dict, Iterable, Mapping, Sequence, Tuple
+
+MAX_SPELL_LEVEL = 9
+MAX_CLASS_LEVEL = 20
+
+class CasterType(Enum):
+    FULL = "full"  # Bard, cleric, druid, sorcerer, wizard
+    HALF = "half"  # Paladin, ranger
+    HALF_ROUNDED_UP = "half_rounded_up"  # Artificer: slots from 1st level
+    THIRD = "third"  # Eldritch knight, arcane trickster
+    PACT = "pact"  # Warlock
+
+CLASS_CASTER_TYPES: Dict[str, CasterType] = {
+    "bard": CasterType.FULL,
+    "cleric": CasterType.FULL,
+    "druid": CasterType.FULL,
+    "sorcerer": CasterType.FULL,
+    "wizard": CasterType.FULL,
+    "paladin": CasterType.HALF,
+    "ranger": CasterType.HALF,
+    "artificer": CasterType.HALF_ROUNDED_UP,
+    "eldritch knight": CasterType.THIRD,
+    "arcane trickster": CasterType.THIRD,
+    "warlock": CasterType.PACT,
+}
+
+# Slots of levels 1-9 for caster levels 1-20 (Player's Handbook, multiclass spellcaster)
+_SLOTS_BY_CASTER_LEVEL = (
+    (2,), (3,), (4, 2), (4, 3), (4, 3, 2), (4, 3, 3), (4, 3, 3, 1), (4, 3, 3, 2),
+    (4, 3, 3, 3, 1), (4, 3, 3, 3, 2), (4, 3, 3, 3, 2, 1), (4, 3, 3, 3, 2, 1),
+    (4, 3, 3, 3, 2, 1, 1), (4, 3, 3, 3, 2, 1, 1), (4, 3, 3, 3, 2, 1, 1, 1),
+    (4, 3, 3, 3, 2, 1, 1, 1), (4, 3, 3, 3, 2, 1, 1, 1, 1), (4, 3, 3, 3, 3, 1, 1, 1, 1),
+    (4, 3, 3, 3, 3, 2, 1, 1, 1), (4, 3, 3, 3, 3, 2, 2, 1, 1),
+)
+
+def _row(slots: Sequence[int]) -> Tuple[int, ...]:
+    """Slots indexed by slot level; index 0 (cantrips) is always 0"""
+    return (0, *slots, *(0,) * (MAX_SPELL_LEVEL - len(slots)))
+
+# SLOT_TABLE[caster_level][slot_level]
+SLOT_TABLE: Tuple[Tuple[int, ...], ...] = (_row(()),) + tuple(_row(slots) for slots in _SLOTS_BY_CASTER_LEVEL)
+
+# Caster level a class contributes alone (single-class tables) and in a multiclass
+_SINGLE_CLASS_LEVEL = {
+    CasterType.FULL: lambda level: level,
+    CasterType.HALF: lambda level: (level + 1) // 2 if level >= 2 else 0,
+    CasterType.HALF_ROUNDED_UP: lambda level: (level + 1) // 2,
+    CasterType.THIRD: lambda level: (level + 2) // 3 if level >= 3 else 0,
+}
+_MULTICLASS_LEVEL = {
+    CasterType.FULL: lambda level: level,
+    CasterType.HALF: lambda level: level // 2,
+    CasterType.HALF_ROUNDED_UP: lambda level: (level + 1) // 2,
+    CasterType.THIRD: lambda level: level // 3,
+}
+
+# CLASS_SLOT_TABLES[caster_type][class_level][slot_level], for single-class characters
+CLASS_SLOT_TABLES: Dict[CasterType, Tuple[Tuple[int, ...], ...]] = {
+    kind: tuple(SLOT_TABLE[level_of(level)] for level in range(MAX_CLASS_LEVEL + 1))
+    for kind, level_of in _SINGLE_CLASS_LEVEL.items()
+}
+
+# PACT_TABLE[warlock_level] = (number of pact slots, their slot level)
+PACT_TABLE: Tuple[Tuple[int, int], ...] = ((0, 0), (1, 1), (2, 1), (2, 2), (2, 2), (2, 3), (2, 3),
+                                           (2, 4), (2, 4), (2, 5), (2, 5)) + ((3, 5),) * 6 + ((4, 5),) * 4
+
+def caster_type(class_name: str) -> CasterType:
+    """
+    Raises:
+        KeyError: If the class has no spell slots
+    """
+    return CLASS_CASTER_TYPES[class_name.strip().lower()]
+
+def caster_level(class_levels: Mapping[str, int]) -> int:
+    """Combined caster level of the spellcasting classes, for the multiclass table"""
+    casters = [(CLASS_CASTER_TYPES.get(name.strip().lower()), level) for name, level in class_levels.items()]
+    casters = [(kind, level) for kind, level in casters if kind not in (None, CasterType.PACT)]
+    if len(casters) == 1:
+        kind, level = casters[0]
+        return _SINGLE_CLASS_LEVEL[kind](level)
+    return min(MAX_CLASS_LEVEL, sum(_MULTICLASS_LEVEL[kind](level) for kind, level in casters))
+
+_NO_SLOTS = array("B", bytes(MAX_SPELL_LEVEL + 1))
+
+class SpellSlots:
+    """Maximum and used spell slots by slot level, plus warlock pact slots"""
+
+    __slots__ = ("maximum", "used", "pact_slots", "pact_level", "pact_used")
+
+    def __init__(self, maximum: Sequence[int] = (), pact_slots: int = 0, pact_level: int = 0):
+        """
+        Args:
+            maximum: Slots per slot level, indexed from 0 (cantrips, always 0)
+            pact_slots: Number of pact magic slots
+            pact_level: Slot level of every pact slot
+        """
+        self.maximum = array("B", [*maximum, *(0,) * (MAX_SPELL_LEVEL + 1 - len(maximum))])
+        self.used = array("B", _NO_SLOTS)
+        self.pact_slots = pact_slots
+        self.pact_level = pact_level
+        self.pact_used = 0
+
+    @classmethod
+    def for_classes(cls, class_levels: Mapping[str, int]) -> "SpellSlots":
+        """Slots for a character's class levels, e.g. {"Wizard": 5, "Warlock": 2}"""
+        warlock = sum(level for name, level in class_levels.items()
+                      if CLASS_CASTER_TYPES.get(name.strip().lower()) == CasterType.PACT)
+        pact_slots, pact_level = PACT_TABLE[min(warlock, MAX_CLASS_LEVEL)]
+        return cls(SLOT_TABLE[caster_level(class_levels)], pact_slots, pact_level)
+
+    @classmethod
+    def from_maximums(cls, maximums: Mapping[int, int]) -> "SpellSlots":
+        """Slots entered by hand, by slot level"""
+        maximum = [0] * (MAX_SPELL_LEVEL + 1)
+        for level, count in maximums.items():
+            maximum[level] = count
+        return cls(maximum)
+
+    def __bool__(self) -> bool:
+        return any(self.maximum) or self.pact_slots > 0
+
+    def total(self, level: int) -> int:
+        """Maximum slots of a level, counting pact slots"""
+        return self.maximum[level] + (self.pact_slots if level == self.pact_level else 0)
+
+    def remaining(self, level: int) -> int:
+        """Unspent slots of a level, counting pact slots"""
+        remaining = self.maximum[level] - self.used[level]
+        if level == self.pact_level:
+            remaining += self.pact_slots - self.pact_used
+        return remaining
+
+    def spend(self, level: int) -> bool:
+        """Spend a slot of the given level, using a pact slot first"""
+        if level == self.pact_level and self.pact_used < self.pact_slots:
+            self.pact_used += 1
+            return True
+        if 0 < level <= MAX_SPELL_LEVEL and self.used[level] < self.maximum[level]:
+            self.used[level] += 1
+            return True
+        return False
+
+    def restore(self, level: int, count: int = 1) -> int:
+        """
+        Regain spent slots of a level (regular slots first)
+
+        Returns:
+            Number of slots regained
+        """
+        regained = 0
+        if 0 < level <= MAX_SPELL_LEVEL:
+            regained = min(count, self.used[level])
+            self.used[level] -= regained
+        if level == self.pact_level:
+            pact = min(count - regained, self.pact_used)
+            self.pact_used -= pact
+            regained += pact
+        return regained
+
+    def short_rest(self) -> None:
+        """Regain pact slots"""
+        self.pact_used = 0
+
+    def long_rest(self) -> None:
+        """Regain every slot"""
+        self.used[:] = _NO_SLOTS
+        self.pact_used = 0
+
+    def as_dict(self) -> Dict[int, int]:
+        """Remaining slots by slot level, for levels that have any slots"""
+        return {level: self.remaining(level) for level in range(1, MAX_SPELL_LEVEL + 1) if self.total(level)}
+
+    def load_remaining(self, remaining: Mapping[int, int]) -> None:
+        """Set slots used from saved remaining counts; levels not listed are unspent"""
+        self.long_rest()
+        for level, count in remaining.items():
+            spent = max(0, self.total(level) - count)
+            if level == self.pact_level:
+                self.pact_used = min(spent, self.pact_slots)
+                spent -= self.pact_used
+            if 0 < level <= MAX_SPELL_LEVEL:
+                self.used[level] = min(spent, self.maximum[level])
+
+    def carry_over(self, previous: "SpellSlots") -> None:
+        """Keep the slots spent from an older tracker, e.g. across a level up"""
+        for level in range(1, MAX_SPELL_LEVEL + 1):
+            self.used[level] = min(previous.used[level], self.maximum[level])
+        self.pact_used = min(previous.pact_used, self.pact_slots)
+
+def restore_roster(slots: Iterable[SpellSlots]) -> None:
+    """Long-rest restore for a whole roster of slot trackers"""
+    for tracker in slots:
+        tracker.long_rest()
@@ -0,0 +1,268 @@
+"""
+Spells from the D&D 5e SRD
+"""
+from ..equipment.lazy_catalog import LazyCatalog
+from .base import Spell, SpellComponent, SpellSchool
+
+V, S, M = SpellComponent.VERBAL, SpellComponent.SOMATIC, SpellComponent.MATERIAL
+
+SRD_SPELLS = LazyCatalog(Spell, {
+    "Acid Splash": dict(
+        name="Acid Splash", level=0, school=SpellSchool.CONJURATION, casting_time="1 action",
+        range="60 feet", components=[V, S], duration="Instantaneous",
+        description="You hurl a bubble of acid at one creature, or two creatures within 5 feet of each "
+                    "other. A target must succeed on a Dexterity saving throw or take 1d6 acid damage.",
+        higher_levels="The damage increases by 1d6 at 5th, 11th and 17th level.",
+        classes=["Sorcerer", "Wizard"],
+    ),
+    "Fire Bolt": dict(
+        name="Fire Bolt", level=0, school=SpellSchool.EVOCATION, casting_time="1 action",
+        range="120 feet", components=[V, S], duration="Instantaneous",
+        description="You hurl a mote of fire at a creature or object. Make a ranged spell attack; on a "
+                    "hit the target takes 1d10 fire damage. A flammable object hit by this spell ignites.",
+        higher_levels="The damage increases by 1d10 at 5th, 11th and 17th level.",
+        classes=["Sorcerer", "Wizard"],
+    ),
+    "Guidance": dict(
+        name="Guidance", level=0, school=SpellSchool.DIVINATION, casting_time="1 action",
+        range="Touch", components=[V, S], duration="Concentration, up to 1 minute",
+        description="You touch one willing creature. Once before the spell ends, the target can roll a "
+                    "d4 and add the number rolled to one ability check of its choice.",
+        concentration=True, classes=["Cleric", "Druid"],
+    ),
+    "Light": dict(
+        name="Light", level=0, school=SpellSchool.EVOCATION, casting_time="1 action",
+        range="Touch", components=[V, M], duration="1 hour", material_components="a firefly or phosphorescent moss",
+        description="You touch one object no larger than 10 feet in any dimension. Until the spell ends, "
+                    "the object sheds bright light in a 20-foot radius and dim light for an additional 20 feet.",
+        classes=["Bard", "Cleric", "Sorcerer", "Wizard"],
+    ),
+    "Mage Hand": dict(
+        name="Mage Hand", level=0, school=SpellSchool.CONJURATION, casting_time="1 action",
+        range="30 feet", components=[V, S], duration="1 minute",
+        description="A spectral, floating hand appears at a point you choose within range. You can use "
+                    "the hand to manipulate an object, open an unlocked door or container, or pour out a vial.",
+        classes=["Bard", "Sorcerer", "Warlock", "Wizard"],
+    ),
+    "Sacred Flame": dict(
+        name="Sacred Flame", level=0, school=SpellSchool.EVOCATION, casting_time="1 action",
+        range="60 feet", components=[V, S], duration="Instantaneous",
+        description="Flame-like radiance descends on a creature you can see. The target must succeed on a "
+                    "Dexterity saving throw or take 1d8 radiant damage, gaining no benefit from cover.",
+        higher_levels="The damage increases by 1d8 at 5th, 11th and 17th level.",
+        classes=["Cleric"],
+    ),
+    "Vicious Mockery": dict(
+        name="Vicious Mockery", level=0, school=SpellSchool.ENCHANTMENT, casting_time="1 action",
+        range="60 feet", components=[V], duration="Instantaneous",
+        description="You unleash a string of insults laced with subtle enchantments. A creature that fails "
+                    "a Wisdom saving throw takes 1d4 psychic damage and has disadvantage on its next attack roll.",
+        higher_levels="The damage increases by 1d4 at 5th, 11th and 17th level.",
+        classes=["Bard"],
+    ),
+    "Bless": dict(
+        name="Bless", level=1, school=SpellSchool.ENCHANTMENT, casting_time="1 action",
+        range="30 feet", components=[V, S, M], duration="Concentration, up to 1 minute",
+        material_components="a sprinkling of holy water",
+        description="You bless up to three creatures of your choice within range. Whenever a target makes "
+                    "an attack roll or a saving throw before the spell ends, it adds a d4 to the roll.",
+        higher_levels="You can target one additional creature for each slot level above 1st.",
+        concentration=True, classes=["Cleric", "Paladin"],
+    ),
+    "Cure Wounds": dict(
+        name="Cure Wounds", level=1, school=SpellSchool.EVOCATION, casting_time="1 action",
+        range="Touch", components=[V, S], duration="Instantaneous",
+        description="A creature you touch regains a number of hit points equal to 1d8 + your spellcasting "
+                    "ability modifier. This spell has no effect on undead or constructs.",
+        higher_levels="The healing increases by 1d8 for each slot level above 1st.",
+        classes=["Bard", "Cleric", "Druid", "Paladin", "Ranger"],
+    ),
+    "Detect Magic": dict(
+        name="Detect Magic", level=1, school=SpellSchool.DIVINATION, casting_time="1 action",
+        range="Self", components=[V, S], duration="Concentration, up to 10 minutes",
+        description="For the duration, you sense the presence of magic within 30 feet of you, and can see "
+                    "a faint aura around any visible creature or object that bears magic and learn its school.",
+        ritual=True, concentration=True,
+        classes=["Bard", "Cleric", "Druid", "Paladin", "Ranger", "Sorcerer", "Wizard"],
+    ),
+    "Find Familiar": dict(
+        name="Find Familiar", level=1, school=SpellSchool.CONJURATION, casting_time="1 hour",
+        range="10 feet", components=[V, S, M], duration="Instantaneous",
+        material_components="10 gp worth of charcoal, incense and herbs consumed in a brass brazier",
+        description="You gain the service of a familiar, a spirit that takes an animal form you choose, "
+                    "such as a bat, cat, owl or raven. It acts independently but obeys your commands.",
+        ritual=True, classes=["Wizard"],
+    ),
+    "Healing Word": dict(
+        name="Healing Word", level=1, school=SpellSchool.EVOCATION, casting_time="1 bonus action",
+        range="60 feet", components=[V], duration="Instantaneous",
+        description="A creature of your choice that you can see within range regains hit points equal to "
+                    "1d4 + your spellcasting ability modifier.",
+        higher_levels="The healing increases by 1d4 for each slot level above 1st.",
+        classes=["Bard", "Cleric", "Druid"],
+    ),
+    "Magic Missile": dict(
+        name="Magic Missile", level=1, school=SpellSchool.EVOCATION, casting_time="1 action",
+        range="120 feet", components=[V, S], duration="Instantaneous",
+        description="You create three glowing darts of magical force. Each dart hits a creature of your "
+                    "choice that you can see within range and deals 1d4 + 1 force damage.",
+        higher_levels="The spell creates one more dart for each slot level above 1st.",
+        classes=["Sorcerer", "Wizard"],
+    ),
+    "Shield": dict(
+        name="Shield", level=1, school=SpellSchool.ABJURATION, casting_time="1 reaction",
+        range="Self", components=[V, S], duration="1 round",
+        description="An invisible barrier of magical force protects you. Until the start of your next "
+                    "turn, you have a +5 bonus to AC, and you take no damage from magic missile.",
+        classes=["Sorcerer", "Wizard"],
+    ),
+    "Sleep": dict(
+        name="Sleep", level=1, school=SpellSchool.ENCHANTMENT, casting_time="1 action",
+        range="90 feet", components=[V, S, M], duration="1 minute",
+        material_components="a pinch of fine sand, rose petals, or a cricket",
+        description="This spell sends creatures into a magical slumber. Roll 5d8; the total is how many "
+                    "hit points of creatures this spell can affect, starting with the lowest.",
+        higher_levels="Roll an additional 2d8 for each slot level above 1st.",
+        classes=["Bard", "Sorcerer", "Wizard"],
+    ),
+    "Thunderwave": dict(
+        name="Thunderwave", level=1, school=SpellSchool.EVOCATION, casting_time="1 action",
+        range="Self (15-foot cube)", components=[V, S], duration="Instantaneous",
+        description="A wave of thunderous force sweeps out from you. Each creature in the cube makes a "
+                    "Constitution saving throw, taking 2d8 thunder damage and being pushed 10 feet on a failure.",
+        higher_levels="The damage increases by 1d8 for each slot level above 1st.",
+        classes=["Bard", "Druid", "Sorcerer", "Wizard"],
+    ),
+    "Hold Person": dict(
+        name="Hold Person", level=2, school=SpellSchool.ENCHANTMENT, casting_time="1 action",
+        range="60 feet", components=[V, S, M], duration="Concentration, up to 1 minute",
+        material_components="a small, straight piece of iron",
+        description="Choose a humanoid that you can see within range. The target must succeed on a Wisdom "
+                    "saving throw or be paralyzed for the duration.",
+        higher_levels="You can target one additional humanoid for each slot level above 2nd.",
+        concentration=True, classes=["Bard", "Cleric", "Druid", "Sorcerer", "Warlock", "Wizard"],
+    ),
+    "Invisibility": dict(
+        name="Invisibility", level=2, school=SpellSchool.ILLUSION, casting_time="1 action",
+        range="Touch", components=[V, S, M], duration="Concentration, up to 1 hour",
+        material_components="an eyelash encased in gum arabic",
+        description="A creature you touch becomes invisible until the spell ends. The spell ends for a "
+                    "target that attacks or casts a spell.",
+        higher_levels="You can target one additional creature for each slot level above 2nd.",
+        concentration=True, classes=["Bard", "Sorcerer", "Warlock", "Wizard"],
+    ),
+    "Misty Step": dict(
+        name="Misty Step", level=2, school=SpellSchool.CONJURATION, casting_time="1 bonus action",
+        range="Self", components=[V], duration="Instantaneous",
+        description="Briefly surrounded by silvery mist, you teleport up to 30 feet to an unoccupied space "
+                    "that you can see.",
+        classes=["Sorcerer", "Warlock", "Wizard"],
+    ),
+    "Spiritual Weapon": dict(
+        name="Spiritual Weapon", level=2, school=SpellSchool.EVOCATION, casting_time="1 bonus action",
+        range="60 feet", components=[V, S], duration="1 minute",
+        description="You create a floating, spectral weapon within range. Make a melee spell attack against "
+                    "a creature within 5 feet of the weapon; on a hit it takes 1d8 + your spellcasting "
+                    "ability modifier force damage.",
+        higher_levels="The damage increases by 1d8 for every two slot levels above 2nd.",
+        classes=["Cleric"],
+    ),
+    "Counterspell": dict(
+        name="Counterspell", level=3, school=SpellSchool.ABJURATION, casting_time="1 reaction",
+        range="60 feet", components=[S], duration="Instantaneous",
+        description="You attempt to interrupt a creature in the process of casting a spell. A spell of 3rd "
+                    "level or lower fails; for a higher level spell, make an ability check to stop it.",
+        higher_levels="The interrupted spell fails if its level is less than or equal to the slot used.",
+        classes=["Sorcerer", "Warlock", "Wizard"],
+    ),
+    "Fireball": dict(
+        name="Fireball", level=3, school=SpellSchool.EVOCATION, casting_time="1 action",
+        range="150 feet", components=[V, S, M], duration="Instantaneous",
+        material_components="a tiny ball of bat guano and sulfur",
+        description="A bright streak flashes to a point you choose and blossoms into an explosion of flame. "
+                    "Each creature in a 20-foot radius makes a Dexterity saving throw, taking 8d6 fire damage "
+                    "on a failed save, or half as much on a success.",
+        higher_levels="The damage increases by 1d6 for each slot level above 3rd.",
+        classes=["Sorcerer", "Wizard"],
+    ),
+    "Fly": dict(
+        name="Fly", level=3, school=SpellSchool.TRANSMUTATION, casting_time="1 action",
+        range="Touch", components=[V, S, M], duration="Concentration, up to 10 minutes",
+        material_components="a wing feather from any bird",
+        description="You touch a willing creature. The target gains a flying speed of 60 feet for the duration.",
+        higher_levels="You can target one additional creature for each slot level above 3rd.",
+        concentration=True, classes=["Sorcerer", "Warlock", "Wizard"],
+    ),
+    "Revivify": dict(
+        name="Revivify", level=3, school=SpellSchool.NECROMANCY, casting_time="1 action",
+        range="Touch", components=[V, S, M], duration="Instantaneous",
+        material_components="diamonds worth 300 gp, which the spell consumes",
+        description="You touch a creature that has died within the last minute. That creature returns to "
+                    "life with 1 hit point.",
+        classes=["Cleric", "Paladin"],
+    ),
+    "Banishment": dict(
+        name="Banishment", level=4, school=SpellSchool.ABJURATION, casting_time="1 action",
+        range="60 feet", components=[V, S, M], duration="Concentration, up to 1 minute",
+        material_components="an item distasteful to the target",
+        description="You attempt to send one creature that you can see to another plane of existence. The "
+                    "target must succeed on a Charisma saving throw or be banished.",
+        higher_levels="You can target one additional creature for each slot level above 4th.",
+        concentration=True, classes=["Cleric", "Paladin", "Sorcerer", "Warlock", "Wizard"],
+    ),
+    "Polymorph": dict(
+        name="Polymorph", level=4, school=SpellSchool.TRANSMUTATION, casting_time="1 action",
+        range="60 feet", components=[V, S, M], duration="Concentration, up to 1 hour",
+        material_components="a caterpillar cocoon",
+        description="This spell transforms a creature that you can see into a new form, a beast whose "
+                    "challenge rating is equal to or less than the target's level.",
+        concentration=True, classes=["Bard", "Druid", "Sorcerer", "Wizard"],
+    ),
+    "Cone of Cold": dict(
+        name="Cone of Cold", level=5, school=SpellSchool.EVOCATION, casting_time="1 action",
+        range="Self (60-foot cone)", components=[V, S, M], duration="Instantaneous",
+        material_components="a small crystal or glass cone",
+        description="A blast of cold air erupts from your hands. Each creature in a 60-foot cone makes a "
+                    "Constitution saving throw, taking 8d8 cold damage on a failed save.",
+        higher_levels="The damage increases by 1d8 for each slot level above 5th.",
+        classes=["Sorcerer", "Wizard"],
+    ),
+    "Raise Dead": dict(
+        name="Raise Dead", level=5, school=SpellSchool.NECROMANCY, casting_time="1 hour",
+        range="Touch", components=[V, S, M], duration="Instantaneous",
+        material_components="a diamond worth at least 500 gp, which the spell consumes",
+        description="You return a dead creature you touch to life, provided that it has been dead no longer "
+                    "than 10 days.",
+        classes=["Bard", "Cleric", "Paladin"],
+    ),
+    "Chain Lightning": dict(
+        name="Chain Lightning", level=6, school=SpellSchool.EVOCATION, casting_time="1 action",
+        range="150 feet", components=[V, S, M], duration="Instantaneous",
+        material_components="a bit of fur; a piece of amber, glass, or a crystal rod; and three silver pins",
+        description="You create a bolt of lightning that arcs toward a target, then leaps to up to three "
+                    "other targets. Each makes a Dexterity saving throw, taking 10d8 lightning damage on a failure.",
+        higher_levels="One additional bolt leaps for each slot level above 6th.",
+        classes=["Sorcerer", "Wizard"],
+    ),
+    "Teleport": dict(
+        name="Teleport", level=7, school=SpellSchool.CONJURATION, casting_time="1 action",
+        range="10 feet", components=[V], duration="Instantaneous",
+        description="This spell instantly transports you and up to eight willing creatures to a destination "
+                    "you select, on the same plane of existence.",
+        classes=["Bard", "Sorcerer", "Wizard"],
+    ),
+    "Power Word Stun": dict(
+        name="Power Word Stun", level=8, school=SpellSchool.ENCHANTMENT, casting_time="1 action",
+        range="60 feet", components=[V], duration="Instantaneous",
+        description="You speak a word of power that can overwhelm the mind of one creature. If the target "
+                    "has 150 hit points or fewer, it is stunned.",
+        classes=["Bard", "Sorcerer", "Warlock", "Wizard"],
+    ),
+    "Wish": dict(
+        name="Wish", level=9, school=SpellSchool.CONJURATION, casting_time="1 action",
+        range="Self", components=[V], duration="Instantaneous",
+        description="Wish is the mightiest spell a mortal creature can cast. By simply speaking aloud, you "
+                    "can alter the very foundations of reality in accord with your desires.",
+        classes=["Sorcerer", "Wizard"],
+    ),
+})
@@ -86,6 +86,7 @@ class CharacterHeaderWidget(ttk.Frame):
     def on_class_change(self, event=None):
         """Handle character class change"""
         self.character.character_class = self.class_var.get()
+        self.character.refresh_spell_slots()
         if self.on_change:
             self.on_change("class", self.character.character_class)
     
@@ -95,6 +96,7 @@ class CharacterHeaderWidget(ttk.Frame):
             self.character.progression.level = self.level_var.get()
             # Update proficiency bonus
             self.character.progression.proficiency_bonus = self.character.progression.calculate_proficiency_bonus()
+            self.character.refresh_spell_slots()
             if self.on_change:
                 self.on_change("level", self.character.progression.level)
         except tk.TclError:
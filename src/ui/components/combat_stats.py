@@ -13,6 +13,7 @@ class CombatStatsWidget(ttk.Frame):
         super().__init__(parent)
         self.character = character
         self.setup_ui()
+        self._follow_modifiers()
 
     def setup_ui(self):
         """Set up the combat stats UI"""
@@ -24,7 +25,7 @@ class CombatStatsWidget(ttk.Frame):
         ac_frame = ttk.Frame(self)
         ac_frame.pack(fill=tk.X, pady=2)
         ttk.Label(ac_frame, text="Armor Class:", width=15).pack(side=tk.LEFT)
-        self.ac_label = ttk.Label(ac_frame, text=str(self.character.vitals.armor_class), font=("Arial", 16, "bold"))
+        self.ac_label = ttk.Label(ac_frame, text=str(self.character.get_armor_class()), font=("Arial", 16, "bold"))
         self.ac_label.pack(side=tk.LEFT)
 
         # Hit Points
@@ -38,7 +39,7 @@ class CombatStatsWidget(ttk.Frame):
         speed_frame = ttk.Frame(self)
         speed_frame.pack(fill=tk.X, pady=2)
         ttk.Label(speed_frame, text="Speed:", width=15).pack(side=tk.LEFT)
-        self.speed_label = ttk.Label(speed_frame, text=f"{self.character.vitals.speed} ft.", font=("Arial", 16, "bold"))
+        self.speed_label = ttk.Label(speed_frame, text=f"{self.character.get_speed()} ft.", font=("Arial", 16, "bold"))
         self.speed_label.pack(side=tk.LEFT)
 
         # Initiative
@@ -62,12 +63,22 @@ class CombatStatsWidget(ttk.Frame):
 
     def update_vitals(self, character: Character):
         """Update displayed vitals"""
-        self.character = character
-        self.ac_label.config(text=str(self.character.vitals.armor_class))
+        if character is not self.character:
+            self.character.modifiers.remove_listener(self._on_modifiers_changed)
+            self.character = character
+            self._follow_modifiers()
+        self.ac_label.config(text=str(self.character.get_armor_class()))
         self.hp_label.config(text=f"{self.character.vitals.hit_points} / {self.character.vitals.max_hit_points}")
-        self.speed_label.config(text=f"{self.character.vitals.speed} ft.")
+        self.speed_label.config(text=f"{self.character.get_speed()} ft.")
         dex_mod = self.character.ability_scores.get_modifier(AbilityType.DEXTERITY)
         initiative = self.character.vitals.calculate_initiative(dex_mod)
         self.initiative_label.config(text=f"{initiative:+}")
         self.death_saves_success_label.config(text=f"Successes: {self.character.vitals.death_saves_successes}")
-        self.death_saves_failure_label.config(text=f"Failures: {self.character.vitals.death_saves_failures}")
\ No newline at end of file
+        self.death_saves_failure_label.config(text=f"Failures: {self.character.vitals.death_saves_failures}")
+
+    def _follow_modifiers(self):
+        """Refresh AC and speed when equipped items change the character's modifiers"""
+        self.character.modifiers.add_listener(self._on_modifiers_changed)
+
+    def _on_modifiers_changed(self, event: str, payload):
+        self.update_vitals(self.character)
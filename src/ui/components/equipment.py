@@ -6,6 +6,8 @@ from tkinter import ttk
 from typing import Optional, Callable
 from ...models.character.base import Character
 from ...models.equipment.base import InventoryItem
+from ...models.equipment.catalog import get_default_catalog
+from ...models.equipment.search import NameSearchIndex
 from ..dialogs.add_item_dialog import AddItemDialog
 
 class EquipmentWidget(ttk.Frame):
@@ -15,6 +17,7 @@ class EquipmentWidget(ttk.Frame):
         super().__init__(parent)
         self.character = character
         self.on_change = on_change
+        self.search_index: Optional[NameSearchIndex] = None  # Built on first use; keeps this session's homebrew
         self.setup_ui()
 
     def setup_ui(self):
@@ -81,7 +84,9 @@ class EquipmentWidget(ttk.Frame):
         ttk.Button(button_frame, text="Remove Item", command=self.remove_item).pack(side=tk.LEFT, padx=5)
 
     def add_item(self):
-        dialog = AddItemDialog(self)
+        if self.search_index is None:
+            self.search_index = NameSearchIndex.from_catalog(get_default_catalog())
+        dialog = AddItemDialog(self, self.search_index)
         if dialog.item:
             inventory_item = InventoryItem(equipment=dialog.item, quantity=dialog.quantity_var.get())
             self.character.equipment.append(inventory_item)
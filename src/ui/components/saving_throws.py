@@ -15,6 +15,8 @@ class SavingThrowsWidget(ttk.Frame):
         self.on_change = on_change
         self.saving_throw_vars = {}
         self.setup_ui()
+        # Items such as a Ring of Protection add to every save
+        self.character.modifiers.add_listener(lambda event, payload: self.update_all_modifiers())
 
     def setup_ui(self):
         """Set up the saving throws UI"""
@@ -47,15 +49,14 @@ class SavingThrowsWidget(ttk.Frame):
         setattr(self, f"{ability.value}_modifier_label", mod_label)
 
     def calculate_modifier(self, ability: AbilityType) -> int:
-        """Calculate the saving throw modifier"""
+        """Calculate the saving throw modifier, including item modifiers"""
         ability_modifier = self.character.ability_scores.get_modifier(ability)
         proficiency_bonus = self.character.progression.proficiency_bonus
         is_proficient = self.saving_throw_vars[ability.value].get()
 
-        if is_proficient:
-            return ability_modifier + proficiency_bonus
-        else:
-            return ability_modifier
+        if not is_proficient:
+            proficiency_bonus = 0
+        return self.character.modifiers.saving_throw_bonus(ability_modifier, proficiency_bonus)
 
     def on_proficiency_change(self, ability: AbilityType):
         """Handle proficiency checkbox change"""
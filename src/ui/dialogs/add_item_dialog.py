@@ -4,14 +4,21 @@ Dialog for adding a new item to the inventory.
 import tkinter as tk
 from tkinter import ttk
 from ...models.equipment.base import Equipment, EquipmentType
+from ...models.equipment.catalog import get_default_catalog
+from ...models.equipment.search import NameSearchIndex
 
 class AddItemDialog(tk.Toplevel):
-    def __init__(self, parent):
+    def __init__(self, parent, search_index: NameSearchIndex = None):
         super().__init__(parent)
         self.title("Add New Item")
         self.item = None
+        # Homebrew typed here is added to the index, so it must not be the shared default
+        if search_index is None:
+            search_index = NameSearchIndex.from_catalog(get_default_catalog())
+        self.search_index = search_index
 
         self.name_var = tk.StringVar()
+        self.name_var.trace_add("write", self.on_name_changed)
         self.type_var = tk.StringVar(value=EquipmentType.ADVENTURING_GEAR.value)
         self.quantity_var = tk.IntVar(value=1)
         self.weight_var = tk.DoubleVar(value=0.0)
@@ -27,36 +34,70 @@ class AddItemDialog(tk.Toplevel):
 
         # Name
         ttk.Label(frame, text="Item Name:").grid(row=0, column=0, sticky=tk.W, pady=2)
-        ttk.Entry(frame, textvariable=self.name_var).grid(row=0, column=1, sticky=tk.EW, pady=2)
+        name_entry = ttk.Entry(frame, textvariable=self.name_var)
+        name_entry.grid(row=0, column=1, sticky=tk.EW, pady=2)
+        name_entry.focus_set()
+
+        # Catalog suggestions, refreshed on every keystroke
+        self.suggestions = tk.Listbox(frame, height=6, exportselection=False)
+        self.suggestions.grid(row=1, column=1, sticky=tk.EW, pady=2)
+        self.suggestions.bind("<<ListboxSelect>>", self.on_suggestion_selected)
+        name_entry.bind("<Down>", lambda event: self.suggestions.focus_set())
 
         # Type
-        ttk.Label(frame, text="Item Type:").grid(row=1, column=0, sticky=tk.W, pady=2)
+        ttk.Label(frame, text="Item Type:").grid(row=2, column=0, sticky=tk.W, pady=2)
         type_options = [e.value for e in EquipmentType]
-        ttk.OptionMenu(frame, self.type_var, self.type_var.get(), *type_options).grid(row=1, column=1, sticky=tk.EW, pady=2)
+        ttk.OptionMenu(frame, self.type_var, self.type_var.get(), *type_options).grid(row=2, column=1, sticky=tk.EW, pady=2)
 
         # Quantity
-        ttk.Label(frame, text="Quantity:").grid(row=2, column=0, sticky=tk.W, pady=2)
-        ttk.Entry(frame, textvariable=self.quantity_var).grid(row=2, column=1, sticky=tk.EW, pady=2)
+        ttk.Label(frame, text="Quantity:").grid(row=3, column=0, sticky=tk.W, pady=2)
+        ttk.Entry(frame, textvariable=self.quantity_var).grid(row=3, column=1, sticky=tk.EW, pady=2)
 
         # Weight
-        ttk.Label(frame, text="Weight (lbs):").grid(row=3, column=0, sticky=tk.W, pady=2)
-        ttk.Entry(frame, textvariable=self.weight_var).grid(row=3, column=1, sticky=tk.EW, pady=2)
+        ttk.Label(frame, text="Weight (lbs):").grid(row=4, column=0, sticky=tk.W, pady=2)
+        ttk.Entry(frame, textvariable=self.weight_var).grid(row=4, column=1, sticky=tk.EW, pady=2)
 
         # Buttons
         button_frame = ttk.Frame(frame)
-        button_frame.grid(row=4, columnspan=2, pady=10)
+        button_frame.grid(row=5, columnspan=2, pady=10)
         ttk.Button(button_frame, text="OK", command=self.on_ok).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Cancel", command=self.destroy).pack(side=tk.LEFT, padx=5)
 
+    def on_name_changed(self, *args):
+        """Refresh suggestions for the text typed so far"""
+        self.suggestions.delete(0, tk.END)
+        text = self.name_var.get()
+        if text.strip():
+            self.suggestions.insert(tk.END, *self.search_index.search(text))
+
+    def on_suggestion_selected(self, event):
+        """Fill in the form from the chosen catalog item"""
+        selection = self.suggestions.curselection()
+        if not selection:
+            return
+        equipment = self.search_index.get(self.suggestions.get(selection[0]))
+        self.type_var.set(equipment.type.value)
+        self.weight_var.set(equipment.weight)
+        self.name_var.set(equipment.name)
+
     def on_ok(self):
         name = self.name_var.get()
         if not name:
             return # Or show an error
 
-        self.item = Equipment(
-            name=name,
-            type=EquipmentType(self.type_var.get()),
-            description="", # Placeholder
-            weight=self.weight_var.get()
-        )
+        equipment = self.search_index.get(name)
+        if equipment is not None and equipment.type.value == self.type_var.get() \
+                and equipment.weight == self.weight_var.get():
+            # Unchanged catalog item
+            self.item = equipment
+        else:
+            self.item = Equipment(
+                name=name,
+                type=EquipmentType(self.type_var.get()),
+                description="", # Placeholder
+                weight=self.weight_var.get()
+            )
+            if name not in self.search_index:
+                # Offer the new item in later searches this session
+                self.search_index.add_homebrew(self.item)
         self.destroy()
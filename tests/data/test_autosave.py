@@ -0,0 +1,112 @@
+"""
+Tests for the debounced autosave pipeline
+"""
+import threading
+import time
+import pytest
+from src.data.autosave import AutosaveManager
+from src.models.character.base import Character
+
+class RecordingSaver:
+    """Stand-in for CharacterDatabase.save_character"""
+
+    def __init__(self, fail=False):
+        self.saved = []
+        self.threads = set()
+        self.fail = fail
+
+    def __call__(self, character):
+        self.threads.add(threading.get_ident())
+        if self.fail:
+            raise IOError("disk full")
+        self.saved.append(character.name)
+        return len(self.saved)
+
+class FakeRoot:
+    """Records root.after callbacks instead of running a Tk main loop"""
+
+    def __init__(self):
+        self.callbacks = []
+
+    def after(self, ms, callback):
+        self.callbacks.append(callback)
+
+@pytest.fixture
+def saver():
+    return RecordingSaver()
+
+def test_bursts_are_coalesced(saver):
+    manager = AutosaveManager(saver, delay=0.05)
+    hero = Character(name="Hero")
+    for _ in range(25):
+        manager.schedule(hero)
+
+    assert saver.saved == []  # Nothing saved on the calling thread
+    assert manager.flush(timeout=5)
+    manager.stop()
+
+    assert saver.saved == ["Hero"]
+    assert threading.get_ident() not in saver.threads
+
+def test_each_character_saved(saver):
+    manager = AutosaveManager(saver, delay=0.01)
+    for name in ("Ada", "Bex"):
+        manager.schedule(Character(name=name))
+    time.sleep(0.1)
+    manager.flush(timeout=5)
+    manager.stop()
+
+    assert sorted(saver.saved) == ["Ada", "Bex"]
+    assert manager.pending_count() == 0
+
+def test_snapshot_taken_once_the_character_is_quiet():
+    saved = []
+    manager = AutosaveManager(saved.append, delay=0.2)
+    root = FakeRoot()
+    manager.attach(root, lambda result: None)
+    hero = Character(name="Hero")
+    manager.schedule(hero)
+    hero.spells_known.append("Shield")  # Edits before the delay expires are saved
+
+    root.callbacks.pop()()  # Still within the delay: nothing snapshotted
+    assert manager.snapshot_due() == 0
+    time.sleep(0.25)
+    root.callbacks.pop()()
+    hero.name = "Edited later"  # Not rescheduled, so not part of this save
+    manager.stop(timeout=5)
+
+    (copy,) = saved
+    assert copy is not hero
+    assert copy.name == "Hero" and copy.spells_known == ["Shield"]
+    assert copy.id == hero.id is not None
+
+def test_stop_saves_pending(saver):
+    manager = AutosaveManager(saver, delay=60)
+    manager.schedule(Character(name="Late"))
+    manager.stop(timeout=5)
+    assert saver.saved == ["Late"]
+
+def test_results_reach_main_loop(saver):
+    manager = AutosaveManager(saver, delay=0)
+    root = FakeRoot()
+    delivered = []
+    manager.attach(root, delivered.append)
+
+    manager.schedule(Character(name="Hero"))
+    manager.flush(timeout=5)
+    root.callbacks.pop()()  # One tick of the main loop
+
+    assert [result.character.name for result in delivered] == ["Hero"]
+    assert delivered[0].succeeded and delivered[0].result == 1
+    assert root.callbacks  # Polling rescheduled itself
+    manager.stop()
+
+def test_errors_are_reported():
+    manager = AutosaveManager(RecordingSaver(fail=True), delay=0)
+    manager.schedule(Character(name="Hero"))
+    manager.flush(timeout=5)
+    manager.stop()
+
+    (result,) = manager.drain_completed()
+    assert not result.succeeded
+    assert isinstance(result.error, IOError)
@@ -0,0 +1,73 @@
+"""
+Tests for content-addressed character backups
+"""
+import zlib
+import pytest
+from src.data.backup import BackupStore
+from src.models.character.base import Character
+from src.models.equipment.armor import LIGHT_ARMOR
+from src.models.equipment.weapons import SIMPLE_MELEE_WEAPONS
+
+@pytest.fixture
+def store(tmp_path):
+    return BackupStore(tmp_path / "backups")
+
+@pytest.fixture
+def party():
+    """Characters that all carry the same catalog items"""
+    characters = []
+    for index in range(5):
+        character = Character(name=f"Adventurer {index}", id=f"char-{index}")
+        character.inventory.add_item(SIMPLE_MELEE_WEAPONS["Dagger"], 2)
+        character.inventory.add_item(LIGHT_ARMOR["Leather"])
+        characters.append(character)
+    return characters
+
+def test_round_trip(store, party):
+    info = store.backup(party, "first")
+    assert info.characters == 5
+    assert store.list_backups() == ["first"]
+    assert list(store.iter_restore("first")) == party
+
+def test_shared_equipment_stored_once(store, party):
+    info = store.backup(party, "first")
+    # Five character chunks plus one chunk each for the dagger and the armor
+    assert info.chunks_written == 7
+    assert info.chunks_reused == 8
+
+def test_incremental_backup_writes_only_changes(store, party):
+    store.backup(party, "first")
+    party[2].notes = "Lost an eye"
+    info = BackupStore(store.directory).backup(party, "second")
+    assert info.chunks_written == 1
+
+    restored = {character.id: character for character in store.iter_restore("second")}
+    assert restored["char-2"].notes == "Lost an eye"
+    assert store.restore_character("first", "char-2").notes == ""
+
+def test_restore_single_character(store, party):
+    store.backup(party, "first")
+    restored = store.restore_character("first", "char-3")
+    assert restored == party[3]
+    assert [item.item_id for item in restored.inventory.items] == [
+        item.item_id for item in party[3].inventory.items
+    ]
+    with pytest.raises(KeyError):
+        store.restore_character("first", "missing")
+
+def test_corrupt_chunk_detected(store, party):
+    store.backup(party[:1], "first")
+    chunk = next(path for path in store.chunk_dir.glob("*/*"))
+    chunk.write_bytes(zlib.compress(b'{"tampered": true}'))
+    with pytest.raises(ValueError):
+        list(store.iter_restore("first"))
+
+def test_garbage_collection(store, party):
+    store.backup(party, "first")
+    party[0].notes = "Changed"
+    store.backup(party, "second")
+    assert store.collect_garbage() == 0
+
+    store.delete_backup("first")
+    assert store.collect_garbage() == 1
+    assert list(store.iter_restore("second")) == party
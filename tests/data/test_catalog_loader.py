@@ -0,0 +1,113 @@
+"""
+Tests for data-driven catalog loading
+"""
+import json
+import pickle
+import pytest
+from src.data.loaders.catalog_loader import CatalogLoader, CatalogValidationError
+from src.data.serializers import equipment_to_dict
+from src.models.equipment.armor import HEAVY_ARMOR, SHIELDS
+from src.models.equipment.catalog import EquipmentQuery
+from src.models.equipment.magic_items import WONDROUS_ITEMS
+from src.models.equipment.weapons import SIMPLE_MELEE_WEAPONS, WeaponProperty
+
+CSV_CATALOG = """kind,name,category,damage_dice,damage_type,properties,weight,value,weapon_range
+Weapon,Sickle,simple_melee,1d4,slashing,light,2,100,
+Weapon,Javelin,simple_melee,1d6,piercing,thrown,2,50,"{""normal"": 30, ""long"": 120}"
+Weapon,Rapier,martial_melee,1d8,piercing,finesse,2,2500,
+"""
+
+class FailsToUnpickle:
+    """Pickles fine, but unpickling calls int("x") and raises ValueError"""
+
+    def __reduce__(self):
+        return (int, ("x",))
+
+@pytest.fixture
+def loader(tmp_path):
+    return CatalogLoader(tmp_path / "cache")
+
+@pytest.fixture
+def json_catalog(tmp_path):
+    items = [SIMPLE_MELEE_WEAPONS["Dagger"], HEAVY_ARMOR["Plate"], SHIELDS["Shield"], WONDROUS_ITEMS["Boots of Speed"]]
+    path = tmp_path / "srd.json"
+    path.write_text(json.dumps({"items": [equipment_to_dict(item) for item in items]}))
+    return path, items
+
+def test_json_round_trip(loader, json_catalog):
+    path, items = json_catalog
+    assert loader.load(path) == items
+
+def test_csv_catalog(loader, tmp_path):
+    path = tmp_path / "extra.csv"
+    path.write_text(CSV_CATALOG)
+    catalog = loader.load_catalog(path)
+
+    assert catalog["Javelin"].weapon_range.long == 120
+    assert catalog["Sickle"].value == 100 and catalog["Sickle"].weight == 2.0
+    finesse = catalog.find(EquipmentQuery(properties=[WeaponProperty.FINESSE]))
+    assert [item.name for item in finesse] == ["Rapier"]
+
+def test_cache_skips_parsing_until_source_changes(loader, json_catalog):
+    path, items = json_catalog
+    loader.load(path)
+    assert (loader.builds, loader.cache_hits) == (1, 0)
+
+    fresh = CatalogLoader(loader.cache_dir)
+    assert fresh.load(path) == items
+    assert (fresh.builds, fresh.cache_hits) == (0, 1)
+
+    data = json.loads(path.read_text())
+    data["items"] = data["items"][:1]
+    path.write_text(json.dumps(data))
+    assert fresh.load(path) == items[:1]
+    assert fresh.builds == 1
+    assert len(list(loader.cache_dir.glob("srd.json.*.pickle"))) == 1
+
+def test_corrupt_cache_is_rebuilt(loader, json_catalog):
+    path, items = json_catalog
+    loader.load(path)
+    for cache_file in loader.cache_dir.iterdir():
+        cache_file.write_bytes(b"not a pickle")
+    assert loader.load(path) == items
+    assert loader.builds == 2
+
+def test_same_file_name_in_different_folders(loader, json_catalog, tmp_path):
+    path, items = json_catalog
+    other = tmp_path / "other" / path.name
+    other.parent.mkdir()
+    other.write_text(json.dumps({"items": [equipment_to_dict(items[0])]}))
+
+    for source in (path, other, path, other):
+        loader.load(source)
+    assert (loader.builds, loader.cache_hits) == (2, 2)
+
+def test_unusable_cache_is_rebuilt(loader, json_catalog):
+    path, items = json_catalog
+    loader.load(path)
+    for cache_file in loader.cache_dir.iterdir():
+        cache_file.write_bytes(pickle.dumps(FailsToUnpickle()))
+    assert loader.load(path) == items
+    assert loader.builds == 2
+
+def test_validation_reports_every_problem(loader, tmp_path):
+    path = tmp_path / "broken.json"
+    path.write_text(json.dumps([
+        {"kind": "Weapon", "name": "Good Sword", "damage_type": "slashing"},
+        {"kind": "Spaceship", "name": "Nope"},
+        {"kind": "Weapon", "name": "Bad Axe", "damage_type": "sharpness"},
+        {"kind": "Armor", "weight": -3},
+        {"kind": "Weapon", "name": "Good Sword"},
+        {"kind": "Weapon", "name": "Typo", "dammage": "1d6"},
+    ]))
+    with pytest.raises(CatalogValidationError) as excinfo:
+        loader.load(path)
+
+    problems = excinfo.value.problems
+    assert len(problems) == 6
+    assert "unknown kind 'Spaceship'" in problems[0]
+    assert "Bad Axe" in problems[1]
+    assert "missing name" in problems[2] and "weight must not be negative" in problems[3]
+    assert "duplicate of item 1" in problems[4]
+    assert "unknown fields dammage" in problems[5]
+    assert not list(loader.cache_dir.iterdir())
@@ -0,0 +1,84 @@
+"""
+Tests for SQLite character storage
+"""
+import pytest
+from src.data.database.character_db import CharacterDatabase
+from src.data.database.migrations import MIGRATIONS, schema_version
+from src.models.character.base import Character, AbilityScores
+from src.models.equipment.weapons import SIMPLE_MELEE_WEAPONS, MARTIAL_MELEE_WEAPONS
+
+@pytest.fixture
+def test_db(tmp_path):
+    """Create temporary database for testing"""
+    db = CharacterDatabase(tmp_path / "test.db")
+    yield db
+    db.close()
+
+@pytest.fixture
+def sample_character():
+    """Create sample character for testing"""
+    character = Character(
+        name="Test Character",
+        character_class="Fighter",
+        race="Human",
+        ability_scores=AbilityScores(strength=15, dexterity=14)
+    )
+    character.inventory.add_item(MARTIAL_MELEE_WEAPONS["Longsword"])
+    character.inventory.add_item(SIMPLE_MELEE_WEAPONS["Dagger"], 3)
+    return character
+
+def test_schema_migrated_once(test_db, tmp_path):
+    assert test_db.schema_version == MIGRATIONS[-1][0]
+    with test_db.reader() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    # Reopening an up-to-date database is a no-op
+    again = CharacterDatabase(tmp_path / "test.db")
+    assert again.schema_version == test_db.schema_version
+    again.close()
+
+def test_save_and_load(test_db, sample_character):
+    character_id = test_db.save_character(sample_character)
+    assert sample_character.id == character_id
+
+    loaded = test_db.load_character(character_id)
+    assert loaded == sample_character
+    assert [(item.display_name, item.quantity) for item in loaded.inventory.items] == [
+        ("Longsword", 1), ("Dagger", 3)
+    ]
+
+def test_update_replaces_inventory(test_db, sample_character):
+    character_id = test_db.save_character(sample_character)
+    sample_character.name = "Renamed"
+    sample_character.inventory.remove_item(sample_character.inventory.items[0])
+    test_db.save_character(sample_character)
+
+    loaded = test_db.load_character(character_id)
+    assert loaded.name == "Renamed"
+    assert [item.display_name for item in loaded.inventory.items] == ["Dagger"]
+    assert len(test_db.list_characters()) == 1
+
+def test_bulk_save_and_list(test_db):
+    roster = [Character(name=f"Hero {i:03d}", character_class="Wizard") for i in range(200)]
+    for character in roster:
+        character.inventory.add_item(SIMPLE_MELEE_WEAPONS["Quarterstaff"])
+
+    ids = test_db.save_characters(roster)
+    assert len(set(ids)) == 200
+
+    listed = test_db.list_characters()
+    assert [row["name"] for row in listed] == sorted(c.name for c in roster)
+    with test_db.reader() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM inventory_items").fetchone()[0] == 200
+
+def test_delete(test_db, sample_character):
+    character_id = test_db.save_character(sample_character)
+    assert test_db.delete_character(character_id) is True
+    assert test_db.delete_character(character_id) is False
+    assert test_db.load_character(character_id) is None
+
+def test_readers_are_read_only(test_db):
+    import sqlite3
+    with test_db.reader() as conn:
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("DELETE FROM characters")
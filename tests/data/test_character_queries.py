@@ -0,0 +1,94 @@
+"""
+Tests for character queries and full-text search
+"""
+import sqlite3
+import pytest
+from src.data.database.character_db import UPSERT_CHARACTER, CharacterDatabase, character_rows
+from src.data.database.migrations import MIGRATIONS
+from src.data.database.queries import CharacterQuery, fts_match_expression
+from src.models.character.base import Character
+from src.models.equipment.magic_items import MAGIC_WEAPONS
+
+@pytest.fixture
+def populated_db(tmp_path):
+    db = CharacterDatabase(tmp_path / "test.db")
+    roster = []
+    for i in range(60):
+        character = Character(
+            name=f"Hero {i:02d}",
+            character_class="Artificer" if i % 2 else "Wizard",
+            race="Warforged" if i % 3 else "Elf",
+            notes="Swore revenge on Strahd" if i % 10 == 0 else "Just passing through",
+            class_features=["Magical Tinkering"] if i % 2 else ["Arcane Recovery"],
+        )
+        character.progression.level = i % 20 + 1
+        if i % 15 == 0:
+            character.inventory.add_item(MAGIC_WEAPONS["Flame Tongue"])
+        roster.append(character)
+    db.save_characters(roster)
+    yield db
+    db.close()
+
+def names(rows):
+    return [row["name"] for row in rows]
+
+def test_class_race_level(populated_db):
+    query = CharacterQuery(character_class="Artificer", race="Warforged", min_level=5)
+    rows = populated_db.find_characters(query)
+
+    assert rows
+    assert all(row["character_class"] == "Artificer" and row["race"] == "Warforged" for row in rows)
+    assert all(row["level"] >= 5 for row in rows)
+    assert names(rows) == sorted(names(rows))
+
+    plan = " ".join(populated_db.explain_query(query))
+    assert "USING INDEX idx_characters_" in plan
+    assert "SCAN c" not in plan
+
+def test_item_owner(populated_db):
+    query = CharacterQuery(item_name="Flame Tongue")
+    assert names(populated_db.find_characters(query)) == ["Hero 00", "Hero 15", "Hero 30", "Hero 45"]
+    assert any("COVERING INDEX idx_inventory_items_name" in step for step in populated_db.explain_query(query))
+
+def test_full_text_search(populated_db):
+    query = CharacterQuery(text="strahd")
+    assert names(populated_db.find_characters(query)) == [f"Hero {i:02d}" for i in range(0, 60, 10)]
+    assert any("VIRTUAL TABLE INDEX" in step for step in populated_db.explain_query(query))
+
+    features = CharacterQuery(text="tinkering", max_level=3)
+    assert all(row["character_class"] == "Artificer" for row in populated_db.find_characters(features))
+
+def test_search_index_follows_updates(populated_db):
+    hero = populated_db.find_characters(CharacterQuery(text="strahd", limit=1))[0]
+    character = populated_db.load_character(hero["id"])
+    character.notes = "Made peace with the count"
+    populated_db.save_character(character)
+    assert hero["id"] not in {row["id"] for row in populated_db.find_characters(CharacterQuery(text="strahd"))}
+
+    populated_db.delete_character(hero["id"])
+    assert not populated_db.find_characters(CharacterQuery(text="peace count"))
+
+def test_match_expression_is_quoted():
+    assert fts_match_expression('Strahd "von" Zarovich OR') == '"Strahd" AND "von" AND "Zarovich" AND "OR"'
+
+def test_text_without_words_matches_nothing(populated_db):
+    for text in ("!!!", "--"):
+        assert populated_db.find_characters(CharacterQuery(text=text)) == []
+
+def test_upgraded_rows_are_indexed_like_new_ones(tmp_path):
+    character = Character(name="Old Hero", id="old", notes="Veteran",
+                          class_features=["Second Wind", "Action Surge"], racial_traits=["Darkvision"])
+    path = tmp_path / "old.db"
+    conn = sqlite3.connect(path)
+    conn.executescript(MIGRATIONS[0][1] + "PRAGMA user_version = 1;")
+    rows = character_rows(character)
+    conn.execute(UPSERT_CHARACTER, rows.character)
+    conn.commit()
+    conn.close()
+
+    db = CharacterDatabase(path)
+    with db.reader() as reader:
+        indexed = reader.execute("SELECT notes, class_features, racial_traits FROM characters_fts").fetchall()
+    assert indexed == [rows.search[:3]]
+    assert names(db.find_characters(CharacterQuery(text="action surge"))) == ["Old Hero"]
+    db.close()
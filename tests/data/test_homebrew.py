@@ -0,0 +1,192 @@
+"""
+Tests for live-reloaded homebrew content
+"""
+import json
+import os
+import time
+import pytest
+from src.data.loaders.catalog_loader import CatalogLoader
+from src.data.loaders.homebrew import HomebrewRegistry
+from src.data.serializers import decode_dataclass, equipment_to_dict
+from src.models.equipment.base import Equipment, EquipmentType
+from src.models.equipment.catalog import EquipmentCatalog
+from src.models.equipment.inventory import Inventory
+from src.models.equipment.search import NameSearchIndex
+from src.models.equipment.weapons import SIMPLE_MELEE_WEAPONS
+from src.models.spells.base import Spell
+from src.models.spells.compendium import SpellCompendium
+
+def write(path, data):
+    """Write a file and move its mtime forward so the change is always seen"""
+    existed = path.exists()
+    mtime = path.stat().st_mtime_ns if existed else 0
+    path.write_text(json.dumps(data))
+    if existed:
+        os.utime(path, ns=(mtime + 10**9, mtime + 10**9))
+
+def item(name, weight=1.0, **kwargs):
+    return equipment_to_dict(Equipment(name=name, type=EquipmentType.TREASURE, weight=weight, **kwargs))
+
+FIREBALL = {"name": "Fireball", "level": 3, "school": "evocation", "casting_time": "1 action",
+            "range": "150 feet", "components": ["V", "S", "M"], "duration": "Instantaneous",
+            "description": "A bright streak flashes."}
+
+@pytest.fixture
+def registry(tmp_path):
+    catalog = EquipmentCatalog([SIMPLE_MELEE_WEAPONS["Dagger"]])
+    return HomebrewRegistry(tmp_path / "homebrew", catalog, NameSearchIndex(catalog),
+                            CatalogLoader(tmp_path / "cache"))
+
+def test_new_file_is_merged(registry):
+    write(registry.items_dir / "loot.json", [item("Glowing Pebble"), item("Troll Tooth")])
+    changes = registry.poll()
+
+    assert sorted(changes.added_items) == ["Glowing Pebble", "Troll Tooth"]
+    assert registry.catalog["Troll Tooth"].weight == 1.0
+    assert "Glowing Pebble" in registry.search_index.homebrew
+    assert registry.search_index.complete("trol") == ["Troll Tooth"]
+
+def test_only_changed_files_are_parsed(registry):
+    write(registry.items_dir / "a.json", [item("Pebble A")])
+    write(registry.items_dir / "b.json", [item("Pebble B")])
+    registry.poll()
+    builds = registry.loader.builds
+
+    assert not registry.poll().changed
+    write(registry.items_dir / "b.json", [item("Pebble B", weight=3.0)])
+    changes = registry.poll()
+
+    assert registry.loader.builds == builds + 1
+    assert changes.updated_items == ["Pebble B"]
+    assert registry.catalog["Pebble B"].weight == 3.0
+
+def test_edit_rebinds_watched_inventories(registry):
+    write(registry.items_dir / "loot.json", [item("Troll Tooth")])
+    registry.poll()
+    inventory = Inventory()
+    inventory.add_item(registry.catalog["Troll Tooth"], quantity=4)
+    registry.watch(inventory)
+    events = []
+    inventory.add_listener(lambda event, payload: events.append(event))
+
+    write(registry.items_dir / "loot.json", [item("Troll Tooth", weight=2.5)])
+    registry.poll()
+
+    assert inventory.items[0].equipment.weight == 2.5
+    assert inventory.calculate_total_weight() == 10.0
+    assert events == ["templates_changed"]
+
+def test_removed_file_restores_shadowed_entry(registry):
+    dagger = registry.catalog["Dagger"]
+    inventory = Inventory()
+    inventory.add_item(dagger)
+    registry.watch(inventory)
+
+    path = registry.items_dir / "dagger.json"
+    write(path, [item("Dagger", weight=0.5)])
+    registry.poll()
+    assert inventory.items[0].equipment.weight == 0.5
+
+    path.unlink()
+    changes = registry.poll()
+    assert changes.removed_items == ["Dagger"]
+    assert registry.catalog["Dagger"] is dagger
+    assert inventory.items[0].equipment is dagger
+
+def test_same_name_in_two_files(registry):
+    write(registry.items_dir / "a.json", [item("Troll Tooth", weight=1.0)])
+    registry.poll()
+    inventory = Inventory()
+    inventory.add_item(registry.catalog["Troll Tooth"])
+    registry.watch(inventory)
+
+    write(registry.items_dir / "b.json", [item("Troll Tooth", weight=2.0)])
+    registry.poll()
+    assert inventory.items[0].equipment.weight == 2.0
+
+    (registry.items_dir / "b.json").unlink()
+    assert registry.poll().updated_items == ["Troll Tooth"]
+    assert inventory.items[0].equipment.weight == 1.0
+    assert registry.catalog["Troll Tooth"] is inventory.items[0].equipment
+
+    (registry.items_dir / "a.json").unlink()
+    assert registry.poll().removed_items == ["Troll Tooth"]
+    assert "Troll Tooth" not in registry.catalog
+
+def test_invalid_edit_keeps_last_good_entries(registry):
+    path = registry.items_dir / "loot.json"
+    write(path, [item("Troll Tooth")])
+    registry.poll()
+
+    write(path, [item("Troll Tooth", weight=-1)])
+    changes = registry.poll()
+    assert str(path) in changes.errors
+    assert registry.catalog["Troll Tooth"].weight == 1.0
+
+def test_spell_files(registry):
+    path = registry.spells_dir / "spells.json"
+    write(path, [FIREBALL])
+    registry.poll()
+    assert registry.spells["Fireball"].level == 3
+
+    write(path, [])
+    changes = registry.poll()
+    assert changes.removed_spells == ["Fireball"]
+    assert "Fireball" not in registry.spells
+
+class FakeRoot:
+    """Records root.after callbacks instead of running a Tk main loop"""
+
+    def __init__(self):
+        self.callbacks = []
+
+    def after(self, ms, callback):
+        self.callbacks.append(callback)
+
+def test_watcher_leaves_applying_to_the_main_loop(registry):
+    root = FakeRoot()
+    applied = []
+    registry.start(interval=0.01)
+    registry.attach(root, applied.append)
+    try:
+        write(registry.items_dir / "loot.json", [item("Troll Tooth")])
+        deadline = time.monotonic() + 5
+        while registry._parsed.empty() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert "Troll Tooth" not in registry.catalog  # Parsed, but not applied off the main loop
+
+        root.callbacks.pop()()  # One tick of the main loop
+        assert [changes.added_items for changes in applied] == [["Troll Tooth"]]
+        assert "Troll Tooth" in registry.catalog
+        assert root.callbacks
+    finally:
+        registry.stop()
+
+def test_change_notification(registry):
+    received = []
+    registry.add_listener(lambda event, payload: received.append(payload["changes"]))
+    write(registry.items_dir / "loot.json", [item("Troll Tooth")])
+    registry.poll()
+    registry.poll()
+
+    assert len(received) == 1
+    assert received[0].added_items == ["Troll Tooth"]
+
+def test_spells_merge_into_compendium(tmp_path):
+    compendium = SpellCompendium([decode_dataclass(Spell, FIREBALL)])
+    srd_fireball = compendium["Fireball"]
+    registry = HomebrewRegistry(tmp_path / "homebrew", compendium=compendium)
+    path = registry.spells_dir / "spells.json"
+
+    write(path, [{**FIREBALL, "description": "A cold blue flame."},
+                 {**FIREBALL, "name": "Frostball", "description": "Freezing hail."}])
+    registry.poll()
+    assert [spell.name for spell in compendium.search("blue flame")] == ["Fireball"]
+    assert compendium.search("hail")[0].name == "Frostball"
+
+    write(path, [{**FIREBALL, "description": "A cold blue flame."}])
+    registry.poll()  # Fireball is unchanged
+    path.unlink()
+    registry.poll()
+    assert compendium["Fireball"] is srd_fireball
+    assert "Frostball" not in compendium
@@ -0,0 +1,147 @@
+"""
+Tests for the append-only event journal
+"""
+import json
+import pytest
+from src.data.journal import EventJournal
+from src.models.character.base import Character
+from src.models.equipment.armor import LIGHT_ARMOR
+from src.models.equipment.magic_items import WONDROUS_ITEMS
+from src.models.equipment.weapons import SIMPLE_MELEE_WEAPONS
+
+@pytest.fixture
+def journal(tmp_path):
+    journal = EventJournal(tmp_path / "campaign", fsync_batch=4, compact_threshold=10)
+    yield journal
+    journal.close()
+
+@pytest.fixture
+def hero():
+    character = Character(name="Hero", spell_slots={1: 2})
+    character.vitals.hit_points = character.vitals.max_hit_points = 20
+    return character
+
+def play_session(character):
+    inventory = character.inventory
+    daggers = inventory.add_item(SIMPLE_MELEE_WEAPONS["Dagger"], 3)
+    inventory.set_quantity(daggers, 5)
+    armor = inventory.add_item(LIGHT_ARMOR["Leather"])
+    inventory.equip_item(armor)
+    cloak = inventory.add_item(WONDROUS_ITEMS["Cloak of Elvenkind"])
+    inventory.attune_item(cloak)
+    inventory.remove_item(daggers, 1)
+    bag = inventory.add_item(WONDROUS_ITEMS["Bag of Holding"])
+    inventory.add_item(LIGHT_ARMOR["Padded"], container=bag)
+    inventory.move_item(daggers, bag, 2)
+    character.vitals.take_damage(7)
+    character.vitals.heal(2)
+    character.spend_spell_slot(1)
+
+def summary(character):
+    return (
+        [(item.item_id, item.display_name, item.quantity, item.equipped_slot, item.attuned, item.container_id)
+         for item in character.inventory.items],
+        character.vitals.hit_points,
+        character.spell_slots,
+    )
+
+def test_replay_matches_live_character(journal, hero):
+    journal.attach(hero)
+    play_session(hero)
+
+    loaded = journal.load(hero.id)
+    assert summary(loaded) == summary(hero)
+    assert summary(loaded)[1:] == (15, {1: 1})
+
+def test_journal_survives_reopen(tmp_path, hero):
+    journal = EventJournal(tmp_path / "campaign")
+    journal.attach(hero)
+    play_session(hero)
+    journal.close()
+
+    reopened = EventJournal(tmp_path / "campaign")
+    assert summary(reopened.load(hero.id)) == summary(hero)
+    reopened.close()
+
+def test_torn_final_line_is_ignored(tmp_path, hero):
+    journal = EventJournal(tmp_path / "campaign")
+    journal.attach(hero)
+    hero.vitals.take_damage(5)
+    journal.close()
+    with open(tmp_path / "campaign" / "journal.jsonl", "a") as f:
+        f.write('[99, "partial')
+
+    reopened = EventJournal(tmp_path / "campaign")
+    assert reopened.load(hero.id).vitals.hit_points == 15
+    reopened.attach(hero)
+    hero.vitals.take_damage(1)
+    reopened.close()
+
+    again = EventJournal(tmp_path / "campaign")
+    assert again.load(hero.id).vitals.hit_points == 14
+    again.close()
+
+def test_compaction(journal, hero):
+    journal.attach(hero)
+    for _ in range(12):
+        hero.vitals.take_damage(1)
+    assert journal.needs_compaction()
+
+    assert journal.compact() == 1
+    assert journal.tail_length == 0
+    assert journal.journal_path.read_text() == ""
+
+    hero.vitals.heal(3)
+    loaded = journal.load(hero.id)
+    assert loaded.vitals.hit_points == 11
+    assert journal.tail_length == 1
+
+def test_detach_stops_recording(journal, hero):
+    journal.attach(hero)
+    journal.detach(hero)
+    hero.vitals.take_damage(3)
+    assert journal.tail_length == 0
+
+def test_transaction_replays_as_one_entry(journal, hero):
+    from src.models.equipment.inventory import EquipmentSlot
+    from src.models.equipment.transaction import InventoryTransaction
+
+    hero.inventory.currency.gold = 30
+    journal.attach(hero)
+    with InventoryTransaction(hero.inventory) as purchase:
+        purchase.spend(1000)
+        purchase.equip(purchase.add(LIGHT_ARMOR["Leather"]), EquipmentSlot.ARMOR)
+
+    loaded = journal.load(hero.id)
+    assert summary(loaded) == summary(hero)
+    assert loaded.inventory.currency.total_copper_value == 2000
+
+def test_charges_and_coins_are_recorded(journal, hero):
+    import random
+    from src.models.character.rest import RestScheduler
+    from src.models.equipment.ledger import PartyTreasury
+
+    def state(character):
+        inventory = character.inventory
+        return ([(item.item_id, item.charges) for item in inventory.items],
+                inventory.currency.total_copper_value, inventory.currency.gold)
+
+    journal.attach(hero)
+    boots = hero.inventory.add_item(WONDROUS_ITEMS["Boots of Speed"])
+    hero.inventory.add_value_in_copper(5000)
+    assert hero.inventory.use_charge(boots, 3)
+    assert hero.inventory.spend(100)
+
+    scheduler = RestScheduler(time=0.0, rng=random.Random(7))
+    scheduler.register_character(hero)
+    scheduler.advance(6)  # Dawn recharges the boots
+    treasury = PartyTreasury()
+    treasury.ledger.post(treasury.account, 250)
+    assert treasury.withdraw(250, purse=hero.inventory)
+    assert hero.inventory.use_charge(boots)
+
+    live = state(hero)
+    assert live[1] == 5150 and 0 <= boots.charges < 3
+    assert state(journal.load(hero.id)) == live
+    journal.compact()
+    assert state(journal.load(hero.id)) == live
@@ -0,0 +1,89 @@
+"""
+Tests for summary listing and lazy character hydration
+"""
+import pytest
+from src.data.database.character_db import CharacterDatabase
+from src.data.database.lazy import CharacterSummary
+from src.models.character.base import Character, AbilityScores, CharacterProgression
+from src.models.equipment.weapons import SIMPLE_MELEE_WEAPONS
+
+@pytest.fixture
+def test_db(tmp_path):
+    """Create temporary database for testing"""
+    db = CharacterDatabase(tmp_path / "test.db")
+    yield db
+    db.close()
+
+@pytest.fixture
+def saved_character(test_db):
+    """Save a wizard with items, spells and notes"""
+    character = Character(
+        name="Elara",
+        character_class="Wizard",
+        race="Elf",
+        progression=CharacterProgression(level=5),
+        ability_scores=AbilityScores(intelligence=17),
+    )
+    character.inventory.add_item(SIMPLE_MELEE_WEAPONS["Dagger"], 2)
+    character.spell_slots = {1: 4, 2: 3, 3: 2}
+    character.spells_known = ["Magic Missile", "Fireball"]
+    character.notes = "Studied at the tower of high sorcery"
+    test_db.save_character(character)
+    return character
+
+def test_summaries_sorted_by_name(test_db):
+    for name in ("Zed", "Anya", "Mira"):
+        test_db.save_character(Character(name=name, character_class="Rogue", race="Halfling",
+                                        progression=CharacterProgression(level=2)))
+
+    summaries = test_db.list_summaries()
+    assert [summary.name for summary in summaries] == ["Anya", "Mira", "Zed"]
+    assert isinstance(summaries[0], CharacterSummary)
+    assert summaries[0].character_class == "Rogue" and summaries[0].level == 2
+
+def test_summary_listing_uses_covering_index(test_db):
+    with test_db.reader() as conn:
+        plan = " ".join(row[3] for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id, name, character_class, race, level FROM characters ORDER BY name"
+        ))
+    assert "COVERING INDEX idx_characters_summary" in plan
+    assert "TEMP B-TREE" not in plan
+
+def test_nothing_loaded_until_accessed(test_db, saved_character):
+    lazy = test_db.open_lazy(saved_character.id)
+    assert lazy.name == "Elara" and lazy.level == 5
+    assert not any(lazy.is_loaded(section) for section in ("core", "inventory", "spells", "notes"))
+
+def test_sections_load_independently(test_db, saved_character):
+    lazy = test_db.open_lazy(saved_character.id)
+
+    assert lazy.spells_known == ["Magic Missile", "Fireball"]
+    assert lazy.spell_slots == {1: 4, 2: 3, 3: 2}
+    assert lazy.is_loaded("spells")
+    assert not lazy.is_loaded("core") and not lazy.is_loaded("inventory")
+
+    assert lazy.ability_scores.intelligence == 17
+    assert lazy.is_loaded("core") and not lazy.is_loaded("inventory")
+
+    assert [(item.display_name, item.quantity) for item in lazy.inventory.items] == [("Dagger", 2)]
+    assert not lazy.is_loaded("notes")
+
+def test_hydrate_matches_full_load(test_db, saved_character):
+    lazy = test_db.lazy_characters()[0]
+    assert lazy.hydrate() == test_db.load_character(saved_character.id)
+
+def test_hydrate_keeps_hand_entered_maximums(test_db):
+    fighter = Character(name="Brom", character_class="Fighter", spell_slots={1: 3})
+    fighter.spend_spell_slot(1)
+    test_db.save_character(fighter)
+
+    lazy = test_db.open_lazy(fighter.id)
+    assert lazy.spell_slot_maximums == {1: 3}
+    hydrated = lazy.hydrate()
+    assert hydrated.spell_slots == {1: 2} and hydrated.slot_tracker.total(1) == 3
+    assert hydrated == test_db.load_character(fighter.id)
+
+def test_missing_character(test_db):
+    assert test_db.open_lazy("missing") is None
+    with pytest.raises(KeyError):
+        test_db.load_section("missing", "core")
@@ -0,0 +1,67 @@
+"""
+Tests for streaming roster import and export
+"""
+import io
+import pytest
+from src.data.roster_io import export_roster, import_roster, iter_export, iter_import
+from src.models.character.base import Character
+from src.models.equipment.weapons import SIMPLE_MELEE_WEAPONS
+
+def make_roster(size):
+    for i in range(size):
+        character = Character(name=f"Hero {i}", character_class="Fighter")
+        character.inventory.add_item(SIMPLE_MELEE_WEAPONS["Spear"], i % 4 + 1)
+        yield character
+
+def test_round_trip_in_memory():
+    buffer = io.StringIO()
+    counts = list(iter_export(make_roster(5), buffer))
+    assert counts == [1, 2, 3, 4, 5]
+    assert buffer.getvalue().count("\n") == 5
+
+    buffer.seek(0)
+    characters = list(iter_import(buffer))
+    assert [c.name for c in characters] == [f"Hero {i}" for i in range(5)]
+    assert characters[3].inventory.items[0].quantity == 4
+
+def test_export_is_lazy():
+    buffer = io.StringIO()
+    writer = iter_export(make_roster(3), buffer)
+    assert buffer.getvalue() == ""
+    next(writer)
+    assert buffer.getvalue().count("\n") == 1
+
+def test_gzip_file_with_progress(tmp_path):
+    path = tmp_path / "roster.jsonl.gz"
+    exported = []
+    assert export_roster(make_roster(10), path, progress=exported.append) == 10
+    assert exported[-1] == 10
+    assert path.read_bytes()[:2] == b"\x1f\x8b"  # gzip magic
+
+    imported = []
+    names = [c.name for c in import_roster(path, progress=imported.append)]
+    assert names == [f"Hero {i}" for i in range(10)]
+    assert imported == list(range(1, 11))
+
+def test_parallel_import_keeps_order(tmp_path):
+    path = tmp_path / "roster.jsonl"
+    export_roster(make_roster(40), path)
+
+    with open(path) as fp:
+        characters = list(iter_import(fp, workers=2, chunk_size=3))
+    assert [c.name for c in characters] == [f"Hero {i}" for i in range(40)]
+
+def test_invalid_line_reports_line_number():
+    buffer = io.StringIO()
+    list(iter_export(make_roster(2), buffer))
+    buffer.write("{not json\n")
+    buffer.seek(0)
+
+    with pytest.raises(ValueError, match="line 3"):
+        list(iter_import(buffer))
+
+@pytest.mark.parametrize("line", ["[]", "[1, 2]", '"x"'])
+def test_non_object_line_is_rejected(line):
+    buffer = io.StringIO('{"name": "Hero"}\n' + line + "\n")
+    with pytest.raises(ValueError, match="line 2: expected an object"):
+        list(iter_import(buffer))
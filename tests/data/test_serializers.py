@@ -0,0 +1,70 @@
+"""
+Tests for model serialization
+"""
+import json
+import pytest
+from src.data.serializers import (
+    CharacterSerializer, equipment_from_dict, equipment_to_dict, inventory_from_dict, inventory_item_from_dict,
+    inventory_item_to_dict, inventory_to_dict,
+)
+from src.models.character.base import Character, AbilityScores
+from src.models.equipment.armor import LIGHT_ARMOR, SHIELDS
+from src.models.equipment.inventory import EquipmentSlot, Inventory, InventoryItem
+from src.models.equipment.magic_items import MAGIC_WEAPONS, WONDROUS_ITEMS
+from src.models.equipment.weapons import SIMPLE_MELEE_WEAPONS
+
+@pytest.mark.parametrize("equipment", [
+    SIMPLE_MELEE_WEAPONS["Dagger"],
+    LIGHT_ARMOR["Leather"],
+    SHIELDS["Shield"],
+    MAGIC_WEAPONS["Flame Tongue"],
+    WONDROUS_ITEMS["Boots of Speed"],
+])
+def test_equipment_round_trip(equipment):
+    data = json.loads(json.dumps(equipment_to_dict(equipment)))
+    restored = equipment_from_dict(data)
+
+    assert type(restored) is type(equipment)
+    assert restored == equipment
+
+def test_unknown_equipment_kind():
+    with pytest.raises(ValueError):
+        equipment_from_dict({"kind": "Spaceship", "name": "Nope"})
+
+def test_character_round_trip():
+    character = Character(
+        name="N.O.V.A.",
+        character_class="Artificer",
+        race="Warforged",
+        ability_scores=AbilityScores(strength=15, dexterity=14),
+        spell_slots={1: 2},
+        notes="Owes a favor to the Guild",
+    )
+    character.progression.level = 3
+    armor = character.inventory.add_item(LIGHT_ARMOR["Leather"])
+    character.inventory.equip_item(armor)
+    character.inventory.add_item(SIMPLE_MELEE_WEAPONS["Dagger"], 2)
+    character.inventory.currency.gold = 12
+
+    data = json.loads(json.dumps(CharacterSerializer.to_dict(character)))
+    restored = CharacterSerializer.from_dict(data)
+
+    assert restored == character
+    assert restored.spell_slots == {1: 2}
+    assert [item.display_name for item in restored.inventory.items] == ["Leather", "Dagger"]
+    assert restored.inventory.equipped_items[EquipmentSlot.ARMOR] is restored.inventory.items[0]
+    assert restored.inventory.currency.gold == 12
+
+def test_item_charges_round_trip():
+    boots = inventory_item_from_dict(inventory_item_to_dict(InventoryItem(WONDROUS_ITEMS["Boots of Speed"], charges=1)))
+    assert boots.charges == 1
+    assert boots.equipment == WONDROUS_ITEMS["Boots of Speed"]
+
+def test_container_round_trip():
+    inventory = Inventory()
+    bag = inventory.add_item(WONDROUS_ITEMS["Bag of Holding"])
+    inventory.add_item(WONDROUS_ITEMS["Boots of Speed"], container=bag)
+
+    restored = inventory_from_dict(inventory_to_dict(inventory))
+    assert restored.get_contents(restored.get_item(bag.item_id))[0].equipment.name == "Boots of Speed"
+    assert restored.calculate_total_weight() == 15.0
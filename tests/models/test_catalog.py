@@ -0,0 +1,68 @@
+"""
+Tests for the indexed equipment catalog
+"""
+import pytest
+from src.models.equipment.armor import ALL_ARMOR, Armor, ArmorCategory
+from src.models.equipment.base import Equipment, EquipmentType, Rarity
+from src.models.equipment.catalog import EquipmentCatalog, EquipmentQuery, get_default_catalog
+from src.models.equipment.magic_items import ALL_MAGIC_ITEMS
+from src.models.equipment.weapons import ALL_WEAPONS, DamageType, Weapon, WeaponProperty
+
+ALL_ITEMS = {**ALL_WEAPONS, **ALL_ARMOR, **ALL_MAGIC_ITEMS}
+
+def scan(predicate):
+    """Reference answer computed by scanning every item"""
+    return sorted(name for name, item in ALL_ITEMS.items() if predicate(item))
+
+@pytest.fixture
+def catalog():
+    return get_default_catalog()
+
+def test_contains_all_predefined_items(catalog):
+    assert len(catalog) == len(ALL_ITEMS)
+    assert catalog["Longsword"] is ALL_WEAPONS["Longsword"]
+
+def test_light_finesse_weapons(catalog):
+    query = EquipmentQuery(properties=[WeaponProperty.FINESSE], max_weight=2.9)
+    assert [item.name for item in catalog.find(query)] == scan(
+        lambda item: isinstance(item, Weapon) and WeaponProperty.FINESSE in item.properties and item.weight < 3
+    )
+
+def test_rare_attunement_items(catalog):
+    query = EquipmentQuery(rarity=Rarity.RARE, requires_attunement=True)
+    assert [item.name for item in catalog.find(query)] == scan(
+        lambda item: item.rarity == Rarity.RARE and item.requires_attunement
+    )
+
+def test_armor_class_without_stealth_disadvantage(catalog):
+    query = EquipmentQuery(min_ac=14, stealth_disadvantage=False)
+    expected = scan(
+        lambda item: isinstance(item, Armor) and item.base_ac >= 14 and not item.stealth_disadvantage
+    )
+    assert expected
+    assert [item.name for item in catalog.find(query)] == expected
+
+def test_combined_type_damage_and_value(catalog):
+    query = EquipmentQuery(type=EquipmentType.WEAPON, damage_type=DamageType.PIERCING, max_value=500)
+    assert [item.name for item in catalog.find(query)] == scan(
+        lambda item: isinstance(item, Weapon) and item.damage_type == DamageType.PIERCING and item.value <= 500
+    )
+
+def test_category_and_empty_query(catalog):
+    heavy = catalog.find(EquipmentQuery(category=ArmorCategory.HEAVY))
+    assert heavy and all(item.category == ArmorCategory.HEAVY for item in heavy)
+    assert len(catalog.find(EquipmentQuery())) == len(catalog)
+
+def test_add_replace_and_remove():
+    catalog = EquipmentCatalog()
+    catalog.add(Equipment(name="Rope", weight=10.0, value=100))
+    catalog.add(Equipment(name="Torch", weight=1.0, value=1))
+    assert [item.name for item in catalog.find(EquipmentQuery(max_weight=5))] == ["Torch"]
+
+    catalog.add(Equipment(name="Rope", weight=2.0, value=100))
+    assert [item.name for item in catalog.find(EquipmentQuery(max_weight=5))] == ["Rope", "Torch"]
+
+    catalog.remove("Torch")
+    assert "Torch" not in catalog
+    assert catalog.find(EquipmentQuery(max_value=50)) == []
+    assert catalog.find(EquipmentQuery(type=EquipmentType.ADVENTURING_GEAR)) == [catalog["Rope"]]
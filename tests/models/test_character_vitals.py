@@ -30,3 +30,23 @@ def test_conditions(vitals):
 
     vitals.conditions.append("Prone")
     assert "Prone" in vitals.conditions
+
+def test_damage_spends_temporary_hit_points_first(vitals):
+    vitals.add_temporary_hit_points(5)
+    vitals.take_damage(7)
+    assert vitals.temporary_hit_points == 0
+    assert vitals.hit_points == 6
+
+    vitals.take_damage(20)
+    assert vitals.hit_points == 0
+
+def test_healing_is_capped(vitals):
+    vitals.hit_points = 3
+    vitals.heal(10)
+    assert vitals.hit_points == vitals.max_hit_points
+
+def test_hit_point_changes_notify(vitals):
+    events = []
+    vitals.add_listener(lambda event, payload: events.append((event, payload)))
+    vitals.take_damage(2)
+    assert events == [("hit_points_changed", {"hit_points": 6, "temporary_hit_points": 0})]
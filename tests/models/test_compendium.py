@@ -0,0 +1,74 @@
+"""
+Tests for the indexed spell compendium
+"""
+import pytest
+from src.models.spells.base import Spell, SpellComponent, SpellSchool
+from src.models.spells.compendium import SpellCompendium, SpellQuery, get_default_compendium, iter_bits
+from src.models.spells.srd import SRD_SPELLS
+
+V, S, M = SpellComponent.VERBAL, SpellComponent.SOMATIC, SpellComponent.MATERIAL
+
+def make_spell(name, level=1, school=SpellSchool.EVOCATION, components=(V, S), **kwargs):
+    defaults = dict(casting_time="1 action", range="60 feet", duration="Instantaneous",
+                    description=f"{name} does something.")
+    defaults.update(kwargs)
+    return Spell(name=name, level=level, school=school, components=list(components), **defaults)
+
+@pytest.fixture
+def compendium():
+    return get_default_compendium()
+
+def names(spells):
+    return [spell.name for spell in spells]
+
+def test_seeded_with_srd(compendium):
+    assert len(compendium) == len(SRD_SPELLS)
+    assert compendium["Fireball"].classes == ["Sorcerer", "Wizard"]
+
+def test_combined_filters(compendium):
+    query = SpellQuery(min_level=1, max_level=3, spell_class="wizard", concentration=True)
+    assert names(compendium.find(query)) == ["Detect Magic", "Hold Person", "Invisibility", "Fly"]
+
+    rituals = compendium.find(SpellQuery(ritual=True))
+    assert names(rituals) == ["Detect Magic", "Find Familiar"]
+
+    verbal_only = compendium.find(SpellQuery(max_level=0, without_components=[S, M]))
+    assert names(verbal_only) == ["Vicious Mockery"]
+    assert compendium.count(SpellQuery(school=SpellSchool.ABJURATION, components=[M])) == 1
+
+def test_full_text_search(compendium):
+    assert names(compendium.search("fire damage")) == ["Fire Bolt", "Fireball"]
+    assert names(compendium.search("damage", spell_class="Cleric", max_level=0)) == ["Sacred Flame"]
+    # Words in the higher-level text are searchable too
+    assert "Magic Missile" in names(compendium.search("more dart"))
+    assert compendium.search("xyzzy") == []
+
+def test_name_matches_rank_first():
+    compendium = SpellCompendium([
+        make_spell("Frost Ray", description="A ray of cold strikes. The frost lingers."),
+        make_spell("Ice Storm", description="Hail and frost pound the ground."),
+    ])
+    assert names(compendium.search("frost")) == ["Frost Ray", "Ice Storm"]
+
+def test_add_replace_and_remove():
+    compendium = SpellCompendium([make_spell("Spark"), make_spell("Glow", level=0)])
+    compendium.add(make_spell("Spark", level=2, description="Crackling lightning."))
+
+    assert compendium.count(SpellQuery(min_level=2)) == 1
+    assert compendium.search("something") == [compendium["Glow"]]
+
+    compendium.remove("Spark")
+    assert "Spark" not in compendium
+    assert compendium.search("lightning") == []
+    compendium.add(make_spell("Zap", level=3))
+    assert names(compendium.find(SpellQuery())) == ["Glow", "Zap"]
+
+def test_large_compendium_bitsets():
+    compendium = SpellCompendium(
+        make_spell(f"Spell {n}", level=n % 10, ritual=n % 7 == 0,
+                   classes=["Wizard"] if n % 2 else ["Cleric"])
+        for n in range(3000))
+    query = SpellQuery(min_level=3, max_level=3, ritual=True, spell_class="Wizard")
+    bits = compendium.match(query)
+    expected = {n for n in range(3000) if n % 10 == 3 and n % 7 == 0 and n % 2}
+    assert {int(compendium._by_id[i].name.split()[1]) for i in iter_bits(bits)} == expected
@@ -5,7 +5,8 @@ import pytest
 from src.models.equipment.weapons import Weapon, WeaponCategory, DamageType, WeaponProperty, SIMPLE_MELEE_WEAPONS
 from src.models.equipment.armor import Armor, ArmorCategory, LIGHT_ARMOR, HEAVY_ARMOR
 from src.models.equipment.inventory import Inventory, InventoryItem, EquipmentSlot, Currency
-from src.models.equipment.magic_items import MagicWeapon, MagicArmor, MAGIC_WEAPONS
+from src.models.equipment.magic_items import MagicWeapon, MagicArmor, WondrousItem, MAGIC_WEAPONS
+
 
 class TestWeapon:
     """Test weapon functionality"""
@@ -62,6 +63,7 @@ class TestWeapon:
         assert dagger.is_heavy_weapon() == False
         assert dagger.is_ranged_weapon() == False
 
+
 class TestArmor:
     """Test armor functionality"""
     
@@ -109,6 +111,7 @@ class TestArmor:
         assert chain_mail.meets_strength_requirement(12) == False
         assert chain_mail.meets_strength_requirement(15) == True
 
+
 class TestInventory:
     """Test inventory management"""
     
@@ -201,6 +204,7 @@ class TestInventory:
         assert inventory.is_encumbered(15) == True
         assert inventory.get_encumbrance_level(15) == "Heavily Encumbered"
 
+
 class TestCurrency:
     """Test currency management"""
     
@@ -249,6 +253,7 @@ class TestCurrency:
         assert success == False
         assert currency.total_copper_value == 500  # Unchanged
 
+
 class TestMagicItems:
     """Test magic item functionality"""
     
@@ -280,11 +285,11 @@ class TestMagicItems:
         """Test magic item charges"""
         from src.models.equipment.magic_items import WondrousItem
         
-        boots = WondrousItem(
+        boots = InventoryItem(WondrousItem(
             name="Boots of Speed",
             charges=3,
             max_charges=3
-        )
+        ))
         
         # Use charges
         assert boots.use_charge(1) == True
@@ -299,4 +304,224 @@ class TestMagicItems:
         
         # Recharge
         boots.recharge(2)
-        assert boots.charges == 2
\ No newline at end of file
+        assert boots.charges == 2
+
+
+class TestSharedTemplates:
+    """Test immutable equipment templates and per-copy state"""
+    
+    def test_templates_are_immutable_and_hashable(self):
+        """Catalog entries cannot be modified and can be used as keys"""
+        from dataclasses import FrozenInstanceError
+        
+        dagger = SIMPLE_MELEE_WEAPONS["Dagger"]
+        with pytest.raises(FrozenInstanceError):
+            dagger.weight = 5.0
+        
+        assert len({dagger, SIMPLE_MELEE_WEAPONS["Dagger"], LIGHT_ARMOR["Leather"]}) == 2
+        assert hash(dagger) == hash(Weapon(**{f: getattr(dagger, f) for f in dagger.__dataclass_fields__}))
+    
+    def test_template_containers_are_read_only(self):
+        """Lists and dicts on shared templates cannot be changed in place"""
+        import pickle
+        from src.models.equipment.magic_items import WONDROUS_ITEMS
+        
+        ring = WONDROUS_ITEMS["Ring of Protection"]
+        with pytest.raises(TypeError):
+            ring.properties["modifiers"]["armor_class"] = 5
+        with pytest.raises(TypeError):
+            ring.properties.update(slot="amulet")
+        assert ring.properties == {"slot": "ring", "modifiers": {"armor_class": 1, "saving_throws": 1}}
+        assert isinstance(SIMPLE_MELEE_WEAPONS["Dagger"].properties, tuple)
+        assert pickle.loads(pickle.dumps(ring)) == ring
+        
+        effects = ["Fire"]
+        wand = WondrousItem(name="Wand", spell_effects=effects)
+        effects.append("Ice")
+        assert wand.spell_effects == ("Fire",)
+    
+    def test_charges_are_per_copy(self):
+        """Two owners of the same boots track charges separately"""
+        from src.models.equipment.magic_items import WONDROUS_ITEMS
+        
+        first, second = Inventory(), Inventory()
+        boots_a = first.add_item(WONDROUS_ITEMS["Boots of Speed"])
+        boots_b = second.add_item(WONDROUS_ITEMS["Boots of Speed"])
+        assert boots_a.equipment is boots_b.equipment
+        
+        assert boots_a.use_charge(2)
+        assert boots_a.charges == 1
+        assert boots_b.charges == 3
+        assert WONDROUS_ITEMS["Boots of Speed"].charges == 3
+        
+        boots_a.recharge()
+        assert boots_a.charges == 3
+    
+    def test_inventory_items_are_slotted(self):
+        """Owned items carry no per-instance dictionary"""
+        item = InventoryItem(SIMPLE_MELEE_WEAPONS["Club"])
+        assert not hasattr(item, "__dict__")
+        assert item.charges is None and item.use_charge()
+
+
+class TestInventoryIndexes:
+    """Test hashed stacking and item lookup"""
+    
+    def test_lookup_by_item_id(self):
+        """Items are found by id and removal keeps the order of the rest"""
+        inventory = Inventory()
+        items = [inventory.add_item(weapon) for weapon in SIMPLE_MELEE_WEAPONS.values()]
+        
+        assert inventory.get_item(items[3].item_id) is items[3]
+        assert inventory.remove_item(items[3])
+        assert inventory.get_item(items[3].item_id) is None
+        assert items[3] not in inventory.items
+        assert list(inventory.items) == items[:3] + items[4:]
+        assert inventory.items[3] is items[4]
+    
+    def test_equipped_items_do_not_stack(self):
+        """Adding a copy of an equipped item starts a new stack"""
+        inventory = Inventory()
+        dagger = SIMPLE_MELEE_WEAPONS["Dagger"]
+        wielded = inventory.add_item(dagger)
+        inventory.equip_item(wielded)
+        
+        spare = inventory.add_item(dagger, 2)
+        assert spare is not wielded
+        assert inventory.add_item(dagger) is spare and spare.quantity == 3
+        
+        inventory.remove_item(spare)
+        inventory.unequip_item(wielded)
+        assert inventory.add_item(dagger) is wielded
+    
+    def test_large_inventory_stacking(self):
+        """Stacking onto one of thousands of entries finds it directly"""
+        inventory = Inventory()
+        for number in range(5000):
+            inventory.add_item(Weapon(name=f"Heirloom Blade {number}"))
+        
+        item = inventory.add_item(Weapon(name="Heirloom Blade 4321"), 2)
+        assert item.quantity == 3
+        assert len(inventory.items) == 5000
+
+
+class TestInventoryAggregates:
+    """Test running weight, value, type and attunement totals"""
+    
+    def test_totals_follow_mutations(self):
+        """Totals match a full recount after adds, removals and quantity changes"""
+        inventory = Inventory()
+        dagger = inventory.add_item(SIMPLE_MELEE_WEAPONS["Dagger"], 3)
+        leather = inventory.add_item(LIGHT_ARMOR["Leather"])
+        inventory.add_item(SIMPLE_MELEE_WEAPONS["Dagger"])
+        inventory.remove_item(dagger, 2)
+        inventory.set_quantity(leather, 2)
+        
+        assert inventory.calculate_total_weight() == sum(item.total_weight for item in inventory.items)
+        assert inventory.calculate_total_value() == sum(item.total_value for item in inventory.items)
+        assert inventory.count_items_by_type(dagger.equipment.type) == 1
+        
+        assert inventory.set_quantity(leather, 0)
+        assert inventory.get_items_by_type(leather.equipment.type) == []
+        assert inventory.calculate_total_weight() == 2.0
+    
+    def test_weight_does_not_drift(self):
+        """Fractional weights added and removed many times return to zero"""
+        inventory = Inventory()
+        arrow = Weapon(name="Arrow", weight=0.05)
+        for _ in range(1000):
+            item = inventory.add_item(arrow, 3)
+        inventory.remove_item(item, 1000)
+        
+        assert inventory.calculate_total_weight() == 100.0
+        inventory.remove_item(item)
+        assert inventory.calculate_total_weight() == 0
+    
+    def test_encumbrance_boundary(self):
+        """Exactly five sixths of capacity is still unencumbered"""
+        inventory = Inventory(carrying_capacity_override=60)
+        inventory.add_item(Armor(name="Anvil", weight=50.0))
+        assert inventory.get_encumbrance_level(10) == "Unencumbered"
+        inventory.add_item(Armor(name="Feather", weight=0.01))
+        assert inventory.get_encumbrance_level(10) == "Encumbered"
+    
+    def test_attuned_count(self):
+        """Attuning, unattuning and unequipping update the count"""
+        from src.models.equipment.magic_items import WONDROUS_ITEMS
+        
+        inventory = Inventory()
+        boots = inventory.add_item(WONDROUS_ITEMS["Boots of Speed"])
+        assert inventory.attune_item(boots)
+        assert inventory.attuned_count == 1
+        assert inventory.get_attuned_items() == [boots]
+        
+        inventory.unattune_item(boots)
+        assert inventory.attuned_count == 0
+
+
+class TestContainers:
+    """Test nested containers and weight rollups"""
+    
+    def make_packed_inventory(self):
+        from src.models.equipment.magic_items import WONDROUS_ITEMS
+        
+        inventory = Inventory()
+        sack = inventory.add_item(WondrousItem(name="Sack", weight=0.5, properties={"container_capacity": 30}))
+        bag = inventory.add_item(WONDROUS_ITEMS["Bag of Holding"])
+        return inventory, sack, bag
+    
+    def test_weightless_contents(self):
+        """Items in a Bag of Holding add nothing beyond the bag's own weight"""
+        inventory, sack, bag = self.make_packed_inventory()
+        plate = inventory.add_item(HEAVY_ARMOR["Plate"], container=bag)
+        
+        assert inventory.calculate_total_weight() == 15.5
+        assert inventory.calculate_contents_weight(bag) == 65.0
+        assert inventory.calculate_contents_value(bag) == plate.total_value
+        assert inventory.calculate_total_value() == bag.total_value + sack.total_value + plate.total_value
+    
+    def test_nested_rollup_and_moves(self):
+        """Moving a stack updates every container on the old and new paths"""
+        inventory, sack, bag = self.make_packed_inventory()
+        daggers = inventory.add_item(SIMPLE_MELEE_WEAPONS["Dagger"], 4, container=sack)
+        assert inventory.calculate_total_weight() == 19.5
+        
+        moved = inventory.move_item(daggers, bag, 3)
+        assert moved is not daggers and moved.quantity == 3 and daggers.quantity == 1
+        assert inventory.calculate_total_weight() == 16.5
+        
+        assert inventory.move_item(sack, bag) is sack
+        assert inventory.get_container(daggers) is sack
+        assert inventory.calculate_total_weight() == 15.0
+        assert inventory.calculate_contents_weight(bag) == 4.5
+        
+        assert inventory.move_item(daggers, bag) is moved and moved.quantity == 4
+        assert daggers not in inventory.items
+        assert inventory.get_contents(bag) == [moved, sack]
+    
+    def test_rejected_moves(self):
+        """Containers cannot hold themselves or more than their capacity"""
+        inventory, sack, bag = self.make_packed_inventory()
+        inventory.move_item(sack, bag)
+        
+        assert inventory.move_item(bag, sack) is None
+        assert inventory.move_item(bag, bag) is None
+        plate = inventory.add_item(HEAVY_ARMOR["Plate"])
+        assert inventory.move_item(plate, sack) is None
+        with pytest.raises(ValueError):
+            inventory.add_item(HEAVY_ARMOR["Plate"], container=sack)
+    
+    def test_tree_queries_and_removal(self):
+        """Name lookup covers nested items and removing a container empties it"""
+        inventory, sack, bag = self.make_packed_inventory()
+        inventory.move_item(sack, bag)
+        rope = inventory.add_item(Weapon(name="Whip", weight=3.0), container=sack)
+        
+        assert inventory.find_items("whip") == [rope]
+        assert inventory.equip_item(rope)
+        assert inventory.get_container(rope) is None
+        
+        assert inventory.move_item(rope, sack) is rope and not rope.equipped
+        inventory.remove_item(bag)
+        assert len(inventory.items) == 0
+        assert inventory.calculate_total_weight() == 0
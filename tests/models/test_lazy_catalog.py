@@ -0,0 +1,75 @@
+"""
+Tests for lazily built equipment catalogs
+"""
+import subprocess
+import sys
+from pathlib import Path
+from src.models.equipment.base import Equipment
+from src.models.equipment.lazy_catalog import CombinedCatalog, LazyCatalog
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+# Milliseconds the equipment package's own modules may spend importing
+IMPORT_BUDGET_MS = 100
+
+def test_entries_built_once_on_first_access():
+    calls = []
+
+    def build(**kwargs):
+        calls.append(kwargs["name"])
+        return Equipment(**kwargs)
+
+    catalog = LazyCatalog(build, {"Rope": dict(name="Rope", weight=10.0), "Torch": dict(name="Torch")})
+    assert list(catalog) == ["Rope", "Torch"] and "Rope" in catalog and len(catalog) == 2
+    assert calls == []
+
+    rope = catalog["Rope"]
+    assert catalog["Rope"] is rope and rope.weight == 10.0
+    assert calls == ["Rope"]
+    assert catalog.is_built("Rope") and not catalog.is_built("Torch")
+
+def test_combined_catalog_shares_entries():
+    first = LazyCatalog(Equipment, {"Rope": dict(name="Rope"), "Torch": dict(name="Torch")})
+    second = LazyCatalog(Equipment, {"Torch": dict(name="Torch", weight=1.0)})
+    combined = CombinedCatalog(first, second)
+
+    assert list(combined) == ["Rope", "Torch"]
+    assert not combined.is_built("Rope")
+    assert combined["Rope"] is first["Rope"]
+    assert combined["Torch"] is second["Torch"]  # Later catalogs win, as with {**a, **b}
+    assert not first.is_built("Torch")
+
+def run_python(*args):
+    return subprocess.run(
+        [sys.executable, *args], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    )
+
+def test_import_builds_no_items():
+    code = (
+        "import src.models.equipment as equipment\n"
+        "catalogs = (equipment.ALL_WEAPONS, equipment.ALL_ARMOR, equipment.ALL_MAGIC_ITEMS)\n"
+        "print(sum(catalog.is_built(name) for catalog in catalogs for name in catalog))\n"
+    )
+    assert run_python("-c", code).stdout.strip() == "0"
+
+def test_optional_modules_load_on_first_access():
+    code = (
+        "import sys\n"
+        "import src.models.equipment as equipment\n"
+        "lazy = ('catalog', 'ledger', 'shared', 'transaction', 'modifiers')\n"
+        "print(sum(f'src.models.equipment.{name}' in sys.modules for name in lazy))\n"
+        "print(equipment.ModifierStack.__module__)\n"
+    )
+    assert run_python("-c", code).stdout.split() == ["0", "src.models.equipment.modifiers"]
+
+def test_import_time_budget():
+    stderr = run_python("-X", "importtime", "-c", "import src.models.equipment").stderr
+    own_time_us = 0
+    for line in stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_time, _, module = line[len("import time:"):].split("|")
+        if module.strip().startswith("src.models"):
+            own_time_us += int(self_time)
+    assert 0 < own_time_us / 1000 < IMPORT_BUDGET_MS
@@ -0,0 +1,100 @@
+"""
+Tests for the currency ledger and party treasury
+"""
+import threading
+import pytest
+from src.models.equipment.inventory import Currency, make_change
+from src.models.equipment.ledger import InsufficientFundsError, Ledger, PartyTreasury, split_evenly
+
+def test_make_change_skips_electrum():
+    assert make_change(2557) == {"platinum": 2, "gold": 5, "silver": 5, "copper": 7}
+
+def test_spend_keeps_large_coins():
+    purse = Currency(copper=5, silver=3, platinum=1)
+    assert purse.spend(42)
+    assert purse.total_copper_value == 993
+    assert purse.platinum == 0 and purse.copper == 3
+
+def test_batch_is_all_or_nothing():
+    ledger = Ledger()
+    ledger.post("treasury", 100)
+    with pytest.raises(InsufficientFundsError):
+        ledger.post_batch([("treasury", -60), ("Aria", 60), ("treasury", -60), ("Bram", 60)])
+    assert len(ledger) == 1
+    assert ledger.balances() == {"treasury": 100}
+
+def test_split_distributes_odd_pieces():
+    ledger = Ledger()
+    ledger.post("treasury", 1001)
+    shares = ledger.split("treasury", ["Aria", "Bram", "Cole"])
+
+    assert shares == {"Aria": 334, "Bram": 334, "Cole": 333}
+    assert split_evenly(10, 4) == [3, 3, 2, 2]
+    assert ledger.balance("treasury") == 0
+
+def test_balance_at_uses_checkpoints():
+    ledger = Ledger(checkpoint_interval=8)
+    for amount in range(1, 51):
+        ledger.post("Aria", amount)
+        ledger.post("Bram", 1)
+
+    assert ledger.balance_at("Aria", 0) == 0
+    assert ledger.balance_at("Aria", 21) == sum(range(1, 12))
+    assert ledger.balance_at("Bram", len(ledger)) == ledger.balance("Bram") == 50
+
+def test_treasury_with_purses():
+    treasury = PartyTreasury()
+    aria, bram = Currency(gold=10), Currency()
+
+    assert treasury.deposit(750, "Dragon hoard share", purse=aria)
+    assert not treasury.deposit(1000, purse=bram)
+    assert treasury.distribute({"Aria": aria, "Bram": bram}, 500) == {"Aria": 250, "Bram": 250}
+    assert bram.total_copper_value == 250 and bram.electrum == 0
+    assert treasury.coins().total_copper_value == 250
+    assert not treasury.withdraw(300)
+
+def test_amounts_must_be_positive():
+    treasury = PartyTreasury()
+    treasury.deposit(100)
+    purse = Currency(gold=1)
+    for call in (lambda: treasury.withdraw(-150, purse=purse), lambda: treasury.deposit(-50),
+                 lambda: treasury.deposit(0, purse=purse),
+                 lambda: treasury.ledger.transfer("treasury", "Aria", -10),
+                 lambda: treasury.ledger.split("treasury", ["Aria"], -10),
+                 lambda: purse.add_value_in_copper(-1000), lambda: purse.spend(-1)):
+        with pytest.raises(ValueError):
+            call()
+    assert treasury.balance == 100 and purse == Currency(gold=1)
+    assert len(treasury.ledger) == 1
+
+    assert Ledger().split("treasury", ["Aria", "Bram"]) == {"Aria": 0, "Bram": 0}
+
+def test_concurrent_deposits_and_withdrawals():
+    treasury = PartyTreasury()
+    treasury.deposit(1000)
+    failures = []
+
+    def member():
+        for _ in range(500):
+            treasury.deposit(3)
+            if not treasury.withdraw(2):
+                failures.append(1)
+
+    threads = [threading.Thread(target=member) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not failures
+    assert treasury.balance == 1000 + 8 * 500
+    assert len(treasury.ledger) == 1 + 8 * 500 * 2
+
+def test_split_needs_members():
+    treasury = PartyTreasury()
+    treasury.deposit(100)
+    for call in (lambda: split_evenly(100, 0), lambda: treasury.ledger.split("treasury", []),
+                 lambda: treasury.distribute({})):
+        with pytest.raises(ValueError):
+            call()
+    assert treasury.balance == 100 and len(treasury.ledger) == 1
@@ -0,0 +1,121 @@
+"""
+Tests for the magic item modifier stack
+"""
+import pytest
+from src.models.character.base import AbilityType, Character
+from src.models.equipment.armor import LIGHT_ARMOR
+from src.models.equipment.base import EquipmentType
+from src.models.equipment.inventory import EquipmentSlot, Inventory
+from src.models.equipment.magic_items import MAGIC_WEAPONS, WONDROUS_ITEMS, WondrousItem
+from src.models.equipment.modifiers import ModifierStack, ModifierType, compile_modifiers
+from src.models.equipment.transaction import InventoryTransaction
+
+CLOAK_OF_PROTECTION = WondrousItem(
+    name="Cloak of Protection", type=EquipmentType.WONDROUS_ITEM, requires_attunement=True,
+    properties={"slot": "cloak", "modifiers": {"armor_class": 1, "saving_throws": 1}})
+LONGSTRIDERS = WondrousItem(
+    name="Boots of Striding", type=EquipmentType.WONDROUS_ITEM,
+    properties={"slot": "boots", "modifiers": {"speed": 10}})
+
+@pytest.fixture
+def inventory():
+    inventory = Inventory()
+    inventory.equip_item(inventory.add_item(LIGHT_ARMOR["Leather"]))
+    return inventory
+
+def test_compiled_once_per_template():
+    ring = WONDROUS_ITEMS["Ring of Protection"]
+    modifiers = compile_modifiers(ring)
+    assert {(m.type, m.value) for m in modifiers} == {(ModifierType.ARMOR_CLASS, 1),
+                                                      (ModifierType.SAVING_THROWS, 1)}
+    assert compile_modifiers(ring) is modifiers
+
+def test_attuned_ring_of_protection(inventory):
+    stack = ModifierStack(inventory)
+    ring = inventory.add_item(WONDROUS_ITEMS["Ring of Protection"])
+    assert inventory.equip_item(ring)
+    assert ring.equipped_slot == EquipmentSlot.RING_1
+    assert stack.armor_class(dex_modifier=2) == 13  # Not attuned yet
+
+    inventory.attune_item(ring)
+    assert stack.armor_class(dex_modifier=2) == 14
+    assert stack.saving_throw_bonus(ability_modifier=1) == 2
+
+    inventory.unequip_item(ring)  # Attunement ends as well
+    assert stack.totals() == dict.fromkeys(ModifierType, 0)
+
+def test_same_item_does_not_stack(inventory):
+    stack = ModifierStack(inventory)
+    rings = []
+    for _ in range(2):
+        ring = inventory.add_item(WONDROUS_ITEMS["Ring of Protection"])
+        inventory.equip_item(ring)
+        inventory.attune_item(ring)
+        rings.append(ring)
+    first, second = rings
+    assert second.equipped_slot == EquipmentSlot.RING_2
+    assert stack.total(ModifierType.ARMOR_CLASS) == 1
+
+    cloak = inventory.add_item(CLOAK_OF_PROTECTION)
+    inventory.equip_item(cloak)
+    inventory.attune_item(cloak)
+    assert stack.total(ModifierType.ARMOR_CLASS) == 2
+
+    inventory.remove_item(first)
+    assert stack.total(ModifierType.ARMOR_CLASS) == 2
+    inventory.remove_item(second)
+    assert stack.total(ModifierType.ARMOR_CLASS) == 1
+
+def test_items_without_attunement_and_change_events(inventory):
+    stack = ModifierStack(inventory)
+    changes = []
+    stack.add_listener(lambda event, payload: changes.append(payload["totals"][ModifierType.SPEED]))
+    boots = inventory.add_item(LONGSTRIDERS)
+
+    inventory.equip_item(boots)
+    assert stack.speed(30) == 40
+    inventory.unequip_item(boots)
+    assert changes == [10, 0]
+
+def test_weapon_magic_bonus_is_counted_once(inventory):
+    stack = ModifierStack(inventory)
+    sword = MAGIC_WEAPONS["Longsword +1"]
+    assert stack.attack_bonus(sword, 3, 2) == 6
+    assert stack.damage_bonus(sword, 3) == 4
+
+def test_follows_transactions_and_rebuild(inventory):
+    stack = ModifierStack(inventory)
+    with InventoryTransaction(inventory) as trade:
+        ring = trade.add(WONDROUS_ITEMS["Ring of Protection"])
+        trade.equip(ring)
+        trade.attune(ring)
+    assert stack.total(ModifierType.SAVING_THROWS) == 1
+
+    # Flags set directly bypass events; rebuild catches up
+    ring.item.attuned = False
+    stack.rebuild()
+    assert stack.total(ModifierType.SAVING_THROWS) == 0
+    assert ModifierStack(inventory).totals() == stack.totals()
+
+def test_character_sheet_includes_item_modifiers():
+    hero = Character(name="Hero", saving_throw_proficiencies=["wisdom"])
+    hero.ability_scores.wisdom = 14
+    hero.vitals.armor_class = 15
+    ring = hero.inventory.add_item(WONDROUS_ITEMS["Ring of Protection"])
+    hero.inventory.equip_item(ring)
+    hero.inventory.attune_item(ring)
+    assert hero.get_armor_class() == 16
+    assert hero.get_saving_throw_modifier(AbilityType.WISDOM) == 5
+    assert hero.get_saving_throw_modifier(AbilityType.STRENGTH) == 1
+
+    # A loaded sheet replaces the inventory; the stack follows it
+    hero.inventory = Inventory()
+    assert hero.get_armor_class() == 15
+    hero.inventory.equip_item(hero.inventory.add_item(LONGSTRIDERS))
+    assert hero.get_speed() == 40
+
+def test_unknown_slot_cannot_be_equipped(inventory):
+    trinket = WondrousItem(name="Odd Trinket", type=EquipmentType.WONDROUS_ITEM, properties={"slot": "tail"})
+    item = inventory.add_item(trinket)
+    assert not inventory.equip_item(item)
+    assert not item.equipped
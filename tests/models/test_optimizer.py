@@ -0,0 +1,133 @@
+"""
+Tests for the loadout optimizer
+"""
+import itertools
+import random
+import pytest
+from src.models.character.base import AbilityScores, Character
+from src.models.equipment.armor import ALL_ARMOR, Armor, ArmorCategory, Shield
+from src.models.equipment.inventory import Currency
+from src.models.equipment.optimizer import LoadoutOptimizer, average_roll, expected_damage
+from src.models.equipment.weapons import ALL_WEAPONS, Weapon, WeaponCategory, WeaponProperty
+
+SCORES = AbilityScores(strength=16, dexterity=14)
+
+def brute_force(items, max_weight, budget, ac_weight, dpr_weight):
+    """Best objective value by trying every legal combination"""
+    optimizer = LoadoutOptimizer(items, SCORES)
+    armors = [None] + optimizer.armors
+    shields = [None] + optimizer.shields
+    weapons = optimizer.weapons
+    hands = [(shield, None, None, False) for shield in shields]
+    for weapon in weapons:
+        if not weapon.is_two_handed_weapon():
+            hands.extend((shield, weapon, None, False) for shield in shields)
+        if weapon.is_two_handed_weapon() or WeaponProperty.VERSATILE in weapon.properties:
+            hands.append((None, weapon, None, True))
+    light = [weapon for weapon in weapons if weapon.is_light_weapon()]
+    hands.extend((None, main, off, False) for main, off in itertools.product(light, light))
+
+    best = None
+    for armor, (shield, main, off, two_handed) in itertools.product(armors, hands):
+        parts = [item for item in (armor, shield, main, off) if item]
+        weight = sum(item.weight for item in parts)
+        cost = sum(item.value for item in parts)
+        if weight > max_weight or not budget.can_afford(cost):
+            continue
+        armor_class = armor.calculate_ac(2) if armor else 12
+        if shield:
+            armor_class += shield.calculate_ac_bonus()
+        damage = 0.0
+        if main:
+            damage += optimizer._damage(main, two_handed=two_handed)
+        if off:
+            damage += optimizer._damage(off, off_hand=True)
+        value = ac_weight * armor_class + dpr_weight * damage
+        best = value if best is None else max(best, value)
+    return best
+
+def test_average_roll():
+    assert average_roll("1d8") == 4.5
+    assert average_roll("2d6+1") == 8.0
+    with pytest.raises(ValueError):
+        average_roll("lots")
+
+def test_expected_damage_against_target():
+    longsword = ALL_WEAPONS["Longsword"]
+    # +3 Str, +2 proficiency vs AC 15: hit on 10+ (55%), 5% crit adds dice again
+    assert expected_damage(longsword, 3, 2, 15) == pytest.approx(0.55 * 7.5 + 0.05 * 4.5)
+    assert expected_damage(longsword, 3, 2, 15, two_handed=True) > expected_damage(longsword, 3, 2, 15)
+
+def test_best_armor_class_on_a_budget():
+    optimizer = LoadoutOptimizer(list(ALL_ARMOR.values()), SCORES)
+    loadout = optimizer.optimize(max_weight=60, budget=Currency(gold=500), dpr_weight=0)
+    assert loadout.armor.name == "Breastplate" and loadout.shield is not None
+    assert loadout.armor_class == 18
+    assert loadout.cost <= 50000 and loadout.weight <= 60
+
+    rich = optimizer.optimize(max_weight=100, budget=Currency(platinum=200), dpr_weight=0)
+    assert rich.armor.name == "Plate" and rich.armor_class == 20
+
+def test_strength_requirement_excludes_heavy_armor():
+    weak = AbilityScores(strength=10, dexterity=14)
+    optimizer = LoadoutOptimizer(list(ALL_ARMOR.values()), weak)
+    loadout = optimizer.optimize(max_weight=100, budget=Currency(platinum=200), dpr_weight=0)
+    assert loadout.armor.min_strength is None
+
+def test_nothing_affordable():
+    optimizer = LoadoutOptimizer([*ALL_ARMOR.values(), *ALL_WEAPONS.values()], SCORES)
+    loadout = optimizer.optimize(max_weight=0, budget=Currency())
+    assert loadout.items == [] and loadout.armor_class == 12
+
+@pytest.mark.parametrize("max_weight,gold,ac_weight,dpr_weight", [
+    (60, 500, 1.0, 1.0), (30, 50, 1.0, 1.0), (80, 2000, 0.0, 1.0), (15, 20, 1.0, 3.0), (100, 5000, 2.0, 0.5),
+])
+def test_matches_brute_force(max_weight, gold, ac_weight, dpr_weight):
+    rng = random.Random(max_weight)
+    items = [*ALL_ARMOR.values(), *ALL_WEAPONS.values()]
+    for index in range(30):
+        items.append(Weapon(
+            name=f"Weapon {index}", category=rng.choice(list(WeaponCategory)),
+            damage_dice=f"1d{rng.choice([4, 6, 8, 10, 12])}",
+            properties=rng.sample([WeaponProperty.LIGHT, WeaponProperty.FINESSE,
+                                   WeaponProperty.TWO_HANDED, WeaponProperty.VERSATILE], rng.randint(0, 2)),
+            versatile_damage="1d10", weight=rng.uniform(1, 15), value=rng.randint(100, 30000),
+            magic_bonus=rng.choice([0, 0, 1]),
+        ))
+        items.append(Armor(
+            name=f"Armor {index}", category=rng.choice([ArmorCategory.LIGHT, ArmorCategory.MEDIUM]),
+            base_ac=rng.randint(11, 16), max_dex_bonus=rng.choice([None, 2]),
+            weight=rng.uniform(5, 50), value=rng.randint(500, 150000),
+        ))
+    items.append(Shield(name="Heavy Shield", weight=12.0, value=3000, magic_bonus=1))
+
+    budget = Currency(gold=gold)
+    loadout = LoadoutOptimizer(items, SCORES).optimize(max_weight, budget, ac_weight, dpr_weight)
+    value = ac_weight * loadout.armor_class + dpr_weight * loadout.damage_per_round
+    assert value == pytest.approx(brute_force(items, max_weight, budget, ac_weight, dpr_weight))
+    assert loadout.weight <= max_weight and budget.can_afford(loadout.cost)
+
+def test_optimize_for_character():
+    character = Character(ability_scores=AbilityScores(strength=8, dexterity=16))
+    character.inventory.currency.gold = 100
+    character.inventory.carrying_capacity_override = 20
+    character.inventory.add_item(ALL_WEAPONS["Dagger"], 5)  # 5 lb carried, 15 lb spare
+
+    optimizer = LoadoutOptimizer.for_character(character, [*ALL_ARMOR.values(), *ALL_WEAPONS.values()])
+    loadout = optimizer.optimize_for(character)
+    assert loadout.weight <= 15 and loadout.cost <= 10000
+    assert loadout.armor.category == ArmorCategory.LIGHT and loadout.armor_class == 14
+
+def test_bag_of_holding_contents_do_not_count():
+    from src.models.equipment.magic_items import WONDROUS_ITEMS
+
+    character = Character(ability_scores=AbilityScores(strength=8, dexterity=16))
+    character.inventory.currency.gold = 100
+    character.inventory.carrying_capacity_override = 35
+    bag = character.inventory.add_item(WONDROUS_ITEMS["Bag of Holding"])  # 15 lb, 20 lb spare
+    character.inventory.add_item(ALL_ARMOR["Plate"], container=bag)
+    character.inventory.equip_item(character.inventory.add_item(ALL_WEAPONS["Greatsword"]))
+
+    optimizer = LoadoutOptimizer.for_character(character, [*ALL_ARMOR.values(), *ALL_WEAPONS.values()])
+    expected = optimizer.optimize(20, character.inventory.currency)
+    assert optimizer.optimize_for(character) == expected
@@ -0,0 +1,124 @@
+"""
+Tests for rest and recharge scheduling
+"""
+import random
+import pytest
+from src.models.character.base import AbilityScores, Character, CharacterProgression, CharacterVitals
+from src.models.character.rest import RestScheduler, RestTrigger
+from src.models.dice import average_roll, parse_dice, roll_batch
+from src.models.equipment.base import EquipmentType
+from src.models.equipment.magic_items import WONDROUS_ITEMS, WondrousItem
+from src.models.equipment.weapons import SIMPLE_MELEE_WEAPONS
+
+PEARL = WondrousItem(name="Pearl of Respite", type=EquipmentType.WONDROUS_ITEM,
+                     max_charges=2, properties={"recharge": "short rest"})
+
+def make_character(name="Hero", level=4):
+    character = Character(name=name, ability_scores=AbilityScores(constitution=14),
+                          vitals=CharacterVitals(hit_points=10, max_hit_points=30),
+                          progression=CharacterProgression(level=level, hit_die=10),
+                          spell_slots={1: 4, 2: 2})
+    return character
+
+@pytest.fixture
+def scheduler():
+    return RestScheduler(time=0.0, rng=random.Random(7))
+
+def test_parse_and_roll_dice():
+    assert parse_dice("2d6+1") == (2, 6, 1)
+    assert average_roll("1d4") == 2.5
+    totals = roll_batch(["1d4", "2d6+1", "1d4"], random.Random(1))
+    assert 1 <= totals[0] <= 4 and 3 <= totals[1] <= 13 and 1 <= totals[2] <= 4
+    with pytest.raises(ValueError):
+        roll_batch(["lots"])
+
+def test_dawn_recharges_registered_items(scheduler):
+    character = make_character()
+    boots = character.inventory.add_item(WONDROUS_ITEMS["Boots of Speed"])
+    character.inventory.add_item(SIMPLE_MELEE_WEAPONS["Dagger"])
+    scheduler.register_character(character)
+    boots.use_charge(3)
+
+    assert scheduler.advance(5).charges == []  # Still before dawn
+    report = scheduler.advance(1)
+    assert [item for item, _ in report.charges] == [boots]
+    assert 1 <= boots.charges <= 3
+
+def test_missed_dawns_each_recharge(scheduler):
+    character = make_character()
+    boots = character.inventory.add_item(WONDROUS_ITEMS["Boots of Speed"])
+    scheduler.register_character(character)
+    boots.use_charge(3)
+
+    report = scheduler.advance(3 * 24)  # Three dawns pass
+    assert report.charges == [(boots, boots.charges)]
+    assert boots.charges == 3  # At least one charge per dawn
+    assert scheduler.advance(5).charges == []  # Next dawn is at hour 78
+
+def test_unregistered_and_removed_items_are_skipped(scheduler):
+    first, second = make_character("First"), make_character("Second")
+    kept = first.inventory.add_item(WONDROUS_ITEMS["Boots of Speed"])
+    sold = second.inventory.add_item(WONDROUS_ITEMS["Boots of Speed"])
+    scheduler.register_character(first)
+    scheduler.register_character(second)
+    kept.use_charge(3)
+    sold.use_charge(3)
+    second.inventory.remove_item(sold)
+
+    report = scheduler.advance(24)
+    assert [item for item, _ in report.charges] == [kept]
+    scheduler.unregister_character(first)
+    kept.use_charge(kept.charges)
+    assert scheduler.advance(24).charges == []
+
+def test_short_rest_spends_hit_dice_and_recharges(scheduler):
+    character = make_character()
+    pearl = character.inventory.add_item(PEARL)
+    scheduler.register_character(character)
+    pearl.use_charge(2)
+
+    report = scheduler.short_rest([character], hit_dice=2)
+    assert pearl.charges == 2
+    healed = report.hit_points[0][1]
+    assert 2 * (1 + 2) <= healed <= 2 * (10 + 2)
+    assert character.vitals.hit_points == 10 + healed
+    assert character.progression.hit_dice_remaining == 2
+
+    # Only the dice left can be spent
+    scheduler.short_rest([character], hit_dice=5)
+    assert character.progression.hit_dice_remaining == 0
+
+def test_long_rest_restores_the_party(scheduler):
+    party = [make_character("Fighter", level=5), make_character("Wizard", level=1)]
+    events = []
+    for character in party:
+        scheduler.register_character(character)
+        character.add_listener(lambda event, payload: events.append(event))
+        character.spend_spell_slot(1)
+        character.progression.hit_dice_used = character.progression.level
+
+    report = scheduler.long_rest(party)
+    assert all(character.vitals.hit_points == 30 for character in party)
+    assert [count for _, count in report.hit_dice] == [2, 1]
+    assert all(character.spell_slots == {1: 4, 2: 2} for character in party)
+    assert events.count("spell_slots_restored") == 2
+
+def test_rest_only_touches_the_given_characters(scheduler):
+    resting, away = make_character("Resting"), make_character("Away")
+    for character in (resting, away):
+        scheduler.register_item(character, character.inventory.add_item(PEARL)).item.use_charge(2)
+
+    scheduler.short_rest([resting])
+    assert resting.inventory.items[0].charges == 2
+    assert away.inventory.items[0].charges == 0
+
+def test_explicit_trigger(scheduler):
+    character = make_character()
+    boots = character.inventory.add_item(WONDROUS_ITEMS["Boots of Speed"])
+    entry = scheduler.register_item(character, boots, RestTrigger.LONG_REST)
+    assert entry.trigger == RestTrigger.LONG_REST
+    boots.use_charge(3)
+
+    assert scheduler.advance(24).charges == []
+    scheduler.long_rest([character])
+    assert boots.charges >= 1
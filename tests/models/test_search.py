@@ -0,0 +1,97 @@
+"""
+Tests for equipment name search
+"""
+import os
+import random
+import string
+import time
+import pytest
+from src.models.equipment.base import Equipment
+from src.models.equipment.search import (SUGGESTION_LIMIT, NameSearchIndex, edit_distance,
+                                         get_default_search_index)
+
+@pytest.fixture
+def index():
+    return NameSearchIndex(get_default_search_index().get(name) for name in
+                           ("Dagger", "Dagger +2", "Longsword", "Longsword +1", "Longbow", "Flame Tongue"))
+
+def test_prefix_completion_ranks_shorter_names_first(index):
+    assert index.complete("long") == ["Longbow", "Longsword", "Longsword +1"]
+    assert index.complete("DAG") == ["Dagger", "Dagger +2"]
+    assert index.complete("zzz") == []
+
+def test_completion_matches_later_words(index):
+    assert index.complete("tong") == ["Flame Tongue"]
+
+def test_typo_tolerant_search(index):
+    assert index.search("longswrod")[:2] == ["Longsword", "Longsword +1"]
+    assert index.search("flame tounge") == ["Flame Tongue"]
+    assert index.search("qwertyuiop") == []
+
+def test_edit_distance():
+    assert edit_distance("longswrod", "longsword", 2) == 1
+    assert edit_distance("kitten", "sitting", 5) == 3
+    assert edit_distance("abc", "abcdefgh", 2) == 3
+
+def test_homebrew_add_and_remove(index):
+    index.add_homebrew(Equipment(name="Longstaff of Ages", weight=4.0))
+    assert "Longstaff of Ages" in index.complete("longs")
+    assert index.homebrew == {"Longstaff of Ages"}
+
+    index.remove("Longsword")
+    assert index.complete("longs") == ["Longsword +1", "Longstaff of Ages"]
+    index.remove("Longstaff of Ages")
+    assert index.complete("longst") == []
+    assert index.search("longswrod") == ["Longsword +1"]
+
+@pytest.fixture(scope="module")
+def large_index():
+    """Index of 10,000 made-up names, the names, and the words they were built from"""
+    rng = random.Random(7)
+    words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 9))) for _ in range(3000)]
+    index = NameSearchIndex()
+    names, used = set(), []
+    while len(index) < 10000:
+        chosen = rng.sample(words, rng.randint(1, 3))
+        name = " ".join(chosen).title()
+        names.add(name)
+        index.add(Equipment(name=name))
+        used.extend(chosen)
+    return index, names, used
+
+def test_large_catalog_results_match_a_full_scan(large_index):
+    index, all_names, used = large_index
+    rank = lambda name: (len(name), name.lower())  # Shorter names first
+    names_by_key = {}
+    for name in all_names:
+        for key in {name.lower(), *name.lower().split()}:
+            names_by_key.setdefault(key, set()).add(name)
+
+    for prefix in {word[:n] for word in used[:20] for n in (1, 3, 5)}:
+        expected = {name for key, names in names_by_key.items() if key.startswith(prefix) for name in names}
+        assert index.complete(prefix) == sorted(expected, key=rank)[:SUGGESTION_LIMIT]
+
+    for word in used[:20]:
+        typo = word[:2] + word[3] + word[2] + word[4:]  # Transposed letters
+        limit = max(1, len(typo) // 4)
+        best = {}
+        for key, names in names_by_key.items():
+            if abs(len(key) - len(typo)) > limit:
+                continue  # Too long or short to be within the limit
+            distance = edit_distance(typo, key, limit)
+            if distance <= limit:
+                for name in names:
+                    best[name] = min(best.get(name, (limit + 1,)), (distance, rank(name)))
+        assert index.fuzzy(typo) == sorted(best, key=best.get)[:SUGGESTION_LIMIT]
+        assert any(word in name.lower().split() for name in index.search(typo))
+
+@pytest.mark.skipif(not os.environ.get("RUN_BENCHMARKS"), reason="benchmark; set RUN_BENCHMARKS=1 to run")
+def test_large_catalog_lookup_is_fast(large_index):
+    index, _, used = large_index
+    queries = [word[:n] for word in used[:50] for n in (1, 3, 5)]
+    queries += [word[:2] + word[3] + word[2] + word[4:] for word in used[:50]]  # Transposed letters
+    start = time.perf_counter()
+    for query in queries:
+        assert index.search(query)
+    average = (time.perf_counter() - start) / len(queries)
+    assert average < 0.001  # Type-ahead needs every keystroke answered within a millisecond
@@ -0,0 +1,90 @@
+"""
+Tests for thread-safe shared inventories
+"""
+import random
+import threading
+import pytest
+from src.models.equipment.shared import SharedInventory, transfer_items
+from src.models.equipment.magic_items import WONDROUS_ITEMS
+from src.models.equipment.weapons import SIMPLE_MELEE_WEAPONS
+
+THREADS = 8
+ROUNDS = 400
+
+def run_threads(target):
+    threads = [threading.Thread(target=target, args=(number,)) for number in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+def test_concurrent_adds_do_not_double_stack():
+    stash = SharedInventory(name="Party stash")
+    weapons = list(SIMPLE_MELEE_WEAPONS.values())[:4]
+
+    def player(number):
+        for i in range(ROUNDS):
+            stash.add_item(weapons[(number + i) % len(weapons)])
+
+    run_threads(player)
+    snapshot = stash.snapshot()
+    assert len(snapshot) == len(weapons)
+    assert sum(quantity for _, _, quantity in snapshot) == THREADS * ROUNDS
+    assert stash.calculate_total_weight() == sum(
+        item.total_weight for item in stash.inventory.items)
+
+def test_transfers_conserve_items():
+    """Random transfers between inventories never lose or duplicate daggers"""
+    dagger = SIMPLE_MELEE_WEAPONS["Dagger"]
+    inventories = [SharedInventory(name=f"Player {i}") for i in range(4)]
+    for shared in inventories:
+        shared.add_item(dagger, 100)
+
+    def player(number):
+        rng = random.Random(number)
+        for _ in range(ROUNDS):
+            source, destination = rng.sample(inventories, 2)
+            with source.locked() as inventory:
+                stacks = inventory.find_items("Dagger")
+            if not stacks:
+                continue
+            try:
+                transfer_items([(source, stacks[0], destination, rng.randint(1, 3))])
+            except ValueError:
+                pass  # Another player emptied or moved the stack first
+
+    run_threads(player)
+    total = sum(item.quantity for shared in inventories for item in shared.inventory.items)
+    assert total == 400
+    for shared in inventories:
+        assert len(shared.inventory.find_items("Dagger")) <= 1
+
+def test_failed_transfer_changes_nothing():
+    alice, bob = SharedInventory(name="Alice"), SharedInventory(name="Bob")
+    daggers = alice.add_item(SIMPLE_MELEE_WEAPONS["Dagger"], 2)
+    boots = alice.add_item(WONDROUS_ITEMS["Boots of Speed"])
+
+    with pytest.raises(ValueError):
+        transfer_items([(alice, boots, bob, None), (alice, daggers, bob, 3)])
+    assert bob.snapshot() == []
+    assert daggers.quantity == 2
+
+def test_transfer_keeps_charges():
+    alice, bob = SharedInventory(name="Alice"), SharedInventory(name="Bob")
+    boots = alice.add_item(WONDROUS_ITEMS["Boots of Speed"])
+    boots.use_charge(2)
+
+    [received] = transfer_items([(alice, boots, bob, None)])
+    assert received.charges == 1
+    assert alice.snapshot() == []
+
+def test_charged_items_do_not_merge():
+    alice, bob = SharedInventory(name="Alice"), SharedInventory(name="Bob")
+    used = alice.add_item(WONDROUS_ITEMS["Boots of Speed"])
+    used.use_charge(3)
+    fresh = bob.add_item(WONDROUS_ITEMS["Boots of Speed"])
+
+    [received] = transfer_items([(alice, used, bob, None)])
+    assert received is not fresh
+    assert (received.charges, fresh.charges) == (0, 3)
+    assert sorted(item.charges for item in bob.inventory.items) == [0, 3]
@@ -0,0 +1,107 @@
+"""
+Tests for spell slot tables and tracking
+"""
+import random
+import pytest
+from src.data.serializers import CharacterSerializer
+from src.models.character.base import Character, CharacterProgression
+from src.models.character.rest import RestScheduler
+from src.models.spells.slots import (CLASS_SLOT_TABLES, PACT_TABLE, SLOT_TABLE, CasterType,
+                                     SpellSlots, caster_level, restore_roster)
+
+def test_precomputed_tables():
+    assert SLOT_TABLE[0] == (0,) * 10
+    assert SLOT_TABLE[5][1:4] == (4, 3, 2)
+    assert SLOT_TABLE[20][1:] == (4, 3, 3, 3, 3, 2, 2, 1, 1)
+    # Paladin 5 casts like a 3rd-level wizard; eldritch knight 13 like a 5th-level one
+    assert CLASS_SLOT_TABLES[CasterType.HALF][1] == SLOT_TABLE[0]
+    assert CLASS_SLOT_TABLES[CasterType.HALF][5] == SLOT_TABLE[3]
+    assert CLASS_SLOT_TABLES[CasterType.THIRD][13] == SLOT_TABLE[5]
+    assert CLASS_SLOT_TABLES[CasterType.HALF_ROUNDED_UP][1] == SLOT_TABLE[1]
+    assert PACT_TABLE[5] == (2, 3) and PACT_TABLE[20] == (4, 5)
+
+@pytest.mark.parametrize("classes, expected", [
+    ({"Wizard": 5}, 5),
+    ({"Paladin": 5}, 3),
+    ({"Paladin": 5, "Sorcerer": 3}, 5),  # Half levels round down when multiclassing
+    ({"Eldritch Knight": 7, "Wizard": 2}, 4),
+    ({"Fighter": 5, "Warlock": 3}, 0),  # Pact magic is separate
+])
+def test_multiclass_caster_level(classes, expected):
+    assert caster_level(classes) == expected
+
+def test_spend_and_restore():
+    slots = SpellSlots.for_classes({"Wizard": 3})
+    assert slots.as_dict() == {1: 4, 2: 2}
+    assert slots.spend(2) and slots.spend(2)
+    assert not slots.spend(2)
+    assert not slots.spend(3)
+    assert slots.restore(2, 5) == 2
+    assert slots.remaining(2) == 2
+
+def test_pact_slots_return_on_short_rest():
+    slots = SpellSlots.for_classes({"Wizard": 3, "Warlock": 3})
+    assert slots.as_dict() == {1: 4, 2: 4}
+    for _ in range(3):
+        assert slots.spend(2)
+    assert slots.pact_used == 2 and slots.remaining(2) == 1
+    slots.short_rest()
+    assert slots.remaining(2) == 3
+
+def test_load_remaining():
+    slots = SpellSlots.for_classes({"Warlock": 5})
+    slots.load_remaining({3: 1})
+    assert slots.pact_used == 1
+    slots.long_rest()
+    assert slots.as_dict() == {3: 2}
+
+def test_character_slots_follow_class_levels():
+    wizard = Character(name="Elara", character_class="Wizard", progression=CharacterProgression(level=3))
+    assert wizard.spell_slots == {1: 4, 2: 2}
+    assert wizard.spend_spell_slot(2)
+    assert wizard.spell_slots == {1: 4, 2: 1}
+
+    wizard.progression.level = 5
+    wizard.refresh_spell_slots()
+    assert wizard.spell_slots == {1: 4, 2: 2, 3: 2}  # The spent slot stays spent
+
+    multiclass = Character(name="Vex", class_levels={"Paladin": 4, "Warlock": 2})
+    assert multiclass.spell_slots == {1: 5}
+
+    manual = Character(name="Hero", character_class="Homebrew Mystic", spell_slots={1: 2})
+    assert manual.spend_spell_slot(1) and not manual.spend_spell_slot(2)
+    assert manual.spell_slots == {1: 1}
+
+def test_hand_entered_maximums_survive_a_reload():
+    fighter = Character(name="Brom", character_class="Fighter", spell_slots={1: 3})
+    assert fighter.spend_spell_slot(1)
+
+    data = CharacterSerializer.to_dict(fighter)
+    assert data["spell_slots"] == {1: 2} and data["spell_slot_maximums"] == {1: 3}
+    reloaded = CharacterSerializer.from_dict(data)
+    assert reloaded.spell_slots == {1: 2}
+    reloaded.slot_tracker.long_rest()
+    reloaded.sync_spell_slots()
+    assert reloaded.spell_slots == {1: 3}
+
+    # Sheets saved before maximums were stored keep their slots as maximums
+    del data["spell_slot_maximums"]
+    assert CharacterSerializer.from_dict(data).slot_tracker.total(1) == 2
+
+def test_roster_rests():
+    roster = [Character(name=f"Mage {n}", character_class="Wizard", progression=CharacterProgression(level=n))
+              for n in range(1, 21)]
+    warlock = Character(name="Hex", character_class="Warlock", progression=CharacterProgression(level=5))
+    for character in roster:
+        character.spend_spell_slot(1)
+    warlock.spend_spell_slot(3)
+
+    restore_roster(character.slot_tracker for character in roster[:2])
+    assert roster[0].slot_tracker.remaining(1) == 2
+
+    scheduler = RestScheduler(rng=random.Random(3))
+    scheduler.short_rest([warlock])
+    assert warlock.spell_slots == {3: 2}
+    report = scheduler.long_rest(roster)
+    assert all(character.spell_slots[1] == 4 for character in roster[2:])
+    assert len(report.spell_slots) == 18
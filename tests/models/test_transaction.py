@@ -0,0 +1,132 @@
+"""
+Tests for atomic inventory transactions
+"""
+import pytest
+from src.models.equipment.armor import HEAVY_ARMOR, LIGHT_ARMOR
+from src.models.equipment.inventory import Currency, EquipmentSlot, Inventory
+from src.models.equipment.magic_items import WONDROUS_ITEMS
+from src.models.equipment.transaction import InventoryTransaction, TransactionError
+from src.models.equipment.weapons import MARTIAL_MELEE_WEAPONS, SIMPLE_MELEE_WEAPONS
+
+@pytest.fixture
+def inventory():
+    inventory = Inventory(currency=Currency(gold=20))
+    club = inventory.add_item(SIMPLE_MELEE_WEAPONS["Club"])
+    inventory.equip_item(club)
+    inventory.add_item(SIMPLE_MELEE_WEAPONS["Dagger"], 3)
+    return inventory
+
+def state(inventory):
+    return (
+        [(item.item_id, item.quantity, item.equipped_slot, item.attuned, item.container_id)
+         for item in inventory.items],
+        dict(inventory.equipped_items),
+        inventory.currency.total_copper_value,
+        inventory.calculate_total_weight(),
+    )
+
+def test_purchase_commits_with_one_event(inventory):
+    events = []
+    inventory.add_listener(lambda event, payload: events.append((event, payload)))
+    club = inventory.equipped_items[EquipmentSlot.MAIN_HAND]
+
+    with InventoryTransaction(inventory) as trade:
+        trade.remove(club)
+        trade.spend(1500)
+        sword = trade.add(MARTIAL_MELEE_WEAPONS["Longsword"])
+        trade.equip(sword, EquipmentSlot.MAIN_HAND)
+
+    assert inventory.get_equipped_weapon().name == "Longsword"
+    assert club not in inventory.items
+    assert inventory.currency.total_copper_value == 500
+    assert [event for event, _ in events] == ["transaction_committed"]
+    assert [step for step, _ in events[0][1]["events"]] == [
+        "item_unequipped", "item_removed", "item_added", "item_equipped", "currency_changed"]
+
+def test_failure_rolls_back_everything(inventory):
+    before = state(inventory)
+    events = []
+    inventory.add_listener(lambda event, payload: events.append(event))
+    club = inventory.equipped_items[EquipmentSlot.MAIN_HAND]
+
+    trade = InventoryTransaction(inventory)
+    trade.remove(club)
+    trade.add(HEAVY_ARMOR["Plate"])
+    trade.attune(club)  # Removed earlier in the transaction, so this fails
+    with pytest.raises(TransactionError):
+        trade.commit()
+
+    assert state(inventory) == before
+    assert inventory.equipped_items[EquipmentSlot.MAIN_HAND] is club
+    assert events == []
+
+def test_validation_before_applying(inventory):
+    daggers = inventory.find_items("Dagger")[0]
+    trade = InventoryTransaction(inventory)
+    trade.remove(daggers, 2)
+    trade.remove(daggers, 2)
+    trade.spend(5000)
+
+    assert trade.validate() == ["Not enough Dagger", "Cannot afford 5000 cp"]
+
+def test_removing_staged_item_keeps_existing_stack(inventory):
+    daggers = inventory.find_items("Dagger")[0]
+    with InventoryTransaction(inventory) as trade:
+        staged = trade.add(SIMPLE_MELEE_WEAPONS["Dagger"], 2)
+        trade.remove(staged)
+    assert daggers.quantity == 3
+
+    trade = InventoryTransaction(inventory)
+    staged = trade.add(SIMPLE_MELEE_WEAPONS["Dagger"], 2)
+    trade.remove(staged, 3)
+    assert trade.validate() == ["Not enough Dagger"]
+
+def test_quantities_must_be_positive(inventory):
+    daggers = inventory.find_items("Dagger")[0]
+    trade = InventoryTransaction(inventory)
+    with pytest.raises(ValueError):
+        trade.remove(daggers, -2)
+    with pytest.raises(ValueError):
+        trade.add(SIMPLE_MELEE_WEAPONS["Dagger"], -5)
+    with pytest.raises(ValueError):
+        trade.add(SIMPLE_MELEE_WEAPONS["Dagger"], 0)
+
+    with pytest.raises(ValueError):
+        trade.spend(-500)
+    with pytest.raises(ValueError):
+        trade.receive(0)
+
+    staged = trade.add(SIMPLE_MELEE_WEAPONS["Dagger"])
+    staged.quantity = -1  # Changed after staging
+    assert trade.validate() == ["Cannot add -1 x Dagger"]
+    assert daggers.quantity == 3
+
+def test_capacity_checked_on_final_state(inventory):
+    before = state(inventory)
+    trade = InventoryTransaction(inventory, strength_score=3)  # 45 lb capacity
+    trade.add(HEAVY_ARMOR["Plate"])
+    with pytest.raises(TransactionError, match="carrying capacity"):
+        trade.commit()
+    assert state(inventory) == before
+
+    # Already overloaded: trading down is allowed even if still over capacity
+    plate = inventory.add_item(HEAVY_ARMOR["Plate"])
+    with InventoryTransaction(inventory, strength_score=3) as swap:
+        swap.remove(plate)
+        swap.add(HEAVY_ARMOR["Chain mail"])
+    assert inventory.find_items("Chain mail") and not inventory.find_items("Plate")
+
+def test_undo_restores_displaced_and_attuned_items():
+    inventory = Inventory()
+    cloak = inventory.add_item(WONDROUS_ITEMS["Cloak of Elvenkind"])
+    leather = inventory.add_item(LIGHT_ARMOR["Leather"])
+    inventory.equip_item(leather)
+    inventory.attune_item(cloak)
+    before = state(inventory)
+
+    trade = InventoryTransaction(inventory)
+    trade.equip(trade.add(HEAVY_ARMOR["Plate"]))
+    trade.remove(cloak, 5)
+    with pytest.raises(TransactionError):
+        trade.commit()
+    assert state(inventory) == before
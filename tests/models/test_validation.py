@@ -0,0 +1,110 @@
+"""
+Tests for the rules validation engine
+"""
+import pytest
+from src.models.character.base import Character, AbilityScores
+from src.models.character.validation import (
+    validate_roster, validate_character, RosterColumns, Severity
+)
+from src.models.equipment.armor import HEAVY_ARMOR, SHIELDS
+from src.models.equipment.inventory import EquipmentSlot
+from src.models.equipment.weapons import MARTIAL_MELEE_WEAPONS
+from src.models.equipment.magic_items import WondrousItem
+
+def make_character(name="Valid", **abilities):
+    return Character(name=name, ability_scores=AbilityScores(**abilities))
+
+class TestCharacterChecks:
+    """Test individual rules"""
+
+    def test_valid_character(self):
+        """Test that a default character has no issues"""
+        assert validate_character(make_character()) == []
+
+    def test_ability_score_range(self):
+        """Test ability scores outside the allowed range"""
+        issues = validate_character(make_character(strength=31, charisma=0))
+        assert [issue.code for issue in issues] == ["ability_score", "ability_score"]
+
+    def test_level_and_hit_points(self):
+        """Test level and hit point limits"""
+        character = make_character()
+        character.progression.level = 21
+        character.vitals.hit_points = 12
+        character.vitals.max_hit_points = 10
+
+        codes = {issue.code for issue in validate_character(character)}
+        assert codes == {"level", "hit_points"}
+
+    def test_attunement_limit(self):
+        """Test that more than three attuned items is an error"""
+        character = make_character()
+        for i in range(4):
+            item = character.inventory.add_item(WondrousItem(name=f"Trinket {i}", requires_attunement=True))
+            item.attuned = True
+
+        issues = validate_character(character)
+        assert [issue.code for issue in issues] == ["attunement"]
+
+    def test_armor_strength_is_warning(self):
+        """Test that armor strength requirements produce a warning"""
+        character = make_character(strength=10)
+        item = character.inventory.add_item(HEAVY_ARMOR["Plate"])
+        character.inventory.equip_item(item)
+
+        report = validate_roster([character])
+        assert report.is_valid
+        assert [issue.code for issue in report.warnings] == ["armor_strength"]
+        assert report.warnings[0].severity == Severity.WARNING
+
+    def test_equipment_slot_consistency(self):
+        """Test inconsistent equipped slots"""
+        character = make_character(strength=16)
+        inventory = character.inventory
+        sword = inventory.add_item(MARTIAL_MELEE_WEAPONS["Greatsword"])
+        shield = inventory.add_item(SHIELDS["Shield"])
+        inventory.equip_item(sword)
+        inventory.equip_item(shield)
+        assert shield.equipped_slot == EquipmentSlot.SHIELD
+
+        # Corrupt the bookkeeping the way a bad import would
+        inventory.equipped_items[EquipmentSlot.ARMOR] = sword
+
+        messages = [issue.message for issue in validate_character(character)]
+        assert any("not marked as equipped" in message for message in messages)
+        assert any("cannot be worn in the armor slot" in message for message in messages)
+        assert any("two-handed" in message for message in messages)
+
+class TestRosterValidation:
+    """Test bulk validation"""
+
+    def build_roster(self, size):
+        roster = []
+        for i in range(size):
+            character = make_character(name=f"Hero {i}")
+            if i % 3 == 0:
+                character.progression.level = 0
+            roster.append(character)
+        return roster
+
+    def test_columns(self):
+        """Test columnar flattening and slicing"""
+        columns = RosterColumns.from_characters(self.build_roster(5))
+        assert len(columns) == 5
+        assert columns.slice(1, 3).names == ["Hero 1", "Hero 2"]
+
+    def test_report_structure(self):
+        """Test the structured report"""
+        report = validate_roster(self.build_roster(4))
+        assert report.checked == 4
+        assert not report.is_valid
+        assert sorted(report.by_character()) == [0, 3]
+        assert report.to_dict()["issues"][0]["severity"] == "error"
+
+    def test_sharded_matches_serial(self):
+        """Test that process pool validation matches in-process validation"""
+        roster = self.build_roster(50)
+        serial = validate_roster(roster)
+        sharded = validate_roster(roster, workers=2, shard_size=7)
+
+        assert [issue.to_dict() for issue in sharded.issues] == [issue.to_dict() for issue in serial.issues]